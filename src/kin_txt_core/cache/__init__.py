@@ -1,3 +1,20 @@
 from .redis_cache import RedisCache
 from .interfaces import AbstractCache
-from .async_redis import AsyncRedisCache
+from .predictions import (
+    AbstractPredictionCache,
+    InMemoryPredictionCache,
+    RedisPredictionCache,
+    TieredPredictionCache,
+)
+from .aggregates import AbstractAggregatesStore, FileSystemAggregatesStore
+from .messages import AbstractMessagesStore, FileSystemMessagesStore
+
+
+def __getattr__(name: str):
+    # aioredis fails to import on Python 3.11+, so it is not required by the users of the other caches
+    if name == "AsyncRedisCache":
+        from .async_redis import AsyncRedisCache
+
+        return AsyncRedisCache
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
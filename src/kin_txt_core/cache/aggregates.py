@@ -0,0 +1,68 @@
+import os
+import pickle
+import hashlib
+import logging
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any
+
+__all__ = [
+    "AbstractAggregatesStore",
+    "FileSystemAggregatesStore",
+]
+
+
+class AbstractAggregatesStore(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+class FileSystemAggregatesStore(AbstractAggregatesStore):
+    # values are replaced atomically, so the store can be shared between processes
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, key: str) -> Any | None:
+        try:
+            with open(self._get_path(key), "rb") as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as error:
+            self._logger.warning(f"[{self.__class__.__name__}] Failed to load aggregate {key}: {error}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._get_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _get_path(self, key: str) -> str:
+        key_hash = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self._directory, key_hash[:2], f"{key_hash}.pickle")
+
+    @classmethod
+    def from_settings(cls, directory: str | None) -> AbstractAggregatesStore | None:
+        if not directory:
+            return None
+
+        return cls(directory)
@@ -0,0 +1,179 @@
+import os
+import json
+import base64
+import hashlib
+import logging
+import tempfile
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, Iterator
+
+from kin_txt_core.datasources.common.entities import ClassificationEntity
+from kin_txt_core.datasources.common.utils import to_aware_utc
+
+__all__ = [
+    "AbstractMessagesStore",
+    "FileSystemMessagesStore",
+]
+
+
+class AbstractMessagesStore(ABC):
+    # coverage intervals are pairs of aware UTC datetimes, both ends included
+
+    @abstractmethod
+    def get_coverage(self, key: str) -> list[tuple[datetime, datetime]]:
+        pass
+
+    @abstractmethod
+    def add_coverage(self, key: str, start: datetime, end: datetime) -> None:
+        pass
+
+    @abstractmethod
+    def append(self, key: str, posts: Iterable[ClassificationEntity]) -> Iterator[ClassificationEntity]:
+        pass
+
+    @abstractmethod
+    def read(self, key: str, start: datetime, end: datetime) -> Iterator[ClassificationEntity]:
+        # the newest first
+        pass
+
+
+class FileSystemMessagesStore(AbstractMessagesStore):
+    # one append-only NDJSON segment per UTC day, posts written twice are deduplicated while reading
+
+    _COVERAGE_FILE_NAME = "coverage.json"
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+        os.makedirs(directory, exist_ok=True)
+
+    def get_coverage(self, key: str) -> list[tuple[datetime, datetime]]:
+        try:
+            with open(os.path.join(self._get_source_directory(key), self._COVERAGE_FILE_NAME)) as file:
+                return [(datetime.fromisoformat(start), datetime.fromisoformat(end)) for start, end in json.load(file)]
+        except FileNotFoundError:
+            return []
+        except (ValueError, TypeError) as error:
+            self._logger.warning(f"[{self.__class__.__name__}] Failed to load coverage of {key}: {error}")
+            return []
+
+    def add_coverage(self, key: str, start: datetime, end: datetime) -> None:
+        intervals = self._merge_intervals([*self.get_coverage(key), (start, end)])
+
+        source_directory = self._get_source_directory(key)
+        os.makedirs(source_directory, exist_ok=True)
+
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=source_directory)
+
+        try:
+            with os.fdopen(file_descriptor, "w") as file:
+                json.dump([(start.isoformat(), end.isoformat()) for start, end in intervals], file)
+
+            os.replace(tmp_path, os.path.join(source_directory, self._COVERAGE_FILE_NAME))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def append(self, key: str, posts: Iterable[ClassificationEntity]) -> Iterator[ClassificationEntity]:
+        source_directory = self._get_source_directory(key)
+        os.makedirs(source_directory, exist_ok=True)
+
+        # posts come sorted by their dates, so only the segment of the current day is kept open
+        segment_day: date | None = None
+        segment = None
+
+        try:
+            for post in posts:
+                post_day = to_aware_utc(post.created_at).date()
+
+                if post_day != segment_day:
+                    if segment is not None:
+                        segment.close()
+
+                    segment_day = post_day
+                    segment = open(self._get_segment_path(source_directory, post_day), "a")
+
+                segment.write(json.dumps(self._serialize_post(post)) + "\n")
+
+                yield post
+        finally:
+            if segment is not None:
+                segment.close()
+
+    def read(self, key: str, start: datetime, end: datetime) -> Iterator[ClassificationEntity]:
+        source_directory = self._get_source_directory(key)
+
+        day = end.date()
+        while day >= start.date():
+            yield from self._read_segment(self._get_segment_path(source_directory, day), start, end)
+            day -= timedelta(days=1)
+
+    def _read_segment(self, path: str, start: datetime, end: datetime) -> list[ClassificationEntity]:
+        try:
+            with open(path) as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return []
+
+        posts: dict[tuple[str, str | None], ClassificationEntity] = {}
+
+        for line in lines:
+            try:
+                post = self._deserialize_post(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                # a line cut short by a crashed writer
+                continue
+
+            if start <= to_aware_utc(post.created_at) <= end:
+                posts.setdefault((post.created_at.isoformat(), post.text), post)
+
+        return sorted(posts.values(), key=lambda post: to_aware_utc(post.created_at), reverse=True)
+
+    def _get_source_directory(self, key: str) -> str:
+        key_hash = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self._directory, key_hash[:2], key_hash)
+
+    @staticmethod
+    def _get_segment_path(source_directory: str, day: date) -> str:
+        return os.path.join(source_directory, f"{day.isoformat()}.ndjson")
+
+    @staticmethod
+    def _merge_intervals(intervals: list[tuple[datetime, datetime]]) -> list[tuple[datetime, datetime]]:
+        merged: list[tuple[datetime, datetime]] = []
+
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+        return merged
+
+    @staticmethod
+    def _serialize_post(post: ClassificationEntity) -> dict[str, Any]:
+        return {
+            "text": post.text,
+            "created_at": post.created_at.isoformat(),
+            "source_link": post.source_link,
+            "blobs": [base64.b64encode(blob).decode() for blob in post.blobs] if post.blobs is not None else None,
+            "metadata": post.metadata,
+        }
+
+    @staticmethod
+    def _deserialize_post(record: dict[str, Any]) -> ClassificationEntity:
+        return ClassificationEntity(
+            text=record["text"],
+            created_at=datetime.fromisoformat(record["created_at"]),
+            source_link=record["source_link"],
+            blobs=[base64.b64decode(blob) for blob in record["blobs"]] if record["blobs"] is not None else None,
+            metadata=record["metadata"],
+        )
+
+    @classmethod
+    def from_settings(cls, directory: str | None) -> AbstractMessagesStore | None:
+        if not directory:
+            return None
+
+        return cls(directory)
@@ -0,0 +1,152 @@
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from redis import Redis
+
+__all__ = [
+    "AbstractPredictionCache",
+    "InMemoryPredictionCache",
+    "RedisPredictionCache",
+    "TieredPredictionCache",
+]
+
+
+class AbstractPredictionCache(ABC):
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def get_many(self, keys: list[str]) -> list[str | None]:
+        values = self._get_many(keys)
+
+        hits = sum(value is not None for value in values)
+        self.hits += hits
+        self.misses += len(values) - hits
+
+        return values
+
+    @abstractmethod
+    def _get_many(self, keys: list[str]) -> list[str | None]:
+        pass
+
+    @abstractmethod
+    def set_many(self, items: dict[str, str]) -> None:
+        pass
+
+
+class InMemoryPredictionCache(AbstractPredictionCache):
+    def __init__(self, max_size: int) -> None:
+        super().__init__()
+
+        self._max_size = max_size
+        self._data: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_many(self, keys: list[str]) -> list[str | None]:
+        values: list[str | None] = []
+
+        with self._lock:
+            for key in keys:
+                value = self._data.get(key)
+                if value is not None:
+                    self._data.move_to_end(key)
+
+                values.append(value)
+
+        return values
+
+    def set_many(self, items: dict[str, str]) -> None:
+        with self._lock:
+            for key, value in items.items():
+                self._data[key] = value
+                self._data.move_to_end(key)
+
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+
+class RedisPredictionCache(AbstractPredictionCache):
+    def __init__(self, redis_client: Redis, ttl_seconds: int | None = None) -> None:
+        super().__init__()
+
+        self._redis_client = redis_client
+        self._ttl_seconds = ttl_seconds
+
+    def _get_many(self, keys: list[str]) -> list[str | None]:
+        if not keys:
+            return []
+
+        return [value.decode() if value is not None else None for value in self._redis_client.mget(keys)]
+
+    def set_many(self, items: dict[str, str]) -> None:
+        if not items:
+            return
+
+        with self._redis_client.pipeline(transaction=False) as pipeline:
+            for key, value in items.items():
+                pipeline.set(name=key, value=value, ex=self._ttl_seconds)
+
+            pipeline.execute()
+
+    @classmethod
+    def from_url(cls, redis_url: str, ttl_seconds: int | None = None) -> "RedisPredictionCache":
+        return cls(Redis.from_url(redis_url), ttl_seconds=ttl_seconds)
+
+
+class TieredPredictionCache(AbstractPredictionCache):
+    def __init__(self, tiers: list[AbstractPredictionCache]) -> None:
+        super().__init__()
+
+        self._tiers = tiers
+
+    def _get_many(self, keys: list[str]) -> list[str | None]:
+        values: list[str | None] = [None] * len(keys)
+        missing_positions = list(range(len(keys)))
+
+        for tier_index, tier in enumerate(self._tiers):
+            if not missing_positions:
+                break
+
+            tier_values = tier.get_many([keys[position] for position in missing_positions])
+            found = {
+                keys[position]: value
+                for position, value in zip(missing_positions, tier_values)
+                if value is not None
+            }
+
+            for position, value in zip(missing_positions, tier_values):
+                values[position] = value
+
+            for faster_tier in self._tiers[:tier_index]:
+                faster_tier.set_many(found)
+
+            missing_positions = [position for position in missing_positions if values[position] is None]
+
+        return values
+
+    def set_many(self, items: dict[str, str]) -> None:
+        for tier in self._tiers:
+            tier.set_many(items)
+
+    @classmethod
+    def from_settings(
+        cls,
+        max_size: int,
+        redis_url: str | None = None,
+        ttl_seconds: int | None = None,
+    ) -> AbstractPredictionCache | None:
+        tiers: list[AbstractPredictionCache] = []
+
+        if max_size > 0:
+            tiers.append(InMemoryPredictionCache(max_size))
+        if redis_url:
+            tiers.append(RedisPredictionCache.from_url(redis_url, ttl_seconds=ttl_seconds))
+
+        if not tiers:
+            return None
+
+        return cls(tiers)
@@ -1,4 +1,5 @@
 MESSAGES_LIMIT_FOR_ONE_CALL = 1_000_000
+MESSAGES_STREAMING_BATCH_SIZE = 500
 
 JWT_PREFIX = "token"
 KIN_TOKEN_PREFIX = "Kin-Token"
@@ -0,0 +1,191 @@
+import logging
+import dataclasses
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterator
+
+from kin_txt_core.cache.messages import AbstractMessagesStore
+from kin_txt_core.datasources.common.entities import DatasourceLink, ClassificationEntity
+from kin_txt_core.datasources.common.interface import IDataSource
+from kin_txt_core.datasources.common.utils import to_aware_utc
+from kin_txt_core.datasources.constants import DataSourceTypes
+
+Interval = tuple[datetime, datetime]
+
+
+@dataclass
+class _FetchedGap:
+    start: datetime
+    end: datetime
+    oldest_created_at: datetime | None = None
+
+    def get_covered_interval(self, fetched_at: datetime) -> Interval | None:
+        # fetches may be truncated, so only the span of the returned posts is covered
+        start = self.start if self.oldest_created_at is None else self.oldest_created_at
+
+        if start > fetched_at:
+            return None
+
+        return start, min(self.end, fetched_at)
+
+
+class CachingDataSource(IDataSource):
+    # only the parts of the window not covered by `store` are fetched, sources with `params` are not cached
+
+    def __init__(self, datasource: IDataSource, store: AbstractMessagesStore, datasource_type: DataSourceTypes) -> None:
+        self._datasource = datasource
+        self._store = store
+        self._datasource_type = datasource_type
+
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def fetch_data(self, source: DatasourceLink) -> list[ClassificationEntity]:
+        return list(self.iter_data(source))
+
+    def iter_data(self, source: DatasourceLink) -> Iterator[ClassificationEntity]:
+        if not self._is_cacheable(source):
+            yield from self._datasource.iter_data(source)
+            return
+
+        key = self._build_key(source)
+        window = self._get_window(source)
+        coverage = self._store.get_coverage(key)
+
+        for start, end, is_covered in self._split_window(window, coverage):
+            if is_covered:
+                yield from self._store.read(key, start, end)
+                continue
+
+            fetched_at = datetime.now(timezone.utc)
+            gap = _FetchedGap(start, end)
+            gap_posts = self._datasource.iter_data(dataclasses.replace(source, offset_date=end, earliest_date=start))
+
+            yield from self._store.append(key, self._filter_gap_posts(gap_posts, gap, coverage))
+
+            self._add_gap_coverage(key, gap, fetched_at)
+
+    def fetch_data_concurrently(
+        self,
+        sources: list[DatasourceLink],
+        max_concurrency: int,
+    ) -> list[list[ClassificationEntity] | Exception]:
+        gap_sources: list[DatasourceLink] = []
+        gaps_owners: list[int] = []
+
+        for index, source in enumerate(sources):
+            if not self._is_cacheable(source):
+                gap_sources.append(source)
+                gaps_owners.append(index)
+                continue
+
+            for start, end, is_covered in self._split_window(self._get_window(source), self._get_coverage(source)):
+                if not is_covered:
+                    gap_sources.append(dataclasses.replace(source, offset_date=end, earliest_date=start))
+                    gaps_owners.append(index)
+
+        self._logger.info(f"[CachingDataSource] Fetching {len(gap_sources)} uncovered intervals of {len(sources)} sources")
+
+        fetched_at = datetime.now(timezone.utc)
+        gaps_results = self._datasource.fetch_data_concurrently(gap_sources, max_concurrency) if gap_sources else []
+
+        results: list[list[ClassificationEntity] | Exception | None] = [None] * len(sources)
+
+        for index, gap_source, gap_result in zip(gaps_owners, gap_sources, gaps_results):
+            source = sources[index]
+
+            if isinstance(gap_result, Exception):
+                results[index] = gap_result
+            elif not self._is_cacheable(source):
+                results[index] = gap_result
+            else:
+                self._store_gap(source, gap_source, gap_result, fetched_at)
+
+        for index, source in enumerate(sources):
+            if results[index] is None:
+                window_start, window_end = self._get_window(source)
+                results[index] = list(self._store.read(self._build_key(source), window_start, window_end))
+
+        return results
+
+    def is_healthy(self) -> bool:
+        return self._datasource.is_healthy()
+
+    def close(self) -> None:
+        self._datasource.close()
+
+    def _store_gap(
+        self,
+        source: DatasourceLink,
+        gap_source: DatasourceLink,
+        posts: list[ClassificationEntity],
+        fetched_at: datetime,
+    ) -> None:
+        key = self._build_key(source)
+        gap = _FetchedGap(to_aware_utc(gap_source.earliest_date), to_aware_utc(gap_source.offset_date))
+
+        for _ in self._store.append(key, self._filter_gap_posts(posts, gap, self._store.get_coverage(key))):
+            pass
+
+        self._add_gap_coverage(key, gap, fetched_at)
+
+    def _add_gap_coverage(self, key: str, gap: _FetchedGap, fetched_at: datetime) -> None:
+        covered_interval = gap.get_covered_interval(fetched_at)
+
+        if covered_interval is not None:
+            self._store.add_coverage(key, *covered_interval)
+
+    @staticmethod
+    def _filter_gap_posts(
+        posts: Iterator[ClassificationEntity] | list[ClassificationEntity],
+        gap: _FetchedGap,
+        coverage: list[Interval],
+    ) -> Iterator[ClassificationEntity]:
+        # posts on the edges of the covered intervals are served from the store, so they are not repeated
+        for post in posts:
+            created_at = to_aware_utc(post.created_at)
+
+            if not gap.start <= created_at <= gap.end:
+                continue
+
+            if any(covered_start <= created_at <= covered_end for covered_start, covered_end in coverage):
+                continue
+
+            if gap.oldest_created_at is None or created_at < gap.oldest_created_at:
+                gap.oldest_created_at = created_at
+
+            yield post
+
+    @staticmethod
+    def _split_window(window: Interval, coverage: list[Interval]) -> Iterator[tuple[datetime, datetime, bool]]:
+        # the newest first, as datasources yield the posts
+        window_start, window_end = window
+        current_end = window_end
+
+        for covered_start, covered_end in sorted(coverage, reverse=True):
+            if covered_end < window_start or covered_start > current_end:
+                continue
+
+            if covered_end < current_end:
+                yield covered_end, current_end, False
+
+            yield max(covered_start, window_start), min(covered_end, current_end), True
+            current_end = covered_start
+
+            if current_end <= window_start:
+                return
+
+        yield window_start, current_end, False
+
+    def _get_coverage(self, source: DatasourceLink) -> list[Interval]:
+        return self._store.get_coverage(self._build_key(source))
+
+    def _build_key(self, source: DatasourceLink) -> str:
+        return f"{self._datasource_type.value}:{source.source_link}:{int(source.skip_messages_without_text)}"
+
+    @staticmethod
+    def _get_window(source: DatasourceLink) -> Interval:
+        return to_aware_utc(source.earliest_date), to_aware_utc(source.offset_date)
+
+    @staticmethod
+    def _is_cacheable(source: DatasourceLink) -> bool:
+        return not source.params and source.earliest_date is not None and source.offset_date is not None
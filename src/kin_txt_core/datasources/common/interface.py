@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Iterator
 
 from kin_txt_core.datasources.common.entities import ClassificationEntity, DatasourceLink
 
@@ -7,3 +9,32 @@ class IDataSource(ABC):
     @abstractmethod
     def fetch_data(self, source: DatasourceLink) -> list[ClassificationEntity]:
         pass
+
+    def iter_data(self, source: DatasourceLink) -> Iterator[ClassificationEntity]:
+        # datasources able to page through the source override it, so the posts are never all in memory
+        yield from self.fetch_data(source)
+
+    def fetch_data_concurrently(
+        self,
+        sources: list[DatasourceLink],
+        max_concurrency: int,
+    ) -> list[list[ClassificationEntity] | Exception]:
+        # errors are returned in place of the results of the failed sources
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=self.__class__.__name__) as executor:
+            futures = [executor.submit(self.fetch_data, source) for source in sources]
+
+        return [self._get_future_result(future) for future in futures]
+
+    @staticmethod
+    def _get_future_result(future: Future) -> list[ClassificationEntity] | Exception:
+        error = future.exception()
+        if error is not None:
+            return error
+
+        return future.result()
+
+    def is_healthy(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,9 @@
+from datetime import datetime, timezone
+
+
+def to_aware_utc(value: datetime | None) -> datetime | None:
+    # naive datetimes are local, as `datetime.astimezone` treats them
+    if value is None:
+        return None
+
+    return value.astimezone(timezone.utc)
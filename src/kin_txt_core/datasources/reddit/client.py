@@ -1,5 +1,5 @@
-import time
 import logging
+import threading
 from typing import Iterator
 
 import praw
@@ -8,36 +8,49 @@ from praw.models import Submission, Subreddit
 
 from kin_txt_core.datasources.common.entities import DatasourceLink, ClassificationEntity
 from kin_txt_core.datasources.common.interface import IDataSource
+from kin_txt_core.datasources.reddit.rate_limit import TokenBucketRateLimiter
 from kin_txt_core.datasources.settings import RedditSettings
 from kin_txt_core.exceptions import RedditIsUnavailable
 
 
 class RedditDatasource(IDataSource):
-    _single_request_limit = 1000
-
-    def __init__(self, client_id: str, client_secret: str, user_agent: str, settings: RedditSettings) -> None:
+    # praw is not thread-safe, so every thread gets its own client, all of them share the rate limiter
+
+    _page_size = 100  # Reddit returns at most 100 posts per listing request
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        user_agent: str,
+        settings: RedditSettings,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+    ) -> None:
         self._client_id = client_id
         self._client_secret = client_secret
         self._user_agent = user_agent
         self._settings = settings
 
-        self._client = praw.Reddit(
-            client_id=self._client_id,
-            client_secret=self._client_secret,
-            user_agent=self._user_agent,
+        self._rate_limiter = rate_limiter or TokenBucketRateLimiter(
+            rate=settings.requests_per_minute / 60,
+            capacity=settings.rate_limit_burst,
         )
 
+        self._thread_local = threading.local()
+
         self._logger = logging.getLogger(self.__class__.__name__)
 
     def fetch_data(self, source: DatasourceLink) -> list[ClassificationEntity]:
-        self._logger.info(f"[RedditDatasource] Fetching data from {source.source_link}")
+        return list(self.iter_data(source))
 
-        subreddit = self._client.subreddit(source.source_link)
+    def iter_data(self, source: DatasourceLink) -> Iterator[ClassificationEntity]:
+        self._logger.info(f"[RedditDatasource] Fetching data from {source.source_link}")
 
-        posts = []
+        subreddit = self._get_client().subreddit(source.source_link)
 
         try:
-            posts = list(self._get_posts(subreddit, source))
+            for post in self._get_posts(subreddit, source):
+                yield ClassificationEntity.from_reddit_submission(source.source_link, post)
         except RedditAPIException as error:
             self._logger.error(f"[RedditDatasource] Reddit API error happened: {error}")
             if error.error_type == "RATELIMIT":
@@ -50,21 +63,49 @@ class RedditDatasource(IDataSource):
             self._logger.error(f"[RedditDatasource] Error happened: {error}")
             raise
 
-        return [
-            ClassificationEntity.from_reddit_submission(source.source_link, post) for post in posts
-        ]
-
     def _get_posts(self, subreddit: Subreddit, settings: DatasourceLink) -> Iterator[Submission]:
-        for fetched_posts in range(0, self._settings.max_posts_per_request, self._single_request_limit):
-            for post in subreddit.new(limit=self._single_request_limit):
-                if post.created_utc < settings.earliest_date.timestamp():
+        earliest_timestamp = settings.earliest_date.timestamp() if settings.earliest_date else None
+        offset_timestamp = settings.offset_date.timestamp() if settings.offset_date else None
+
+        after = None
+        fetched_posts = 0
+
+        while fetched_posts < self._settings.max_posts_per_request:
+            page = self._get_page(subreddit, after)
+            fetched_posts += len(page)
+
+            for post in page:
+                if earliest_timestamp is not None and post.created_utc < earliest_timestamp:
                     return
-                if post.created_utc > settings.offset_date.timestamp():
+                if offset_timestamp is not None and post.created_utc > offset_timestamp:
                     continue
 
                 yield post
 
-            time.sleep(1)  # Adjust the delay as per Reddit's rate limits
+            if len(page) < self._page_size:
+                return
+
+            after = page[-1].fullname
+
+    def _get_page(self, subreddit: Subreddit, after: str | None) -> list[Submission]:
+        self._rate_limiter.acquire()
+
+        page = list(subreddit.new(limit=self._page_size, params={"after": after} if after else None))
+        self._rate_limiter.update_from_limits(self._get_client().auth.limits)
+
+        return page
+
+    def _get_client(self) -> praw.Reddit:
+        client = getattr(self._thread_local, "client", None)
+
+        if client is None:
+            client = self._thread_local.client = praw.Reddit(
+                client_id=self._client_id,
+                client_secret=self._client_secret,
+                user_agent=self._user_agent,
+            )
+
+        return client
 
     @classmethod
     def from_settings(cls) -> "RedditDatasource":
@@ -0,0 +1,73 @@
+import time
+import threading
+from typing import Any, Mapping
+
+
+class TokenBucketRateLimiter:
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("Rate limiter needs a positive rate and a capacity of at least one request.")
+
+        self._default_rate = rate
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0  # the window is used up until then
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                wait_seconds = self._try_acquire()
+
+            if wait_seconds <= 0:
+                return
+
+            time.sleep(wait_seconds)
+
+    def update_from_limits(self, limits: Mapping[str, Any]) -> None:
+        # `limits` as `praw.Reddit.auth.limits` exposes them
+        remaining = limits.get("remaining")
+        reset_timestamp = limits.get("reset_timestamp")
+
+        if remaining is None or reset_timestamp is None:
+            return
+
+        seconds_to_reset = max(reset_timestamp - time.time(), 1.0)
+
+        with self._lock:
+            self._refill()
+
+            if remaining < 1:
+                self._tokens = 0.0
+                self._rate = self._default_rate
+                self._blocked_until = time.monotonic() + seconds_to_reset
+                return
+
+            self._rate = remaining / seconds_to_reset
+            self._tokens = min(self._tokens, remaining)
+
+    def _try_acquire(self) -> float:
+        now = time.monotonic()
+
+        if now < self._blocked_until:
+            return self._blocked_until - now
+
+        self._refill()
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+
+        return (1 - self._tokens) / self._rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        refill_since = max(self._updated_at, self._blocked_until)
+
+        if now > refill_since:
+            self._tokens = min(self._capacity, self._tokens + (now - refill_since) * self._rate)
+
+        self._updated_at = now
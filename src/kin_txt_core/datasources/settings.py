@@ -6,6 +6,11 @@ class TelegramSettings(BaseSettings):
     api_id: int = Field(..., validation_alias="TELEGRAM_API_ID")
     api_hash: str = Field(..., validation_alias="TELEGRAM_API_HASH")
     session_string: str = Field(..., validation_alias="TELEGRAM_SESSION_STRING")
+    extra_session_strings: list[str] = Field([], validation_alias="TELEGRAM_EXTRA_SESSION_STRINGS")
+    flood_wait_budget: int = Field(60, validation_alias="TELEGRAM_FLOOD_WAIT_BUDGET")
+
+    page_size: int = Field(100, validation_alias="TELEGRAM_PAGE_SIZE")
+    request_interval: float = Field(0.0, validation_alias="TELEGRAM_REQUEST_INTERVAL")
 
 
 class RedditSettings(BaseSettings):
@@ -14,3 +19,5 @@ class RedditSettings(BaseSettings):
     user_agent: str = Field(..., validation_alias="REDDIT_USER_AGENT")
 
     max_posts_per_request: int = Field(20_000, validation_alias="REDDIT_MAX_POSTS_PER_REQUEST")
+    requests_per_minute: int = Field(100, validation_alias="REDDIT_REQUESTS_PER_MINUTE")
+    rate_limit_burst: int = Field(10, validation_alias="REDDIT_RATE_LIMIT_BURST")
@@ -1,2 +1,3 @@
 from .client import TelegramDatasource
+from .pool import TelegramSessionPool
 from .entities import TelegramChannelEntity
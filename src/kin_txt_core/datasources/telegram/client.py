@@ -1,7 +1,9 @@
+import time
 import asyncio
 import logging
+from contextlib import aclosing, asynccontextmanager, contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Iterator, Optional
 
 from telethon import TelegramClient
 from telethon.errors import FloodWaitError, UsernameInvalidError
@@ -11,34 +13,74 @@ from telethon import functions
 
 from kin_txt_core.datasources.common.entities import DatasourceLink, ClassificationEntity
 from kin_txt_core.datasources.common.interface import IDataSource
+from kin_txt_core.datasources.common.utils import to_aware_utc
 from kin_txt_core.datasources.settings import TelegramSettings
 from kin_txt_core.exceptions import InvalidChannelURLError, TelegramIsUnavailable
-from kin_txt_core.datasources.telegram.entities import TelegramChannelEntity
-from kin_txt_core.constants import MESSAGES_LIMIT_FOR_ONE_CALL
-from kin_txt_core.datasources.telegram.retry import retry_connection_async, retry_connection_sync
+from kin_txt_core.datasources.telegram.entities import TelegramChannelEntity, ChannelFetchMetrics
+from kin_txt_core.constants import MESSAGES_LIMIT_FOR_ONE_CALL, MESSAGES_STREAMING_BATCH_SIZE
+from kin_txt_core.datasources.telegram.retry import (
+    retry_connection_async,
+    retry_connection_async_gen,
+    retry_connection_sync,
+)
 
 logging.getLogger("telethon").setLevel(logging.ERROR)
 
 
 class TelegramDatasource(IDataSource):
-    def __init__(self, session_str: str, api_id: int, api_hash: str) -> None:
+    # with `keep_alive` the client stays connected on the same event loop until `close`
+
+    _MAX_PAGE_SIZE = 100  # GetHistory returns at most 100 messages per request
+    _MAX_RECONNECTS = 1  # in a row, without a batch fetched in between
+
+    def __init__(
+        self,
+        session_str: str,
+        api_id: int,
+        api_hash: str,
+        keep_alive: bool = False,
+        page_size: int = _MAX_PAGE_SIZE,
+        request_interval: float = 0.0,
+    ) -> None:
+        if not 0 < page_size <= self._MAX_PAGE_SIZE:
+            raise ValueError(f"Telegram page size must be between 1 and {self._MAX_PAGE_SIZE}.")
+
         self._session_obj = StringSession(session_str)
         self._api_id = api_id
         self._api_hash = api_hash
+        self._keep_alive = keep_alive
+        self._page_size = page_size
+        self._request_interval = request_interval
+
+        self.fetch_metrics: dict[str, ChannelFetchMetrics] = {}  # metrics of the last fetch of every channel
 
         self._client = None
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._logger = logging.getLogger(self.__class__.__name__)
 
     def fetch_data(self, source: DatasourceLink) -> list[ClassificationEntity]:
         messages: list[ClassificationEntity] = self.fetch_posts_from_channel(
             source.source_link,
-            offset_date=source.offset_date,
-            earliest_date=source.earliest_date,
-            skip_messages_without_text=source.skip_messages_without_text,
+            **self._get_fetch_options(source),
         )
 
         return messages
 
+    def iter_data(self, source: DatasourceLink) -> Iterator[ClassificationEntity]:
+        return self.iter_posts_from_channel(
+            source.source_link,
+            **self._get_fetch_options(source),
+        )
+
+    @retry_connection_sync
+    def fetch_data_concurrently(
+        self,
+        sources: list[DatasourceLink],
+        max_concurrency: int,
+    ) -> list[list[ClassificationEntity] | Exception]:
+        with self._session():
+            return self._client.loop.run_until_complete(self._fetch_many_async(sources, max_concurrency))
+
     @retry_connection_sync
     def fetch_posts_from_channel(
         self,
@@ -47,28 +89,95 @@ class TelegramDatasource(IDataSource):
         offset_date: Optional[datetime] = None,
         earliest_date: Optional[datetime] = None,
         skip_messages_without_text: bool = False,
+        reverse: bool = False,
+        min_id: int = 0,
     ) -> list[ClassificationEntity]:
-        with self._client:
+        with self._session():
             try:
                 return self._client.loop.run_until_complete(
-                    self.fetch_posts_from_channel_async(
+                    self._fetch_posts_from_channel(
                         channel_name,
                         offset_date=offset_date,
                         earliest_date=earliest_date,
                         skip_messages_without_text=skip_messages_without_text,
+                        reverse=reverse,
+                        min_id=min_id,
                     )
                 )
             except FloodWaitError as error:
                 self._logger.error(f"Telegram flood happened, backoff: {error.seconds}")
                 raise TelegramIsUnavailable("Telegram flooded!", seconds=error.seconds)
 
+    def iter_posts_from_channel(
+        self,
+        channel_name: str,
+        *,
+        offset_date: Optional[datetime] = None,
+        earliest_date: Optional[datetime] = None,
+        skip_messages_without_text: bool = False,
+        reverse: bool = False,
+        min_id: int = 0,
+        batch_size: int = MESSAGES_STREAMING_BATCH_SIZE,
+    ) -> Iterator[ClassificationEntity]:
+        # a lost connection is resumed after the last yielded post
+        if self._client is None or not self._client.is_connected():
+            self._client = self._initialize_client()
+
+        last_created_at: Optional[datetime] = None
+        reconnects_left = self._MAX_RECONNECTS
+
+        while True:
+            loop = self._client.loop
+            batches = self._iter_posts_batches(
+                self._iter_posts_from_channel(
+                    channel_name,
+                    offset_date=last_created_at if last_created_at is not None and not reverse else offset_date,
+                    earliest_date=last_created_at if last_created_at is not None and reverse else earliest_date,
+                    skip_messages_without_text=skip_messages_without_text,
+                    reverse=reverse,
+                    min_id=min_id,
+                ),
+                batch_size=batch_size,
+            )
+
+            try:
+                with self._session():
+                    while True:
+                        try:
+                            batch = loop.run_until_complete(batches.__anext__())
+                        except StopAsyncIteration:
+                            return
+                        except FloodWaitError as error:
+                            self._logger.error(f"Telegram flood happened, backoff: {error.seconds}")
+                            raise TelegramIsUnavailable("Telegram flooded!", seconds=error.seconds)
+
+                        reconnects_left = self._MAX_RECONNECTS
+
+                        for post in batch:
+                            # the resumed stream starts from the last yielded post, so it is not repeated
+                            if last_created_at is not None and not self._is_after(post, last_created_at, reverse):
+                                continue
+
+                            last_created_at = post.created_at
+                            yield post
+            except ConnectionError as error:
+                if not reconnects_left:
+                    raise
+
+                reconnects_left -= 1
+                self._logger.warning(f"[TelegramDatasource] Connection lost while fetching {channel_name}: {error}, reconnecting")
+            finally:
+                loop.run_until_complete(batches.aclose())
+
+            self._client = self._initialize_client()
+
     @retry_connection_sync
     def get_channel(self, channel_link: str) -> TelegramChannelEntity:
         self._logger.info(f"[TelegramDatasource] Getting information for channel: {channel_link}")
 
-        with self._client:
+        with self._session():
             return self._client.loop.run_until_complete(
-                self.get_channel_async(channel_link)
+                self._get_channel(channel_link)
             )
 
     @retry_connection_async
@@ -79,47 +188,226 @@ class TelegramDatasource(IDataSource):
         offset_date: Optional[datetime] = None,
         earliest_date: Optional[datetime] = None,
         skip_messages_without_text: bool = False,
+        reverse: bool = False,
+        min_id: int = 0,
     ) -> list[ClassificationEntity]:
+        async with self._async_session():
+            return await self._fetch_posts_from_channel(
+                channel_name,
+                offset_date=offset_date,
+                earliest_date=earliest_date,
+                skip_messages_without_text=skip_messages_without_text,
+                reverse=reverse,
+                min_id=min_id,
+            )
+
+    @retry_connection_async_gen
+    async def iter_posts_from_channel_async(
+        self,
+        channel_name: str,
+        *,
+        offset_date: Optional[datetime] = None,
+        earliest_date: Optional[datetime] = None,
+        skip_messages_without_text: bool = False,
+        reverse: bool = False,
+        min_id: int = 0,
+    ) -> AsyncIterator[ClassificationEntity]:
+        async with self._async_session():
+            async for post in self._iter_posts_from_channel(
+                channel_name,
+                offset_date=offset_date,
+                earliest_date=earliest_date,
+                skip_messages_without_text=skip_messages_without_text,
+                reverse=reverse,
+                min_id=min_id,
+            ):
+                yield post
+
+    async def _fetch_many_async(
+        self,
+        sources: list[DatasourceLink],
+        max_concurrency: int,
+    ) -> list[list[ClassificationEntity] | Exception]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fetch_source(source: DatasourceLink) -> list[ClassificationEntity]:
+            async with semaphore:
+                try:
+                    return await self._fetch_posts_from_channel(
+                        source.source_link,
+                        **self._get_fetch_options(source),
+                    )
+                except FloodWaitError as error:
+                    self._logger.error(f"Telegram flood happened, backoff: {error.seconds}")
+                    raise TelegramIsUnavailable("Telegram flooded!", seconds=error.seconds)
+
+        return await asyncio.gather(*[_fetch_source(source) for source in sources], return_exceptions=True)
+
+    async def _fetch_posts_from_channel(
+        self,
+        channel_name: str,
+        *,
+        offset_date: Optional[datetime] = None,
+        earliest_date: Optional[datetime] = None,
+        skip_messages_without_text: bool = False,
+        reverse: bool = False,
+        min_id: int = 0,
+    ) -> list[ClassificationEntity]:
+        return [
+            post async for post in self._iter_posts_from_channel(
+                channel_name,
+                offset_date=offset_date,
+                earliest_date=earliest_date,
+                skip_messages_without_text=skip_messages_without_text,
+                reverse=reverse,
+                min_id=min_id,
+            )
+        ]
+
+    async def _iter_posts_from_channel(
+        self,
+        channel_name: str,
+        *,
+        offset_date: Optional[datetime] = None,
+        earliest_date: Optional[datetime] = None,
+        skip_messages_without_text: bool = False,
+        reverse: bool = False,
+        min_id: int = 0,
+    ) -> AsyncIterator[ClassificationEntity]:
+        # expects a connected client, so many channels are fetched within one connection
         self._logger.info(f"[TelegramProxy] Fetching data from {channel_name}")
 
-        channel_entity: TelegramChannelEntity = await self.get_channel_async(channel_name)
-        messages_to_return = []
+        channel_entity: TelegramChannelEntity = await self._get_channel(channel_name)
+
+        # telethon messages dates are aware UTC, so the bounds are normalized once instead of per message
+        offset_date = to_aware_utc(offset_date)
+        earliest_date = to_aware_utc(earliest_date)
+
+        metrics = ChannelFetchMetrics(channel_name)
+        started_at = time.monotonic()
 
         previous_message: Optional[Message] = None
         message: Message
 
-        async with self._client:
-            async for message in self._client.iter_messages(
-                channel_entity.link,
-                offset_date=offset_date,
-                limit=MESSAGES_LIMIT_FOR_ONE_CALL,
-            ):
-                if (
-                    previous_message is not None
-                    and (previous_message.date == message.date or previous_message.text == message.text)
-                ):
-                    continue
+        async with aclosing(self._iter_history_pages(
+            channel_entity.link,
+            offset_date=earliest_date if reverse else offset_date,
+            reverse=reverse,
+            min_id=min_id,
+            metrics=metrics,
+        )) as pages:
+            async for page in pages:
+                for message in page:
+                    if (
+                        previous_message is not None
+                        and (previous_message.date == message.date or previous_message.text == message.text)
+                    ):
+                        continue
+
+                    if skip_messages_without_text and not message.text:
+                        continue
+
+                    if reverse:
+                        if offset_date and message.date > offset_date:
+                            break
+                    elif earliest_date and message.date < earliest_date:
+                        break
+
+                    # the pages after the first one are requested by the id offset, and `min_id` may reach past
+                    # the date offset, so the start of the window is checked on every message
+                    if reverse:
+                        if earliest_date and message.date < earliest_date:
+                            continue
+                    elif offset_date and message.date > offset_date:
+                        continue
 
-                if skip_messages_without_text and not message.text:
+                    previous_message = message
+
+                    yield ClassificationEntity.from_tg_message(channel_name, message)
+                else:
                     continue
 
-                local = datetime.now().tzinfo
-                post_local_date = message.date.astimezone(tz=local)
-                post_local_date = datetime.fromtimestamp(post_local_date.timestamp())
+                # the page reached past the window, so no further pages are requested
+                break
+
+        metrics.elapsed_seconds = time.monotonic() - started_at
+        self.fetch_metrics[channel_name] = metrics
+
+        self._logger.info(
+            f"[TelegramProxy] Fetched {metrics.messages} messages from {channel_name} "
+            f"in {metrics.pages} pages, {metrics.elapsed_seconds:.2f}s"
+        )
+
+    async def _iter_history_pages(
+        self,
+        channel_link: str,
+        *,
+        offset_date: Optional[datetime],
+        reverse: bool,
+        min_id: int,
+        metrics: ChannelFetchMetrics,
+    ) -> AsyncIterator[list[Message]]:
+        offset_id = 0
+        remaining = MESSAGES_LIMIT_FOR_ONE_CALL
+
+        while remaining > 0:
+            if metrics.pages and self._request_interval:
+                await asyncio.sleep(self._request_interval)
+
+            limit = min(self._page_size, remaining)
+            page = await self._client.get_messages(
+                channel_link,
+                limit=limit,
+                offset_date=offset_date,
+                offset_id=offset_id,
+                reverse=reverse,
+                min_id=min_id,
+            )
+
+            metrics.pages += 1
+            metrics.messages += len(page)
+
+            if not page:
+                return
+
+            yield page
 
-                if earliest_date and post_local_date < earliest_date:
-                    break
+            # pages may come short, as Telegram leaves out some messages e.g. hidden due to local laws,
+            # so the history ends only with an empty page, or with a page reaching the lowest message ids
+            if not reverse and page[0].id <= limit:
+                return
 
-                messages_to_return.append(message)
-                previous_message = message
+            remaining -= len(page)
 
-        return [ClassificationEntity.from_tg_message(channel_name, msg) for msg in messages_to_return]
+            # the next page continues after the last message, the id offset replaces the date one
+            offset_id = page[-1].id
+            offset_date = None
+
+    @staticmethod
+    async def _iter_posts_batches(
+        posts: AsyncIterator[ClassificationEntity],
+        batch_size: int,
+    ) -> AsyncIterator[list[ClassificationEntity]]:
+        batch: list[ClassificationEntity] = []
+
+        async for post in posts:
+            batch.append(post)
+
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
 
     @retry_connection_async
     async def get_channel_async(self, channel_link: str) -> TelegramChannelEntity:
+        async with self._async_session():
+            return await self._get_channel(channel_link)
+
+    async def _get_channel(self, channel_link: str) -> TelegramChannelEntity:
         try:
-            async with self._client:
-                channel_full_obj = await self._client(functions.channels.GetFullChannelRequest(channel=channel_link))
+            channel_full_obj = await self._client(functions.channels.GetFullChannelRequest(channel=channel_link))
         except (ValueError, TypeError, UsernameInvalidError) as err:
             self._logger.warning(f"Impossible to find channel for {channel_link}, with {err.__class__.__name__}: {str(err)}")
             raise InvalidChannelURLError(f"Channel link {channel_link} is invalid, or channel with this name does not exists")
@@ -130,17 +418,92 @@ class TelegramDatasource(IDataSource):
             channel_full_obj.full_chat.participants_count,
         )
 
+    def is_healthy(self) -> bool:
+        if self._loop is not None and self._loop.is_closed():
+            return False
+
+        return self._client is None or self._client.is_connected()
+
+    def close(self) -> None:
+        if self._client is not None and self._client.is_connected():
+            self._logger.info("[TelegramDatasource] Disconnecting the session")
+            self._client.disconnect()
+
+        self._client = None
+
+        if self._loop is not None and not self._loop.is_running():
+            self._loop.close()
+            self._loop = None
+
+    async def close_async(self) -> None:
+        if self._client is not None and self._client.is_connected():
+            self._logger.info("[TelegramDatasource] Disconnecting the session")
+            await self._client.disconnect()
+
+        self._client = None
+
+    @contextmanager
+    def _session(self) -> Iterator[TelegramClient]:
+        if not self._keep_alive:
+            with self._client:
+                yield self._client
+            return
+
+        if not self._client.is_connected():
+            self._logger.info("[TelegramDatasource] Connecting the long-lived session")
+            self._client.start()
+
+        yield self._client
+
+    @asynccontextmanager
+    async def _async_session(self) -> AsyncIterator[TelegramClient]:
+        if not self._keep_alive:
+            async with self._client:
+                yield self._client
+            return
+
+        if not self._client.is_connected():
+            self._logger.info("[TelegramDatasource] Connecting the long-lived session")
+            await self._client.start()
+
+        yield self._client
+
     def _initialize_client(self) -> TelegramClient:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # the long-lived session reconnects on the loop it was started on, instead of leaving it behind
+        if not self._keep_alive or self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+
+        asyncio.set_event_loop(self._loop)
 
         return TelegramClient(self._session_obj, self._api_id, self._api_hash)
 
+    @staticmethod
+    def _is_after(post: ClassificationEntity, last_created_at: datetime, reverse: bool) -> bool:
+        if reverse:
+            return post.created_at > last_created_at
+
+        return post.created_at < last_created_at
+
+    @staticmethod
+    def _get_fetch_options(source: DatasourceLink) -> dict[str, Any]:
+        params = source.params or {}
+
+        return {
+            "offset_date": source.offset_date,
+            "earliest_date": source.earliest_date,
+            "skip_messages_without_text": source.skip_messages_without_text,
+            "reverse": params.get("reverse", False),
+            "min_id": params.get("min_id", 0),
+        }
+
     @classmethod
-    def from_settings(cls) -> "TelegramDatasource":
+    def from_settings(cls, keep_alive: bool = False) -> "TelegramDatasource":
         settings = TelegramSettings()
         return cls(
             session_str=settings.session_string,
             api_id=settings.api_id,
             api_hash=settings.api_hash,
+            keep_alive=keep_alive,
+            page_size=settings.page_size,
+            request_interval=settings.request_interval,
         )
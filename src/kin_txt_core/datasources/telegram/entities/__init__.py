@@ -1 +1,2 @@
 from .channel import TelegramChannelEntity
+from .metrics import ChannelFetchMetrics
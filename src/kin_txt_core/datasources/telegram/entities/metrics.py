@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ChannelFetchMetrics:
+    channel: str
+    pages: int = 0
+    messages: int = 0
+    elapsed_seconds: float = 0.0
@@ -0,0 +1,286 @@
+import math
+import time
+import logging
+import threading
+import itertools
+import dataclasses
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Iterator, TypeVar
+
+from kin_txt_core.datasources.common.entities import DatasourceLink, ClassificationEntity
+from kin_txt_core.datasources.common.interface import IDataSource
+from kin_txt_core.datasources.settings import TelegramSettings
+from kin_txt_core.datasources.telegram.client import TelegramDatasource
+from kin_txt_core.datasources.telegram.entities import TelegramChannelEntity, ChannelFetchMetrics
+from kin_txt_core.constants import MESSAGES_STREAMING_BATCH_SIZE
+from kin_txt_core.exceptions import TelegramIsUnavailable
+
+T = TypeVar("T")
+
+
+@dataclass
+class _PooledSession:
+    # telegram clients are bound to the event loop they were connected on, so every session has its own thread
+
+    datasource: TelegramDatasource
+    flood_deadline: float = 0.0  # `time.monotonic()` until which Telegram throttles the session
+    busy: bool = False
+    executor: ThreadPoolExecutor = field(
+        default_factory=lambda: ThreadPoolExecutor(max_workers=1, thread_name_prefix="TelegramSession"),
+    )
+
+    def run(self, func: Callable[..., T], *args: Any) -> T:
+        return self.executor.submit(func, *args).result()
+
+
+@dataclass
+class _ConcurrentFetch:
+    pending_sources: deque[tuple[int, DatasourceLink]]
+    results: list[list[ClassificationEntity] | Exception | None]
+    in_flight: int = 0  # batches being fetched, their flooded sources may come back to `pending_sources`
+    condition: threading.Condition = field(default_factory=threading.Condition)
+
+
+class TelegramSessionPool(IDataSource):
+    # a flooded session is put aside and the fetch goes to another one, waiting at most `flood_wait_budget` seconds
+
+    def __init__(self, datasources: list[TelegramDatasource], flood_wait_budget: float) -> None:
+        if not datasources:
+            raise ValueError("Telegram session pool needs at least one session.")
+
+        self._sessions = [_PooledSession(datasource) for datasource in datasources]
+        self._flood_wait_budget = flood_wait_budget
+        self._condition = threading.Condition()
+
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def fetch_metrics(self) -> dict[str, ChannelFetchMetrics]:
+        metrics: dict[str, ChannelFetchMetrics] = {}
+
+        for session in self._sessions:
+            metrics.update(session.datasource.fetch_metrics)
+
+        return metrics
+
+    def fetch_data(self, source: DatasourceLink) -> list[ClassificationEntity]:
+        while True:
+            with self._acquire_session() as session:
+                try:
+                    return session.run(session.datasource.fetch_data, source)
+                except TelegramIsUnavailable as error:
+                    self._postpone_session(session, error.seconds_to_wait)
+
+    def iter_data(self, source: DatasourceLink) -> Iterator[ClassificationEntity]:
+        # a stream interrupted by a flood wait is resumed on another session from the last yielded post
+        last_created_at: datetime | None = None
+
+        while True:
+            with self._acquire_session() as session:
+                try:
+                    for post in self._iter_session_data(session, self._resume_source(source, last_created_at)):
+                        if last_created_at is not None and not self._is_after(source, post, last_created_at):
+                            continue
+
+                        last_created_at = post.created_at
+                        yield post
+
+                    return
+                except TelegramIsUnavailable as error:
+                    self._postpone_session(session, error.seconds_to_wait)
+
+    def fetch_data_concurrently(
+        self,
+        sources: list[DatasourceLink],
+        max_concurrency: int,
+    ) -> list[list[ClassificationEntity] | Exception]:
+        # sources failed with a flood wait are fetched again by the other sessions
+        session_concurrency = max(1, math.ceil(max_concurrency / len(self._sessions)))
+        fetch = _ConcurrentFetch(pending_sources=deque(enumerate(sources)), results=[None] * len(sources))
+
+        with ThreadPoolExecutor(max_workers=len(self._sessions), thread_name_prefix=self.__class__.__name__) as executor:
+            for session in self._sessions:
+                executor.submit(self._fetch_with_session, session, session_concurrency, fetch)
+
+        # sources left over when every session got flooded for longer than the budget
+        for index, _ in fetch.pending_sources:
+            if fetch.results[index] is None:
+                fetch.results[index] = TelegramIsUnavailable("All Telegram sessions are flooded!", seconds=self._get_flood_wait())
+
+        return fetch.results
+
+    def get_channel(self, channel_link: str) -> TelegramChannelEntity:
+        while True:
+            with self._acquire_session() as session:
+                try:
+                    return session.run(session.datasource.get_channel, channel_link)
+                except TelegramIsUnavailable as error:
+                    self._postpone_session(session, error.seconds_to_wait)
+
+    def is_healthy(self) -> bool:
+        # a busy session may be connecting right now, it is checked once it is released
+        with self._condition:
+            return all(session.busy or session.datasource.is_healthy() for session in self._sessions)
+
+    def close(self) -> None:
+        for session in self._sessions:
+            session.run(session.datasource.close)
+            session.executor.shutdown()
+
+    @staticmethod
+    def _iter_session_data(session: _PooledSession, source: DatasourceLink) -> Iterator[ClassificationEntity]:
+        posts = session.run(session.datasource.iter_data, source)
+
+        try:
+            while batch := session.run(lambda: list(itertools.islice(posts, MESSAGES_STREAMING_BATCH_SIZE))):
+                yield from batch
+        finally:
+            session.run(posts.close)
+
+    def _fetch_with_session(
+        self,
+        session: _PooledSession,
+        session_concurrency: int,
+        fetch: _ConcurrentFetch,
+    ) -> None:
+        pending_sources = fetch.pending_sources
+
+        while True:
+            with fetch.condition:
+                while not pending_sources and fetch.in_flight:
+                    fetch.condition.wait()
+
+                if not pending_sources or session.flood_deadline - time.monotonic() > self._flood_wait_budget:
+                    return
+
+                batch = [pending_sources.popleft() for _ in range(min(session_concurrency, len(pending_sources)))]
+                fetch.in_flight += 1
+
+            flooded_sources: list[tuple[int, DatasourceLink]] = []
+
+            try:
+                wait_seconds = session.flood_deadline - time.monotonic()
+                if wait_seconds > 0:
+                    self._logger.info(f"[TelegramSessionPool] Waiting {wait_seconds:.0f}s for a throttled session")
+                    time.sleep(wait_seconds)
+
+                with self._hold_session(session):
+                    batch_results = session.run(
+                        session.datasource.fetch_data_concurrently,
+                        [source for _, source in batch],
+                        session_concurrency,
+                    )
+
+                for (index, source), result in zip(batch, batch_results):
+                    fetch.results[index] = result
+
+                    if isinstance(result, TelegramIsUnavailable):
+                        flooded_sources.append((index, source))
+                        self._postpone_session(session, result.seconds_to_wait)
+            except Exception as error:
+                for index, _ in batch:
+                    fetch.results[index] = error
+            finally:
+                with fetch.condition:
+                    pending_sources.extend(flooded_sources)
+                    fetch.in_flight -= 1
+                    fetch.condition.notify_all()
+
+    def _get_flood_wait(self) -> int:
+        return max(0, math.ceil(min(session.flood_deadline for session in self._sessions) - time.monotonic()))
+
+    @contextmanager
+    def _acquire_session(self) -> Iterator[_PooledSession]:
+        with self._condition:
+            while True:
+                now = time.monotonic()
+
+                if all(session.flood_deadline - now > self._flood_wait_budget for session in self._sessions):
+                    seconds = min(session.flood_deadline for session in self._sessions) - now
+                    self._logger.error(f"[TelegramSessionPool] All sessions are flooded, backoff: {seconds:.0f}")
+                    raise TelegramIsUnavailable("All Telegram sessions are flooded!", seconds=math.ceil(seconds))
+
+                free_sessions = [
+                    session for session in self._sessions
+                    if not session.busy and session.flood_deadline - now <= self._flood_wait_budget
+                ]
+
+                if free_sessions:
+                    session = min(free_sessions, key=lambda free_session: free_session.flood_deadline)
+                    session.busy = True
+                    break
+
+                self._condition.wait()
+
+        try:
+            wait_seconds = session.flood_deadline - time.monotonic()
+            if wait_seconds > 0:
+                self._logger.info(f"[TelegramSessionPool] Waiting {wait_seconds:.0f}s for a throttled session")
+                time.sleep(wait_seconds)
+
+            yield session
+        finally:
+            with self._condition:
+                session.busy = False
+                self._condition.notify_all()
+
+    @contextmanager
+    def _hold_session(self, session: _PooledSession) -> Iterator[None]:
+        with self._condition:
+            while session.busy:
+                self._condition.wait()
+
+            session.busy = True
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                session.busy = False
+                self._condition.notify_all()
+
+    def _postpone_session(self, session: _PooledSession, seconds: int) -> None:
+        with self._condition:
+            session.flood_deadline = time.monotonic() + seconds
+
+        self._logger.warning(f"[TelegramSessionPool] Session is flooded for {seconds}s, switching to another one")
+
+    @staticmethod
+    def _resume_source(source: DatasourceLink, last_created_at: datetime | None) -> DatasourceLink:
+        if last_created_at is None:
+            return source
+
+        if (source.params or {}).get("reverse"):
+            return dataclasses.replace(source, earliest_date=last_created_at)
+
+        return dataclasses.replace(source, offset_date=last_created_at)
+
+    @staticmethod
+    def _is_after(source: DatasourceLink, post: ClassificationEntity, last_created_at: datetime) -> bool:
+        if (source.params or {}).get("reverse"):
+            return post.created_at > last_created_at
+
+        return post.created_at < last_created_at
+
+    @classmethod
+    def from_settings(cls, keep_alive: bool = False) -> "TelegramSessionPool":
+        settings = TelegramSettings()
+
+        return cls(
+            datasources=[
+                TelegramDatasource(
+                    session_str=session_string,
+                    api_id=settings.api_id,
+                    api_hash=settings.api_hash,
+                    keep_alive=keep_alive,
+                    page_size=settings.page_size,
+                    request_interval=settings.request_interval,
+                )
+                for session_string in [settings.session_string, *settings.extra_session_strings]
+            ],
+            flood_wait_budget=settings.flood_wait_budget,
+        )
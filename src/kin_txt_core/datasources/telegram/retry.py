@@ -1,4 +1,4 @@
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable
 from functools import wraps
 
 
@@ -13,6 +13,18 @@ def retry_connection_async(func: Callable) -> Callable:
     return wrapper
 
 
+def retry_connection_async_gen(func: Callable) -> Callable:
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs) -> AsyncIterator[Any]:
+        if self._client is None or not self._client.is_connected():
+            self._client = self._initialize_client()
+
+        async for item in func(self, *args, **kwargs):
+            yield item
+
+    return wrapper
+
+
 def retry_connection_sync(func: Callable) -> Callable:
     @wraps(func)
     def wrapper(self, *args, **kwargs) -> Any:
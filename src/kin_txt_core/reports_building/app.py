@@ -49,4 +49,8 @@ def run_consumer(
     container.domain_services.model_type_registration_service().register_model_type()
 
     _logger.info("Consuming started...")
-    container.messaging.subscriber().start_consuming()
+    try:
+        container.messaging.subscriber().start_consuming()
+    finally:
+        container.shutdown_resources()
+        predictor_factory.close()
@@ -16,6 +16,16 @@ class ReportProcessingResult(str, Enum):
     PROCESSING = "Processing"
 
 
+class ReportDataCompressions(str, Enum):
+    GZIP = "gzip"
+
+
+class ReportDataFormats(str, Enum):
+    CSV = "csv"
+    CSV_GZIP = "csv.gz"
+    PARQUET = "parquet"
+
+
 class ModelStatuses(str, Enum):
     VALIDATED = "Validated"
     VALIDATION_FAILED = "ValidationFailed"
@@ -2,6 +2,8 @@ from typing import Iterable
 
 from dependency_injector import providers, containers, resources
 
+from kin_txt_core.cache.aggregates import AbstractAggregatesStore, FileSystemAggregatesStore
+from kin_txt_core.cache.predictions import AbstractPredictionCache, TieredPredictionCache
 from kin_txt_core.messaging import AbstractEventSubscriber, AbstractEventProducer
 from kin_txt_core.messaging.rabbit import RabbitProducer, RabbitClient, RabbitSubscriber
 from kin_txt_core.messaging.rabbit.dtos import Subscription
@@ -46,6 +48,14 @@ class SubscriberResource(resources.Resource):
         return subscriber
 
 
+class DataSourceFactoryResource(resources.Resource):
+    def init(self) -> IDataSourceFactory:
+        return DataSourceFactory()
+
+    def shutdown(self, datasource_factory: IDataSourceFactory) -> None:
+        datasource_factory.close()
+
+
 class Messaging(containers.DeclarativeContainer):
     config = providers.Configuration()
     additional_subscriptions: list[Subscription] = providers.List()
@@ -72,8 +82,8 @@ class Factories(containers.DeclarativeContainer):
         BaseValidatorFactory,
     )
 
-    datasource_factory: providers.Singleton[IDataSourceFactory] = providers.Singleton(
-        DataSourceFactory,
+    datasource_factory: providers.Resource[IDataSourceFactory] = providers.Resource(
+        DataSourceFactoryResource,
     )
 
 
@@ -84,6 +94,7 @@ class Services(containers.DeclarativeContainer):
         StatisticsService,
         url=config.statistics_service,
         kin_token=config.kin_token,
+        upload_part_size=config.statistics_upload_part_size,
     )
 
     model_types_service: providers.Singleton[ModelTypesService] = providers.Singleton(
@@ -92,6 +103,18 @@ class Services(containers.DeclarativeContainer):
         kin_token=config.kin_token,
     )
 
+    prediction_cache: providers.Singleton[AbstractPredictionCache | None] = providers.Singleton(
+        TieredPredictionCache.from_settings,
+        max_size=config.prediction_cache_size,
+        redis_url=config.prediction_cache_redis_url,
+        ttl_seconds=config.prediction_cache_ttl_seconds,
+    )
+
+    aggregates_store: providers.Singleton[AbstractAggregatesStore | None] = providers.Singleton(
+        FileSystemAggregatesStore.from_settings,
+        directory=config.report_aggregates_store_path,
+    )
+
 
 class DomainServices(containers.DeclarativeContainer):
     config = providers.Configuration()
@@ -119,6 +142,12 @@ class DomainServices(containers.DeclarativeContainer):
         model_types_service=services.model_types_service,
         predictor_factory=predictor_factory,
         datasource_factory=factories.datasource_factory,
+        gathering_concurrency=config.gathering_concurrency,
+        prediction_batch_size=config.prediction_batch_size,
+        prediction_workers=config.prediction_workers,
+        prediction_cache=services.prediction_cache,
+        upload_workers=config.report_data_upload_workers,
+        report_data_format=config.statistical_report_data_format,
     )
 
     word_cloud_service: providers.Factory[WordCloudStrategy] = providers.Factory(
@@ -128,6 +157,15 @@ class DomainServices(containers.DeclarativeContainer):
         model_types_service=services.model_types_service,
         predictor_factory=predictor_factory,
         datasource_factory=factories.datasource_factory,
+        gathering_concurrency=config.gathering_concurrency,
+        prediction_batch_size=config.prediction_batch_size,
+        prediction_workers=config.prediction_workers,
+        prediction_cache=services.prediction_cache,
+        aggregates_store=services.aggregates_store,
+        upload_workers=config.report_data_upload_workers,
+        sketch_error_rate=config.word_cloud_sketch_error_rate,
+        rollups_from_cells=config.word_cloud_rollups_from_cells,
+        report_data_compression=config.report_data_compression,
     )
 
     word_cloud_token_classification_service: providers.Factory[BuildWordCloudTokenClassificationStrategy] = providers.Factory(
@@ -137,6 +175,15 @@ class DomainServices(containers.DeclarativeContainer):
         model_types_service=services.model_types_service,
         predictor_factory=predictor_factory,
         datasource_factory=factories.datasource_factory,
+        gathering_concurrency=config.gathering_concurrency,
+        prediction_batch_size=config.prediction_batch_size,
+        prediction_workers=config.prediction_workers,
+        prediction_cache=services.prediction_cache,
+        aggregates_store=services.aggregates_store,
+        upload_workers=config.report_data_upload_workers,
+        sketch_error_rate=config.word_cloud_sketch_error_rate,
+        rollups_from_cells=config.word_cloud_rollups_from_cells,
+        report_data_compression=config.report_data_compression,
     )
 
     generate_request_handler_service: providers.Singleton[GenerateRequestHandlerService] = providers.Singleton(
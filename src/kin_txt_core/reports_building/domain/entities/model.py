@@ -1,4 +1,5 @@
 import os
+import hashlib
 
 from pydantic import ConfigDict, BaseModel, Field
 
@@ -30,9 +31,15 @@ class ModelValidationEntity(BaseModel):
 class ModelEntity(ModelValidationEntity):
     model_status: ModelStatuses = Field(..., alias="modelStatus")
     validation_message: str | None = Field(None, alias="validationMessage")
+    version: str | None = Field(None, alias="modelVersion")
 
     model_config = ConfigDict(protected_namespaces=())
 
+    def get_configuration_hash(self) -> str:
+        # changes when the model is retrained or reconfigured under the same code
+        configuration = self.model_dump_json(include={"version", "category_mapping", "preprocessing_config"})
+        return hashlib.sha1(configuration.encode()).hexdigest()[:16]
+
     def get_stop_words_path(self, model_storage_path: str) -> str | None:
         if self.preprocessing_config.remove_stop_words:
             return os.path.join(model_storage_path, self.owner_username, self.code, "stop_words")
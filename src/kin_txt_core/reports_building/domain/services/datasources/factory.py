@@ -1,17 +1,85 @@
+import logging
+import threading
+
+from kin_txt_core.cache.messages import FileSystemMessagesStore
 from kin_txt_core.datasources.reddit import RedditDatasource
-from kin_txt_core.datasources.telegram import TelegramDatasource
+from kin_txt_core.datasources.telegram import TelegramDatasource, TelegramSessionPool
+from kin_txt_core.datasources.settings import TelegramSettings
+from kin_txt_core.datasources.common.caching import CachingDataSource
 from kin_txt_core.datasources.common.interface import IDataSource
 from kin_txt_core.datasources.constants import DataSourceTypes
 from kin_txt_core.reports_building.domain.services.datasources.interface import IDataSourceFactory
 
 
 class DataSourceFactory(IDataSourceFactory):
+    # pooled telegram sessions run on their own threads, so one pool is shared by all the reports
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._shared_datasources: dict[DataSourceTypes, IDataSource] = {}
+        self._pooled_datasources: list[IDataSource] = []
+        self._lock = threading.Lock()
+        self._messages_store = FileSystemMessagesStore.from_settings(self.settings.datasource_cache_path)
+
+        self._logger = logging.getLogger(self.__class__.__name__)
+
     def get_data_source(self, source: DataSourceTypes) -> IDataSource:
+        if self._is_pooled(source):
+            return self._get_pooled_data_source(source)
+
+        return self._create_data_source(source)
+
+    def close(self) -> None:
+        with self._lock:
+            datasources, self._pooled_datasources = self._pooled_datasources, []
+            self._shared_datasources = {}
+
+        for datasource in datasources:
+            datasource.close()
+
+    def _is_pooled(self, source: DataSourceTypes) -> bool:
+        return self.settings.datasource_pooling or (
+            source == DataSourceTypes.TELEGRAM and self.settings.telegram_keep_alive_session
+        )
+
+    def _get_pooled_data_source(self, source: DataSourceTypes) -> IDataSource:
+        with self._lock:
+            datasource = self._shared_datasources.get(source)
+
+            if datasource is not None and not datasource.is_healthy():
+                self._logger.warning(f"[DataSourceFactory] {source} datasource is unhealthy, reconnecting")
+
+                self._pooled_datasources.remove(datasource)
+                datasource.close()
+                datasource = None
+
+            if datasource is None:
+                datasource = self._shared_datasources[source] = self._create_data_source(source, keep_alive=True)
+                self._pooled_datasources.append(datasource)
+
+        return datasource
+
+    def _create_data_source(self, source: DataSourceTypes, keep_alive: bool = False) -> IDataSource:
+        datasource = self._build_data_source(source, keep_alive=keep_alive)
+
+        if self._messages_store is not None:
+            return CachingDataSource(datasource, self._messages_store, source)
+
+        return datasource
+
+    def _build_data_source(self, source: DataSourceTypes, keep_alive: bool = False) -> IDataSource:
         if source == DataSourceTypes.TELEGRAM:
-            return TelegramDatasource.from_settings()
+            return self._create_telegram_datasource(keep_alive=keep_alive)
         elif source == DataSourceTypes.TWITTER:
             raise NotImplemented("Twitter client is not implemented yet")
         elif source == DataSourceTypes.REDDIT:
             return RedditDatasource.from_settings()
         else:
             raise NotImplemented(f"Data source {source} is not implemented yet")
+
+    def _create_telegram_datasource(self, keep_alive: bool = False) -> IDataSource:
+        if keep_alive or TelegramSettings().extra_session_strings:
+            return TelegramSessionPool.from_settings(keep_alive=keep_alive)
+
+        return TelegramDatasource.from_settings(keep_alive=keep_alive)
@@ -12,3 +12,6 @@ class IDataSourceFactory(ABC):
     @abstractmethod
     def get_data_source(self, source: DataSourceTypes) -> IDataSource:
         pass
+
+    def close(self) -> None:
+        pass
@@ -1,9 +1,16 @@
 import logging
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from itertools import groupby
 
+from kin_txt_core.cache.aggregates import AbstractAggregatesStore
+from kin_txt_core.cache.predictions import AbstractPredictionCache
 from kin_txt_core.datasources.common.entities import ClassificationEntity, DatasourceLink
+from kin_txt_core.datasources.common.interface import IDataSource
+from kin_txt_core.datasources.common.utils import to_aware_utc
 from kin_txt_core.exceptions import InvalidChannelURLError
 from kin_txt_core.messaging import AbstractEventProducer
 from kin_txt_core.reports_building.domain.services.datasources.interface import IDataSourceFactory
@@ -20,12 +27,22 @@ from kin_txt_core.reports_building.events import (
     WordCloudReportProcessingFinished,
     StatisticalReportProcessingFinished,
 )
-from kin_txt_core.reports_building.domain.services.predicting.predictor import IPredictorFactory, IPredictor
+from kin_txt_core.reports_building.domain.services.predicting.predictor import (
+    IPredictorFactory,
+    IPredictor,
+    CachingPredictor,
+)
 from kin_txt_core.reports_building.domain.services.statistical_report.reports_builder import StatisticalReportsBuilder
 from kin_txt_core.reports_building.domain.services.word_cloud.reports_builder import WordCloudReportsBuilder
 from kin_txt_core.reports_building.constants import ReportProcessingResult, REPORTS_STORING_EXCHANGE
 
 
+@dataclass(slots=True)
+class DayAggregate:
+    posts_count: int
+    aggregate: Any
+
+
 class IGeneratingReportsService(ABC):
     _REPORT_TYPE_TO_EVENT_MAPPING = {
         WordCloudReport: WordCloudReportProcessingFinished,
@@ -40,6 +57,12 @@ class IGeneratingReportsService(ABC):
         model_types_service: ModelTypesService,
         predictor_factory: IPredictorFactory,
         datasource_factory: IDataSourceFactory,
+        gathering_concurrency: int = 1,
+        prediction_batch_size: int = 256,
+        prediction_workers: int = 1,
+        prediction_cache: AbstractPredictionCache | None = None,
+        aggregates_store: AbstractAggregatesStore | None = None,
+        upload_workers: int = 1,
     ) -> None:
         self._logger = logging.getLogger(self.__class__.__name__)
 
@@ -47,6 +70,16 @@ class IGeneratingReportsService(ABC):
         self._model_types_service = model_types_service
         self._predictor_factory = predictor_factory
         self._datasource_factory = datasource_factory
+        self._gathering_concurrency = gathering_concurrency
+        self._prediction_batch_size = prediction_batch_size
+        self._prediction_workers = prediction_workers
+        self._prediction_cache = prediction_cache
+        self._aggregates_store = aggregates_store
+
+        self._upload_executor: ThreadPoolExecutor | None = None
+        if upload_workers > 0:
+            self._upload_executor = ThreadPoolExecutor(max_workers=upload_workers, thread_name_prefix="ReportDataUpload")
+        self._pending_uploads: list[Future] = []
 
         self._report_generation_warnings = []
 
@@ -55,6 +88,9 @@ class IGeneratingReportsService(ABC):
 
         self._logger.info(f'[{self.__class__.__name__}] Starting generating report for user: {username}')
 
+        predictor: IPredictor | None = None
+        self._report_generation_warnings = []
+
         try:
             self._publish_report_processing_started(generate_report_entity.report_id)
 
@@ -71,6 +107,8 @@ class IGeneratingReportsService(ABC):
             )
 
             report_entity = self._build_report_entity(generate_report_wrapper)
+
+            self._wait_for_uploads()
             self._publish_finished_report(username, report_entity)
         except Exception as error:
             self._logger.error(
@@ -83,50 +121,252 @@ class IGeneratingReportsService(ABC):
 
             postponed_report = self._build_postponed_report(generate_report_entity.report_id, generate_report_entity.name, error)
             self._publish_finished_report(username, postponed_report)
+        finally:
+            if predictor is not None:
+                predictor.close()
+
+            # uploads left after a failure are not reported, but they must not outlive the report
+            wait(self._pending_uploads)
+            self._pending_uploads = []
 
     def _build_report_entity(self, generate_report_wrapper: GenerationTemplateWrapper) -> StatisticalReport | WordCloudReport:
-        posts: list[ClassificationEntity] = self._gather_report_data(generate_report_wrapper)
+        posts: Iterator[ClassificationEntity] = self._gather_report_data(generate_report_wrapper)
 
         handled_data = self.handle_posts(posts, generate_report_wrapper)
 
         return self.build_report(handled_data, generate_report_wrapper)
 
-    def _gather_report_data(self, generate_report_wrapper: GenerationTemplateWrapper) -> list[ClassificationEntity]:
-        total_posts: list[ClassificationEntity] = []
-
+    def _gather_report_data(self, generate_report_wrapper: GenerationTemplateWrapper) -> Iterator[ClassificationEntity]:
         datasource = self._datasource_factory.get_data_source(
             generate_report_wrapper.generate_report_metadata.datasource_type
         )
         generate_report_meta = generate_report_wrapper.generate_report_metadata
 
-        for source_name in generate_report_meta.channel_list:
+        sources = [
+            DatasourceLink(
+                source_link=source_name,
+                offset_date=self._datetime_from_date(generate_report_meta.end_date, end_of_day=True),
+                earliest_date=self._datetime_from_date(generate_report_meta.start_date),
+                skip_messages_without_text=True,
+            )
+            for source_name in generate_report_meta.channel_list
+        ]
+
+        if self._gathering_concurrency > 1 and len(sources) > 1:
+            return self._gather_sources_concurrently(datasource, sources)
+
+        return self._stream_sources(datasource, sources)
+
+    def _stream_sources(self, datasource: IDataSource, sources: list[DatasourceLink]) -> Iterator[ClassificationEntity]:
+        for source in sources:
+            source_name = source.source_link
+            source_posts_count = 0
+
             try:
-                source_posts = datasource.fetch_data(
-                    source=DatasourceLink(
-                        source_link=source_name,
-                        offset_date=self._datetime_from_date(generate_report_meta.end_date, end_of_day=True),
-                        earliest_date=self._datetime_from_date(generate_report_meta.start_date),
-                        skip_messages_without_text=True,
-                    ),
-                )
-
-                total_posts.extend(source_posts)  # Append all posts from the source to the total list
+                for post in datasource.iter_data(source):
+                    source_posts_count += 1
+                    yield post
             except InvalidChannelURLError:
-                self._logger.warning(f"[WordCloudStrategy] Invalid channel URL: {source_name}")
+                self._logger.warning(f"[{self.__class__.__name__}] Invalid channel URL: {source_name}")
+                self._report_generation_warnings.append(self.get_not_existing_source_channel_warning(source_name))
+                continue
+
+            if not source_posts_count:
+                self._logger.warning(f"[{self.__class__.__name__}] No messages from {source_name}")
+                self._report_generation_warnings.append(self.get_not_existing_source_channel_warning(source_name))
+                continue
+
+            self._logger.info(f"[{self.__class__.__name__}] Gathered {source_posts_count} messages from {source_name}")
+
+    def _gather_sources_concurrently(
+        self,
+        datasource: IDataSource,
+        sources: list[DatasourceLink],
+    ) -> Iterator[ClassificationEntity]:
+        sources_posts = datasource.fetch_data_concurrently(sources, max_concurrency=self._gathering_concurrency)
+
+        for source, source_posts in zip(sources, sources_posts):
+            source_name = source.source_link
+
+            if isinstance(source_posts, InvalidChannelURLError):
+                self._logger.warning(f"[{self.__class__.__name__}] Invalid channel URL: {source_name}")
                 self._report_generation_warnings.append(self.get_not_existing_source_channel_warning(source_name))
                 continue
 
+            if isinstance(source_posts, Exception):
+                raise source_posts
+
             if not source_posts:
-                self._logger.warning(f"[WordCloudStrategy] No messages from {source_name}")
+                self._logger.warning(f"[{self.__class__.__name__}] No messages from {source_name}")
+                self._report_generation_warnings.append(self.get_not_existing_source_channel_warning(source_name))
+                continue
+
+            self._logger.info(f"[{self.__class__.__name__}] Gathered {len(source_posts)} messages from {source_name}")
+
+            yield from source_posts
+
+    def _upload_report_data(self, upload: Callable[..., None], *args: Any) -> None:
+        if self._upload_executor is None:
+            upload(*args)
+            return
+
+        self._pending_uploads.append(self._upload_executor.submit(upload, *args))
+
+    def _wait_for_uploads(self) -> None:
+        pending_uploads, self._pending_uploads = self._pending_uploads, []
+
+        for upload_future in pending_uploads:
+            upload_future.result()
+
+    def _aggregate_report(
+        self,
+        posts: Iterable[ClassificationEntity],
+        generate_report_wrapper: GenerationTemplateWrapper,
+    ) -> Any:
+        if self._aggregates_store is None:
+            return self._aggregate_posts(posts, generate_report_wrapper)
+
+        # posts are gathered lazily, so they are not fetched at all, only the days missing in the store are fetched
+        return self._aggregate_report_incrementally(generate_report_wrapper)
+
+    def _aggregate_report_incrementally(self, generate_report_wrapper: GenerationTemplateWrapper) -> Any:
+        generate_report_meta = generate_report_wrapper.generate_report_metadata
+        datasource = self._datasource_factory.get_data_source(generate_report_meta.datasource_type)
+
+        report_days = [
+            generate_report_meta.end_date - timedelta(days=days_offset)
+            for days_offset in range((generate_report_meta.end_date - generate_report_meta.start_date).days + 1)
+        ]
+
+        report_aggregate = self._initialize_aggregate(generate_report_wrapper)
+
+        for source_name in generate_report_meta.channel_list:
+            try:
+                source_days = self._load_source_days(datasource, source_name, report_days, generate_report_wrapper)
+            except InvalidChannelURLError:
+                self._logger.warning(f"[{self.__class__.__name__}] Invalid channel URL: {source_name}")
                 self._report_generation_warnings.append(self.get_not_existing_source_channel_warning(source_name))
                 continue
 
-            self._logger.info(f"[WordCloudStrategy] Gathered {len(source_posts)} messages from {source_name}")
+            source_posts_count = sum(day_aggregate.posts_count for day_aggregate in source_days)
 
-        return total_posts
+            if not source_posts_count:
+                self._logger.warning(f"[{self.__class__.__name__}] No messages from {source_name}")
+                self._report_generation_warnings.append(self.get_not_existing_source_channel_warning(source_name))
+                continue
+
+            self._logger.info(f"[{self.__class__.__name__}] Aggregated {source_posts_count} messages from {source_name}")
+
+            for day_aggregate in source_days:
+                report_aggregate.merge(day_aggregate.aggregate)
+
+        return report_aggregate
+
+    def _load_source_days(
+        self,
+        datasource: IDataSource,
+        source_name: str,
+        report_days: list[date],
+        generate_report_wrapper: GenerationTemplateWrapper,
+    ) -> list[DayAggregate]:
+        days_keys = {day: self._build_day_aggregate_key(source_name, day, generate_report_wrapper) for day in report_days}
+
+        days_aggregates: dict[date, DayAggregate] = {}
+        for day, key in days_keys.items():
+            day_aggregate = self._aggregates_store.get(key)
+
+            if day_aggregate is not None:
+                days_aggregates[day] = day_aggregate
+
+        missing_days = [day for day in report_days if day not in days_aggregates]
+
+        self._logger.info(
+            f"[{self.__class__.__name__}] {len(report_days) - len(missing_days)} of {len(report_days)} days"
+            f" of {source_name} are taken from the aggregates store"
+        )
+
+        today = date.today()
+
+        for days_run in self._split_into_consecutive_runs(missing_days):
+            fetched_days = self._aggregate_days(datasource, source_name, days_run, generate_report_wrapper)
+
+            for day, day_aggregate in fetched_days.items():
+                days_aggregates[day] = day_aggregate
+
+                if day < today:  # posts of the current day are not final yet
+                    self._aggregates_store.set(days_keys[day], day_aggregate)
+
+        return [days_aggregates[day] for day in report_days]
+
+    def _aggregate_days(
+        self,
+        datasource: IDataSource,
+        source_name: str,
+        days_run: list[date],
+        generate_report_wrapper: GenerationTemplateWrapper,
+    ) -> dict[date, DayAggregate]:
+        first_day, last_day = days_run[-1], days_run[0]
+
+        source = DatasourceLink(
+            source_link=source_name,
+            offset_date=self._datetime_from_date(last_day, end_of_day=True),
+            earliest_date=self._datetime_from_date(first_day),
+            skip_messages_without_text=True,
+        )
+
+        days_aggregates = {
+            day: DayAggregate(posts_count=0, aggregate=self._initialize_aggregate(generate_report_wrapper))
+            for day in days_run
+        }
+
+        # the window is made of local midnights, so the posts are bucketed by their local dates too
+        def get_post_day(post: ClassificationEntity) -> date:
+            return to_aware_utc(post.created_at).astimezone().date()
+
+        for day, day_posts in groupby(datasource.iter_data(source), key=get_post_day):
+            if day not in days_aggregates:
+                # a datasource not filtering by the window exactly, the day is aggregated by its own run
+                continue
+
+            day_posts = list(day_posts)
+
+            days_aggregates[day].posts_count += len(day_posts)
+            days_aggregates[day].aggregate.merge(self._aggregate_posts(day_posts, generate_report_wrapper))
+
+        return days_aggregates
+
+    def _build_day_aggregate_key(self, source_name: str, day: date, generate_report_wrapper: GenerationTemplateWrapper) -> str:
+        generate_report_meta = generate_report_wrapper.generate_report_metadata
+        model_meta = generate_report_wrapper.model_metadata
+
+        return (
+            f"aggregate:{self.__class__.__name__}:{generate_report_meta.datasource_type.value}"
+            f":{model_meta.owner_username}/{model_meta.code}:{model_meta.get_configuration_hash()}"
+            f":{source_name}:{day.isoformat()}"
+        )
+
+    @staticmethod
+    def _split_into_consecutive_runs(days: list[date]) -> list[list[date]]:
+        runs: list[list[date]] = []
+
+        for day in days:
+            if runs and runs[-1][-1] - day == timedelta(days=1):
+                runs[-1].append(day)
+            else:
+                runs.append([day])
+
+        return runs
+
+    @abstractmethod
+    def _initialize_aggregate(self, generate_report_wrapper: GenerationTemplateWrapper) -> Any:
+        pass
 
     @abstractmethod
-    def handle_posts(self, posts: list[ClassificationEntity], generate_report_wrapper: GenerationTemplateWrapper) -> dict[str, Any]:
+    def _aggregate_posts(self, posts: Iterable[ClassificationEntity], generate_report_wrapper: GenerationTemplateWrapper) -> Any:
+        pass
+
+    @abstractmethod
+    def handle_posts(self, posts: Iterable[ClassificationEntity], generate_report_wrapper: GenerationTemplateWrapper) -> dict[str, Any]:
         pass
 
     @abstractmethod
@@ -162,7 +402,19 @@ class IGeneratingReportsService(ABC):
         return datetime(year=dt.year, month=dt.month, day=dt.day) + timedelta(days=int(end_of_day))
 
     def _initialize_predictor(self, model_entity: ModelEntity, generate_entity: GenerateReportEntity) -> IPredictor:
-        return self._predictor_factory.create_predictor(model_entity, generate_entity)
+        if self._prediction_workers > 1:
+            predictor = self._predictor_factory.create_process_pool_predictor(
+                model_entity,
+                generate_entity,
+                workers=self._prediction_workers,
+            )
+        else:
+            predictor = self._predictor_factory.create_predictor(model_entity, generate_entity)
+
+        if self._prediction_cache is not None:
+            return CachingPredictor(predictor, self._prediction_cache, model_entity)
+
+        return predictor
 
     def _publish_report_processing_started(self, report_id: int) -> None:
         event = ReportProcessingStarted(report_id=report_id)
@@ -1 +1,3 @@
 from .interface import IPredictor, IPredictorFactory
+from .process_pool import PredictionProcessPool, ProcessPoolPredictor
+from .caching import CachingPredictor
@@ -0,0 +1,103 @@
+import json
+import hashlib
+import logging
+from typing import Callable, TypeVar
+
+from kin_txt_core.cache.predictions import AbstractPredictionCache
+from kin_txt_core.datasources.common.entities import ClassificationEntity
+from kin_txt_core.reports_building.domain.entities import ModelEntity
+from kin_txt_core.reports_building.domain.services.predicting.predictor.interface import IPredictor
+
+__all__ = ["CachingPredictor"]
+
+T = TypeVar("T")
+
+
+class CachingPredictor(IPredictor):
+    def __init__(self, predictor: IPredictor, cache: AbstractPredictionCache, model_entity: ModelEntity) -> None:
+        self._predictor = predictor
+        self._cache = cache
+
+        self._key_prefix = (
+            f"{model_entity.owner_username}/{model_entity.code}:{model_entity.get_configuration_hash()}"
+        )
+
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def preprocess_text(self, text: str) -> str:
+        return self._predictor.preprocess_text(text)
+
+    def preprocess_texts(self, texts: list[str]) -> list[str]:
+        return self._predictor.preprocess_texts(texts)
+
+    def predict_post(self, entity: ClassificationEntity) -> str:
+        return self.predict_posts([entity])[0]
+
+    def predict_post_tokens(self, entity: ClassificationEntity) -> dict[str, list[str]]:
+        return self.predict_posts_tokens([entity])[0]
+
+    def predict_posts(self, entities: list[ClassificationEntity]) -> list[str]:
+        return self._predict_cached(
+            "post",
+            entities,
+            self._predictor.predict_posts,
+            encode=lambda category: category,
+            decode=lambda category: category,
+        )
+
+    def predict_preprocessed_posts(self, entities: list[ClassificationEntity], preprocessed_texts: list[str]) -> list[str]:
+        preprocessed_texts_by_entity = {id(entity): text for entity, text in zip(entities, preprocessed_texts)}
+
+        return self._predict_cached(
+            "post",
+            entities,
+            lambda missing_entities: self._predictor.predict_preprocessed_posts(
+                missing_entities,
+                [preprocessed_texts_by_entity[id(entity)] for entity in missing_entities],
+            ),
+            encode=lambda category: category,
+            decode=lambda category: category,
+        )
+
+    def predict_posts_tokens(self, entities: list[ClassificationEntity]) -> list[dict[str, list[str]]]:
+        return self._predict_cached(
+            "tokens",
+            entities,
+            self._predictor.predict_posts_tokens,
+            encode=json.dumps,
+            decode=json.loads,
+        )
+
+    def close(self) -> None:
+        self._logger.info(f"[CachingPredictor] Prediction cache hits: {self._cache.hits}, misses: {self._cache.misses}")
+        self._predictor.close()
+
+    def _predict_cached(
+        self,
+        kind: str,
+        entities: list[ClassificationEntity],
+        predict: Callable[[list[ClassificationEntity]], list[T]],
+        encode: Callable[[T], str],
+        decode: Callable[[str], T],
+    ) -> list[T]:
+        keys = [self._build_key(kind, entity) for entity in entities]
+        cached_values = self._cache.get_many(keys)
+
+        results: list[T | None] = [decode(value) if value is not None else None for value in cached_values]
+        missing_positions = [position for position, value in enumerate(cached_values) if value is None]
+
+        if missing_positions:
+            predictions = predict([entities[position] for position in missing_positions])
+
+            for position, prediction in zip(missing_positions, predictions):
+                results[position] = prediction
+
+            self._cache.set_many({
+                keys[position]: encode(prediction) for position, prediction in zip(missing_positions, predictions)
+            })
+
+        return results
+
+    def _build_key(self, kind: str, entity: ClassificationEntity) -> str:
+        text_digest = hashlib.blake2b((entity.text or "").encode(), digest_size=16).hexdigest()
+        return f"prediction:{kind}:{self._key_prefix}:{text_digest}"
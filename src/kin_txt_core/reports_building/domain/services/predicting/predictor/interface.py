@@ -1,4 +1,5 @@
-from typing import Literal
+import threading
+from typing import Literal, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
 from kin_txt_core.datasources.common.entities import ClassificationEntity
@@ -7,6 +8,9 @@ from kin_txt_core.reports_building.domain.entities import ModelEntity, CustomMod
 from kin_txt_core.reports_building.domain.services.predicting.predictor.meta import PredictorValidateModelType
 from kin_txt_core.reports_building.domain.services.predicting.preprocessing.interface import ITextPreprocessor
 
+if TYPE_CHECKING:
+    from kin_txt_core.reports_building.domain.services.predicting.predictor.process_pool import PredictionProcessPool
+
 
 class IPredictor(ITextPreprocessor, ABC):
     @abstractmethod
@@ -17,10 +21,33 @@ class IPredictor(ITextPreprocessor, ABC):
     def predict_post_tokens(self, entity: ClassificationEntity) -> dict[str, list[str]]:
         pass
 
+    def predict_posts(self, entities: list[ClassificationEntity]) -> list[str]:
+        # override in predictors supporting vectorized inference
+        return [self.predict_post(entity) for entity in entities]
+
+    def predict_posts_tokens(self, entities: list[ClassificationEntity]) -> list[dict[str, list[str]]]:
+        return [self.predict_post_tokens(entity) for entity in entities]
+
+    def predict_preprocessed_posts(self, entities: list[ClassificationEntity], preprocessed_texts: list[str]) -> list[str]:
+        # texts are already preprocessed with `preprocess_text`, they are ignored by default
+        return self.predict_posts(entities)
+
+    def preprocess_and_predict_posts(self, entities: list[ClassificationEntity]) -> list[tuple[str, str]]:
+        preprocessed_texts = self.preprocess_texts([entity.text for entity in entities])
+        categories = self.predict_preprocessed_posts(entities, preprocessed_texts)
+
+        return list(zip(preprocessed_texts, categories))
+
+    def close(self) -> None:
+        pass
+
 
 class IPredictorFactory(ABC, metaclass=PredictorValidateModelType):
     model_types: list[CustomModelRegistrationEntity] | Literal["GenericModel"]
 
+    _prediction_pool: "PredictionProcessPool | None" = None
+    _prediction_pool_lock = threading.Lock()
+
     @abstractmethod
     def create_predictor(self, model_entity: ModelEntity, generation_request: GenerateReportEntity) -> IPredictor:
         pass
@@ -28,3 +55,37 @@ class IPredictorFactory(ABC, metaclass=PredictorValidateModelType):
     @abstractmethod
     def is_handling(self, model_type: ModelTypes, model_code: str) -> bool:
         pass
+
+    def create_process_pool_predictor(
+        self,
+        model_entity: ModelEntity,
+        generation_request: GenerateReportEntity,
+        workers: int,
+    ) -> IPredictor:
+        from kin_txt_core.reports_building.domain.services.predicting.predictor.process_pool import (
+            PredictionProcessPool,
+            ProcessPoolPredictor,
+        )
+
+        # the worker processes keep the loaded models, so they are started once and shared by all the reports
+        with self._prediction_pool_lock:
+            if self._prediction_pool is None or self._prediction_pool.workers != workers:
+                if self._prediction_pool is not None:
+                    self._prediction_pool.close()
+
+                self._prediction_pool = PredictionProcessPool(self, workers=workers)
+
+        return ProcessPoolPredictor(self, model_entity, generation_request, pool=self._prediction_pool)
+
+    def __getstate__(self) -> dict:
+        # the factory is sent to the worker processes without the pool of them
+        state = self.__dict__.copy()
+        state.pop("_prediction_pool", None)
+
+        return state
+
+    def close(self) -> None:
+        with self._prediction_pool_lock:
+            if self._prediction_pool is not None:
+                self._prediction_pool.close()
+                self._prediction_pool = None
@@ -0,0 +1,158 @@
+import math
+import logging
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TYPE_CHECKING
+
+from kin_txt_core.datasources.common.entities import ClassificationEntity
+from kin_txt_core.reports_building.domain.entities import ModelEntity, GenerateReportEntity
+from kin_txt_core.reports_building.domain.services.predicting.predictor.interface import IPredictor
+from kin_txt_core.utils import batched
+
+if TYPE_CHECKING:
+    from kin_txt_core.reports_building.domain.services.predicting.predictor.interface import IPredictorFactory
+
+__all__ = ["PredictionProcessPool", "ProcessPoolPredictor"]
+
+_WORKER_PREDICTORS_LIMIT = 2  # models kept loaded in every worker process
+
+_worker_predictor_factory: "IPredictorFactory | None" = None
+_worker_predictors: OrderedDict[str, IPredictor] = OrderedDict()
+
+
+def _initialize_worker(predictor_factory: "IPredictorFactory") -> None:
+    global _worker_predictor_factory
+    _worker_predictor_factory = predictor_factory
+
+
+def _get_worker_predictor(model_entity: ModelEntity, generation_request: GenerateReportEntity) -> IPredictor:
+    # the model is loaded once per worker process and reused for all the shards of the following reports
+    model_key = model_entity.model_dump_json()
+
+    if model_key in _worker_predictors:
+        _worker_predictors.move_to_end(model_key)
+        return _worker_predictors[model_key]
+
+    if len(_worker_predictors) >= _WORKER_PREDICTORS_LIMIT:
+        _, evicted_predictor = _worker_predictors.popitem(last=False)
+        evicted_predictor.close()
+
+    predictor = _worker_predictor_factory.create_predictor(model_entity, generation_request)
+    _worker_predictors[model_key] = predictor
+
+    return predictor
+
+
+def _run_shard(
+    method_name: str,
+    model_entity: ModelEntity,
+    generation_request: GenerateReportEntity,
+    shard: list[Any],
+) -> list[Any]:
+    predictor = _get_worker_predictor(model_entity, generation_request)
+
+    if method_name == "predict_preprocessed_posts":
+        entities, preprocessed_texts = zip(*shard)
+        return predictor.predict_preprocessed_posts(list(entities), list(preprocessed_texts))
+
+    return getattr(predictor, method_name)(shard)
+
+
+class PredictionProcessPool:
+    # lives as long as the predictor factory, every worker keeps the predictors of its last models
+
+    def __init__(self, predictor_factory: "IPredictorFactory", workers: int) -> None:
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_worker,
+            initargs=(predictor_factory,),
+        )
+
+    def map_shards(
+        self,
+        method_name: str,
+        model_entity: ModelEntity,
+        generation_request: GenerateReportEntity,
+        items: list[Any],
+    ) -> list[Any]:
+        if not items:
+            return []
+
+        shard_size = math.ceil(len(items) / self.workers)
+        shards = list(batched(items, shard_size))
+
+        results: list[Any] = []
+        for shard_results in self._executor.map(
+            _run_shard,
+            [method_name] * len(shards),
+            [model_entity] * len(shards),
+            [generation_request] * len(shards),
+            shards,
+        ):
+            results.extend(shard_results)
+
+        return results
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class ProcessPoolPredictor(IPredictor):
+    # shards results are merged back in the input order
+
+    def __init__(
+        self,
+        predictor_factory: "IPredictorFactory",
+        model_entity: ModelEntity,
+        generation_request: GenerateReportEntity,
+        pool: PredictionProcessPool,
+    ) -> None:
+        self._predictor_factory = predictor_factory
+        self._model_entity = model_entity
+        self._generation_request = generation_request
+        self._pool = pool
+
+        self._local_predictor: IPredictor | None = None
+
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def preprocess_text(self, text: str) -> str:
+        return self._get_local_predictor().preprocess_text(text)
+
+    def predict_post(self, entity: ClassificationEntity) -> str:
+        return self._get_local_predictor().predict_post(entity)
+
+    def predict_post_tokens(self, entity: ClassificationEntity) -> dict[str, list[str]]:
+        return self._get_local_predictor().predict_post_tokens(entity)
+
+    def preprocess_texts(self, texts: list[str]) -> list[str]:
+        return self._map_shards("preprocess_texts", texts)
+
+    def predict_posts(self, entities: list[ClassificationEntity]) -> list[str]:
+        return self._map_shards("predict_posts", entities)
+
+    def predict_posts_tokens(self, entities: list[ClassificationEntity]) -> list[dict[str, list[str]]]:
+        return self._map_shards("predict_posts_tokens", entities)
+
+    def predict_preprocessed_posts(self, entities: list[ClassificationEntity], preprocessed_texts: list[str]) -> list[str]:
+        return self._map_shards("predict_preprocessed_posts", list(zip(entities, preprocessed_texts)))
+
+    def preprocess_and_predict_posts(self, entities: list[ClassificationEntity]) -> list[tuple[str, str]]:
+        return self._map_shards("preprocess_and_predict_posts", entities)
+
+    def close(self) -> None:
+        # the pool belongs to the predictor factory and serves the following reports
+        if self._local_predictor is not None:
+            self._local_predictor.close()
+            self._local_predictor = None
+
+    def _map_shards(self, method_name: str, items: list[Any]) -> list[Any]:
+        return self._pool.map_shards(method_name, self._model_entity, self._generation_request, items)
+
+    def _get_local_predictor(self) -> IPredictor:
+        # single posts are not worth a round trip to the workers
+        if self._local_predictor is None:
+            self._local_predictor = self._predictor_factory.create_predictor(self._model_entity, self._generation_request)
+
+        return self._local_predictor
@@ -1 +1,2 @@
 from .interface import ITextPreprocessor
+from .compiled import CompiledTextPreprocessor
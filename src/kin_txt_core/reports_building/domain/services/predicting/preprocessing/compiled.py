@@ -0,0 +1,136 @@
+import re
+import string
+import functools
+from dataclasses import dataclass
+from typing import Callable
+
+from kin_txt_core.reports_building.domain.entities import PreprocessingConfig, ModelEntity
+from kin_txt_core.reports_building.domain.entities.preprocessing import PossiblePaddingTruncating
+from kin_txt_core.reports_building.domain.services.predicting.preprocessing.interface import ITextPreprocessor
+
+__all__ = ["CompiledTextPreprocessor"]
+
+_HTML_TAGS_PATTERN = r"<[^>]+>"
+_LINKS_PATTERN = r"(?:https?://|www\.)\S+"
+_EMOJI_PATTERN = (
+    "["
+    "\U0001F1E6-\U0001F1FF"  # flags
+    "\U0001F300-\U0001FAFF"  # pictographs, emoticons, transport, etc.
+    "\U00002600-\U000027BF"  # misc symbols and dingbats
+    "\U0000FE0F\U0000200D"  # variation selector and zero width joiner
+    "]+"
+)
+_PUNCTUATION = string.punctuation + "«»—–…“”„‘’•·"
+
+_LEMMATIZER_CACHE_SIZE = 100_000
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledPipeline:
+    removal_pattern: re.Pattern | None
+    lowercase: bool
+    punctuation_table: dict[int, str] | None
+    split_tokens: bool
+    stop_words: frozenset[str] | None
+    max_tokens: int | None
+    truncate_pre: bool
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_pipeline(config_json: str, stop_words_path: str | None) -> _CompiledPipeline:
+    config = PreprocessingConfig.model_validate_json(config_json)
+
+    removal_patterns = []
+    if config.remove_html_tags:
+        removal_patterns.append(_HTML_TAGS_PATTERN)
+    if config.remove_links:
+        removal_patterns.append(_LINKS_PATTERN)
+    if config.remove_emoji:
+        removal_patterns.append(_EMOJI_PATTERN)
+
+    stop_words = None
+    if config.remove_stop_words and stop_words_path is not None:
+        stop_words = _load_stop_words(stop_words_path, lowercase=config.lowercase)
+
+    return _CompiledPipeline(
+        removal_pattern=re.compile("|".join(removal_patterns)) if removal_patterns else None,
+        lowercase=config.lowercase,
+        punctuation_table=str.maketrans(_PUNCTUATION, " " * len(_PUNCTUATION)) if config.remove_punctuation else None,
+        split_tokens=(
+            config.remove_extra_spaces
+            or stop_words is not None
+            or config.lemmatize_text
+            or config.max_tokens is not None
+        ),
+        stop_words=stop_words,
+        max_tokens=config.max_tokens,
+        truncate_pre=config.truncating == PossiblePaddingTruncating.PRE,
+    )
+
+
+def _load_stop_words(stop_words_path: str, lowercase: bool) -> frozenset[str]:
+    with open(stop_words_path, "r", encoding="utf-8") as stop_words_file:
+        words = stop_words_file.read().split()
+
+    return frozenset(word.lower() for word in words) if lowercase else frozenset(words)
+
+
+class CompiledTextPreprocessor(ITextPreprocessor):
+    # lemmatization depends on the language model, so the caller provides the token lemmatizer
+
+    def __init__(
+        self,
+        config: PreprocessingConfig,
+        stop_words_path: str | None = None,
+        lemmatizer: Callable[[str], str] | None = None,
+    ) -> None:
+        if config.lemmatize_text and lemmatizer is None:
+            raise ValueError("Preprocessing config requires lemmatization, but lemmatizer was not provided.")
+
+        self._pipeline = _compile_pipeline(config.model_dump_json(), stop_words_path)
+        self._lemmatizer = functools.lru_cache(maxsize=_LEMMATIZER_CACHE_SIZE)(lemmatizer) if config.lemmatize_text else None
+
+    def preprocess_text(self, text: str) -> str:
+        pipeline = self._pipeline
+
+        if not text:
+            return ""
+
+        if pipeline.removal_pattern is not None:
+            text = pipeline.removal_pattern.sub(" ", text)
+        if pipeline.lowercase:
+            text = text.lower()
+        if pipeline.punctuation_table is not None:
+            text = text.translate(pipeline.punctuation_table)
+
+        if not pipeline.split_tokens:
+            return text
+
+        tokens = text.split()
+
+        if pipeline.stop_words is not None:
+            stop_words = pipeline.stop_words
+            tokens = [token for token in tokens if token not in stop_words]
+        if self._lemmatizer is not None:
+            tokens = list(map(self._lemmatizer, tokens))
+        if pipeline.max_tokens is not None and len(tokens) > pipeline.max_tokens:
+            tokens = tokens[-pipeline.max_tokens:] if pipeline.truncate_pre else tokens[:pipeline.max_tokens]
+
+        return " ".join(tokens)
+
+    def preprocess_texts(self, texts: list[str]) -> list[str]:
+        preprocess_text = self.preprocess_text
+        return [preprocess_text(text) for text in texts]
+
+    @classmethod
+    def from_model_entity(
+        cls,
+        model_entity: ModelEntity,
+        model_storage_path: str,
+        lemmatizer: Callable[[str], str] | None = None,
+    ) -> "CompiledTextPreprocessor":
+        return cls(
+            model_entity.preprocessing_config,
+            stop_words_path=model_entity.get_stop_words_path(model_storage_path),
+            lemmatizer=lemmatizer,
+        )
@@ -7,3 +7,6 @@ class ITextPreprocessor(ABC):
     @abstractmethod
     def preprocess_text(self, text: str) -> str:
         pass
+
+    def preprocess_texts(self, texts: list[str]) -> list[str]:
+        return [self.preprocess_text(text) for text in texts]
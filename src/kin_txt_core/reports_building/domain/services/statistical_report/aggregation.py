@@ -0,0 +1,135 @@
+from array import array
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, NamedTuple
+
+from kin_txt_core.constants import DEFAULT_DATE_FORMAT
+from kin_txt_core.types.reports import RawContentTypes
+
+_DATE, _HOUR, _CHANNEL, _CATEGORY = range(4)
+
+
+class _GroupBy(NamedTuple):
+    columns: tuple[int, ...]
+    new_row: Callable[[], Any] | None = None
+
+
+class StatisticalAggregator:
+    # dates are coded in the order of their first appearance, so the diagrams keep the keys order
+
+    def __init__(self) -> None:
+        self._dates: list[str] = []
+        self._date_codes: dict[int, int] = {}
+        self._channels: list[str] = []
+        self._channel_codes: dict[str, int] = {}
+        self._categories: list[str] = []
+        self._category_codes: dict[str, int] = {}
+
+        self._date_column = array("I")
+        self._hour_column = array("B")
+        self._channel_column = array("I")
+        self._category_column = array("I")
+
+    @property
+    def total_messages(self) -> int:
+        return len(self._date_column)
+
+    def add(self, created_at: datetime, channel: str, category: str) -> str:
+        date_ordinal = created_at.toordinal()
+        date_code = self._date_codes.get(date_ordinal)
+
+        if date_code is None:
+            date_code = self._date_codes[date_ordinal] = len(self._dates)
+            self._dates.append(created_at.date().strftime(DEFAULT_DATE_FORMAT))
+
+        self._date_column.append(date_code)
+        self._hour_column.append(created_at.hour)
+        self._channel_column.append(self._encode(channel, self._channel_codes, self._channels))
+        self._category_column.append(self._encode(category, self._category_codes, self._categories))
+
+        return self._dates[date_code]
+
+    def to_partial(self) -> "StatisticalPartialAggregate":
+        cells = Counter(zip(self._date_column, self._hour_column, self._channel_column, self._category_column))
+
+        return StatisticalPartialAggregate(
+            cells=Counter({
+                (self._dates[date_code], hour, self._channels[channel_code], self._categories[category_code]): count
+                for (date_code, hour, channel_code, category_code), count in cells.items()
+            }),
+            dates=list(self._dates),
+        )
+
+    @staticmethod
+    def _encode(value: str, codes: dict[str, int], values: list[str]) -> int:
+        code = codes.get(value)
+
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+
+        return code
+
+
+class StatisticalPartialAggregate:
+    def __init__(self, cells: Counter | None = None, dates: list[str] | None = None) -> None:
+        self.cells: Counter[tuple[str, int, str, str]] = cells if cells is not None else Counter()
+        self.dates: list[str] = dates if dates is not None else []  # in order of the first appearance
+
+    @property
+    def total_messages(self) -> int:
+        return sum(self.cells.values())
+
+    def merge(self, other: "StatisticalPartialAggregate") -> "StatisticalPartialAggregate":
+        # the dates seen first in this aggregate keep their order
+        self.cells.update(other.cells)
+
+        known_dates = set(self.dates)
+        self.dates.extend(date for date in other.dates if date not in known_dates)
+
+        return self
+
+    def build_report_data(
+        self,
+        content_types: list[RawContentTypes],
+        report_data: dict[RawContentTypes, Any],
+        channels: list[str],
+        categories: list[str],
+    ) -> dict[RawContentTypes, Any]:
+        group_bys = {
+            RawContentTypes.BY_CHANNEL: _GroupBy((_CHANNEL,)),
+            RawContentTypes.BY_CATEGORY: _GroupBy((_CATEGORY,)),
+            RawContentTypes.BY_CHANNEL_BY_CATEGORY: _GroupBy((_CHANNEL, _CATEGORY)),
+            RawContentTypes.BY_DAY_HOUR: _GroupBy((_HOUR,)),
+            RawContentTypes.BY_DATE: _GroupBy((_DATE,), new_row=int),
+            RawContentTypes.BY_DATE_BY_CATEGORY: _GroupBy((_DATE, _CATEGORY), new_row=lambda: dict.fromkeys(categories, 0)),
+            RawContentTypes.BY_DATE_BY_CHANNEL: _GroupBy((_DATE, _CHANNEL), new_row=lambda: dict.fromkeys(channels, 0)),
+        }
+
+        dates_order = {date: index for index, date in enumerate(self.dates)}
+
+        for content_type in content_types:
+            if content_type in group_bys:
+                self._fill_group_by(report_data[content_type], group_bys[content_type], dates_order)
+
+        return report_data
+
+    def _fill_group_by(self, diagram_data: dict[str, Any], group_by: _GroupBy, dates_order: dict[str, int]) -> None:
+        grouped = Counter()
+        for cell, count in self.cells.items():
+            grouped[tuple(cell[column] for column in group_by.columns)] += count
+
+        grouped_items = grouped.items()
+        if group_by.columns[0] == _DATE:
+            grouped_items = sorted(grouped_items, key=lambda item: dates_order[item[0][0]])
+
+        for keys, count in grouped_items:
+            outer_key, *inner_keys = [str(key) for key in keys]
+
+            if group_by.new_row is not None and outer_key not in diagram_data:
+                diagram_data[outer_key] = group_by.new_row()
+
+            if inner_keys:
+                diagram_data[outer_key][inner_keys[0]] += count
+            else:
+                diagram_data[outer_key] += count
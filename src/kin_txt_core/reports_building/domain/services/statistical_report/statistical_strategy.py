@@ -1,13 +1,14 @@
-import csv
 import tempfile
-from typing import Any, TextIO
+from typing import IO, Any, Iterable
 
+from kin_txt_core.cache.predictions import AbstractPredictionCache
 from kin_txt_core.datasources.common.entities import ClassificationEntity
 from kin_txt_core.messaging import AbstractEventProducer
-from kin_txt_core.constants import DEFAULT_DATE_FORMAT
+from kin_txt_core.utils import batched
 from kin_txt_core.reports_building.domain.services.datasources.interface import IDataSourceFactory
 from kin_txt_core.reports_building.domain.services.predicting.predictor import IPredictorFactory
 from kin_txt_core.types.reports import RawContentTypes
+from kin_txt_core.reports_building.constants import ReportDataFormats
 
 from kin_txt_core.reports_building.domain.entities import (
     GenerateReportEntity,
@@ -16,7 +17,15 @@ from kin_txt_core.reports_building.domain.entities import (
 )
 from kin_txt_core.reports_building.domain.entities.generation_template_wrapper import GenerationTemplateWrapper
 from kin_txt_core.reports_building.domain.services.generate_report import IGeneratingReportsService
+from kin_txt_core.reports_building.domain.services.statistical_report.aggregation import (
+    StatisticalAggregator,
+    StatisticalPartialAggregate,
+)
 from kin_txt_core.reports_building.domain.services.statistical_report.reports_builder import StatisticalReportsBuilder
+from kin_txt_core.reports_building.domain.services.statistical_report.writers import (
+    IReportDataWriter,
+    create_report_data_writer,
+)
 from kin_txt_core.reports_building.infrastructure.services import StatisticsService, ModelTypesService
 
 
@@ -30,83 +39,108 @@ class StatisticalStrategy(IGeneratingReportsService):
         statistics_service: StatisticsService,
         predictor_factory: IPredictorFactory,
         datasource_factory: IDataSourceFactory,
+        gathering_concurrency: int = 1,
+        prediction_batch_size: int = 256,
+        prediction_workers: int = 1,
+        prediction_cache: AbstractPredictionCache | None = None,
+        upload_workers: int = 1,
+        report_data_format: ReportDataFormats = ReportDataFormats.CSV,
     ) -> None:
-        super().__init__(events_producer, model_types_service, predictor_factory, datasource_factory)
+        super().__init__(
+            events_producer,
+            model_types_service,
+            predictor_factory,
+            datasource_factory,
+            gathering_concurrency=gathering_concurrency,
+            prediction_batch_size=prediction_batch_size,
+            prediction_workers=prediction_workers,
+            prediction_cache=prediction_cache,
+            # per-day aggregates can't reproduce the uploaded per-post rows, so the report is always built from all the posts
+            aggregates_store=None,
+            upload_workers=upload_workers,
+        )
         self._statistics_service = statistics_service
+        self._report_data_format = report_data_format
 
-        self._csv_writer = None
+        self._report_data_writer: IReportDataWriter | None = None
 
     def handle_posts(
         self,
-        posts: list[ClassificationEntity],
+        posts: Iterable[ClassificationEntity],
         generate_report_wrapper: GenerationTemplateWrapper,
     ) -> dict[str, Any]:
         tmp_file = tempfile.NamedTemporaryFile()
-        with open(tmp_file.name, "w") as user_report_file:
-            self._csv_writer = csv.writer(user_report_file)
-            self._csv_writer.writerow(["date", "channel", "hour", "text", "category"])
+        self._report_data_writer = create_report_data_writer(
+            self._report_data_format,
+            tmp_file.name,
+            columns=["date", "channel", "hour", "text", "category"],
+        )
 
+        with self._report_data_writer:
             handled_data = self._handle_posts(posts, generate_report_wrapper)
 
-        with open(tmp_file.name, "r") as user_report_file:
-            self._save_data_to_file(generate_report_wrapper.generate_report_metadata.report_id, user_report_file)
+        self._upload_report_data(
+            self._save_data_to_file,
+            generate_report_wrapper.generate_report_metadata.report_id,
+            tmp_file,
+            self._report_data_writer,
+        )
             
         return handled_data
     
     def _handle_posts(
         self,
-        posts: list[ClassificationEntity],
+        posts: Iterable[ClassificationEntity],
         generate_report_wrapper: GenerationTemplateWrapper,
     ) -> dict[str, Any]:
+        partial_aggregate = self._aggregate_report(posts, generate_report_wrapper)
+
+        return self._finalize_aggregate(partial_aggregate, generate_report_wrapper)
+
+    def _initialize_aggregate(self, generate_report_wrapper: GenerationTemplateWrapper) -> StatisticalPartialAggregate:
+        return StatisticalPartialAggregate()
+
+    def _aggregate_posts(
+        self,
+        posts: Iterable[ClassificationEntity],
+        generate_report_wrapper: GenerationTemplateWrapper,
+    ) -> StatisticalPartialAggregate:
         predictor = generate_report_wrapper.predictor
+        aggregator = StatisticalAggregator()
+
+        for posts_batch in batched(posts, self._prediction_batch_size):
+            categories = predictor.predict_posts(posts_batch)
+
+            for message, category in zip(posts_batch, categories):
+                message_date_str = aggregator.add(message.created_at, message.source_link, category)
+
+                self._report_data_writer.write_row([
+                    message_date_str,
+                    message.source_link,
+                    message.created_at.hour,
+                    message.text,
+                    category,
+                ])
+
+        return aggregator.to_partial()
+
+    def _finalize_aggregate(
+        self,
+        partial_aggregate: StatisticalPartialAggregate,
+        generate_report_wrapper: GenerationTemplateWrapper,
+    ) -> dict[str, Any]:
         posts_category_list = list(generate_report_wrapper.model_metadata.category_mapping.values())
         generate_report_meta = generate_report_wrapper.generate_report_metadata
-        
+
         _data = self._initialize_report_data_dict(generate_report_wrapper)
-        
-        for message in posts:
-            source_name = message.source_link
-            message_date_str = message.created_at.date().strftime(DEFAULT_DATE_FORMAT)
-            message_hour = message.created_at.hour
-
-            category = predictor.predict_post(message)
-
-            self._csv_writer.writerow([
-                message_date_str,
-                source_name,
-                message_hour,
-                message.text,
-                category,
-            ])
-
-            _data["total_messages"] += 1
-
-            for content_type in generate_report_wrapper.visualization_template.content_types:
-                if content_type == RawContentTypes.BY_CHANNEL:
-                    _data["data"][content_type][source_name] += 1
-                elif content_type == RawContentTypes.BY_CATEGORY:
-                    _data["data"][content_type][category] += 1
-                elif content_type == RawContentTypes.BY_CHANNEL_BY_CATEGORY:
-                    _data["data"][content_type][source_name][category] += 1
-                elif content_type == RawContentTypes.BY_DAY_HOUR:
-                    _data["data"][content_type][str(message_hour)] += 1
-                elif content_type == RawContentTypes.BY_DATE:
-                    if message_date_str not in _data["data"][content_type]:
-                        _data["data"][content_type][message_date_str] = 0
-
-                    _data["data"][content_type][message_date_str] += 1
-                elif content_type == RawContentTypes.BY_DATE_BY_CATEGORY:
-                    if message_date_str not in _data["data"][content_type]:
-                        _data["data"][content_type][message_date_str] = {category: 0 for category in posts_category_list}
-
-                    _data["data"][content_type][message_date_str][category] += 1
-                elif content_type == RawContentTypes.BY_DATE_BY_CHANNEL:
-                    if message_date_str not in _data["data"][content_type]:
-                        _data["data"][content_type][message_date_str] = {
-                            _channel: 0 for _channel in generate_report_meta.channel_list
-                        }
-
-                    _data["data"][content_type][message_date_str][source_name] += 1
+
+        _data["total_messages"] = partial_aggregate.total_messages
+        partial_aggregate.build_report_data(
+            generate_report_wrapper.visualization_template.content_types,
+            _data["data"],
+            channels=generate_report_meta.channel_list,
+            categories=posts_category_list,
+        )
 
         if RawContentTypes.BY_DATE_BY_CHANNEL in generate_report_wrapper.visualization_template.content_types:
             _data["data"][RawContentTypes.BY_DATE_BY_CHANNEL] = self._reverse_dict_keys(
@@ -143,8 +177,16 @@ class StatisticalStrategy(IGeneratingReportsService):
             .build()
         )
 
-    def _save_data_to_file(self, report_id: int, file: TextIO) -> None:
-        self._statistics_service.save_report_data(report_id=report_id, data=file, file_type="csv")
+    def _save_data_to_file(self, report_id: int, tmp_file: IO, report_data_writer: IReportDataWriter) -> None:
+        compression = report_data_writer.compression
+
+        with open(tmp_file.name, "rb" if report_data_writer.is_binary else "r") as user_report_file:
+            self._statistics_service.save_report_data(
+                report_id=report_id,
+                data=user_report_file,
+                file_type=report_data_writer.file_type,
+                compression=compression.value if compression is not None else None,
+            )
 
     def _reverse_dict_keys(self, dct: dict[str, Any]) -> dict[str, Any]:
         dct_reverted_keys = list(dct.keys())[::-1]
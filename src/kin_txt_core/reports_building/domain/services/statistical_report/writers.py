@@ -0,0 +1,148 @@
+import csv
+import gzip
+from abc import ABC, abstractmethod
+from typing import Any
+
+from kin_txt_core.reports_building.constants import ReportDataFormats, ReportDataCompressions
+
+__all__ = [
+    "IReportDataWriter",
+    "CsvReportDataWriter",
+    "GzipCsvReportDataWriter",
+    "ParquetReportDataWriter",
+    "create_report_data_writer",
+]
+
+
+class IReportDataWriter(ABC):
+    file_type: str
+    compression: ReportDataCompressions | None = None
+    is_binary: bool = False
+
+    def __init__(self, file_path: str, columns: list[str]) -> None:
+        self._file_path = file_path
+        self._columns = columns
+
+    @abstractmethod
+    def write_row(self, row: list[Any]) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "IReportDataWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class CsvReportDataWriter(IReportDataWriter):
+    file_type = "csv"
+
+    _LINE_TERMINATOR = "\r\n"
+
+    def __init__(self, file_path: str, columns: list[str]) -> None:
+        super().__init__(file_path, columns)
+
+        self._file = self._open_file()
+        self._csv_writer = csv.writer(self._file, lineterminator=self._LINE_TERMINATOR)
+        self._csv_writer.writerow(columns)
+
+    def write_row(self, row: list[Any]) -> None:
+        self._csv_writer.writerow(row)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _open_file(self):
+        return open(self._file_path, "w")
+
+
+class GzipCsvReportDataWriter(CsvReportDataWriter):
+    compression = ReportDataCompressions.GZIP
+    is_binary = True
+
+    # uncompressed files are uploaded in the text mode, which turns the line endings into "\n"
+    _LINE_TERMINATOR = "\n"
+
+    def _open_file(self):
+        return gzip.open(self._file_path, "wt", encoding="utf-8")
+
+
+class ParquetReportDataWriter(IReportDataWriter):
+    # requires `pyarrow`, which is not installed with kin-txt-core
+
+    file_type = "parquet"
+    is_binary = True
+
+    _ROW_GROUP_SIZE = 50_000
+
+    def __init__(
+        self,
+        file_path: str,
+        columns: list[str],
+        dictionary_columns: tuple[str, ...] = ("date", "channel", "category"),
+    ) -> None:
+        super().__init__(file_path, columns)
+
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as error:
+            raise ImportError("pyarrow has to be installed to export report data in parquet format.") from error
+
+        self._pyarrow = pyarrow
+        self._dictionary_columns = set(dictionary_columns)
+
+        self._schema = self._build_schema()
+        self._buffered_columns: list[list[Any]] = [[] for _ in columns]
+        self._parquet_writer = pyarrow.parquet.ParquetWriter(file_path, self._schema, compression="zstd")
+
+    def write_row(self, row: list[Any]) -> None:
+        for column_values, value in zip(self._buffered_columns, row):
+            column_values.append(value)
+
+        if len(self._buffered_columns[0]) >= self._ROW_GROUP_SIZE:
+            self._flush()
+
+    def close(self) -> None:
+        if self._buffered_columns[0]:
+            self._flush()
+
+        self._parquet_writer.close()
+
+    def _flush(self) -> None:
+        pyarrow = self._pyarrow
+
+        arrays = []
+        for field, column_values in zip(self._schema, self._buffered_columns):
+            if field.name in self._dictionary_columns:
+                arrays.append(pyarrow.array(column_values, type=pyarrow.string()).dictionary_encode())
+            else:
+                arrays.append(pyarrow.array(column_values, type=field.type))
+
+        self._parquet_writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self._schema))
+        self._buffered_columns = [[] for _ in self._columns]
+
+    def _build_schema(self):
+        pyarrow = self._pyarrow
+
+        return pyarrow.schema([
+            (column, pyarrow.dictionary(pyarrow.int32(), pyarrow.string()))
+            if column in self._dictionary_columns
+            else (column, pyarrow.int8() if column == "hour" else pyarrow.string())
+            for column in self._columns
+        ])
+
+
+_REPORT_DATA_WRITERS: dict[ReportDataFormats, type[IReportDataWriter]] = {
+    ReportDataFormats.CSV: CsvReportDataWriter,
+    ReportDataFormats.CSV_GZIP: GzipCsvReportDataWriter,
+    ReportDataFormats.PARQUET: ParquetReportDataWriter,
+}
+
+
+def create_report_data_writer(report_data_format: ReportDataFormats, file_path: str, columns: list[str]) -> IReportDataWriter:
+    return _REPORT_DATA_WRITERS[report_data_format](file_path, columns)
@@ -0,0 +1,200 @@
+import json
+from collections import Counter
+from typing import Any, Callable, Iterable, Iterator
+
+from kin_txt_core.reports_building.domain.services.word_cloud.sketches import SpaceSavingCounter
+from kin_txt_core.reports_building.domain.services.word_cloud.vocabulary import Vocabulary
+
+
+class WordCloudPartialAggregate:
+    # with `rollups_from_cells` the rollups have to be filled with `derive_rollups` before they are read
+
+    _MIN_VOCABULARY_SIZE_TO_COMPACT = 10_000
+    _vocabulary_size_to_compact = _MIN_VOCABULARY_SIZE_TO_COMPACT
+
+    def __init__(
+        self,
+        total_words: int = 0,
+        total_words_frequency: Counter | None = None,
+        data_by_channel: dict[str, Counter] | None = None,
+        data_by_category: dict[str, Counter] | None = None,
+        data_by_channel_by_category: dict[str, dict[str, Counter]] | None = None,
+        counter_factory: Callable[[], Counter] = Counter,
+        vocabulary: Vocabulary | None = None,
+        rollups_from_cells: bool = False,
+    ) -> None:
+        self.counter_factory = counter_factory
+        self.vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+        self.rollups_from_cells = rollups_from_cells
+
+        self.total_words = total_words
+        self.total_words_frequency = total_words_frequency if total_words_frequency is not None else counter_factory()
+        self.data_by_channel = data_by_channel if data_by_channel is not None else {}
+        self.data_by_category = data_by_category if data_by_category is not None else {}
+        self.data_by_channel_by_category = data_by_channel_by_category if data_by_channel_by_category is not None else {}
+
+    @classmethod
+    def initialize(
+        cls,
+        channels: list[str],
+        categories: list[str],
+        counter_factory: Callable[[], Counter] = Counter,
+        rollups_from_cells: bool = False,
+    ) -> "WordCloudPartialAggregate":
+        return cls(
+            data_by_channel={channel_name: counter_factory() for channel_name in channels},
+            data_by_category={category: counter_factory() for category in categories},
+            data_by_channel_by_category={
+                channel_name: {
+                    category: counter_factory() for category in categories
+                } for channel_name in channels
+            },
+            counter_factory=counter_factory,
+            rollups_from_cells=rollups_from_cells,
+        )
+
+    def add(self, channel: str, category: str, words: Iterable[str]) -> None:
+        words_counted = self.vocabulary.count(words)
+
+        self.total_words += words_counted.total()
+        self.data_by_channel_by_category[channel][category].update(words_counted)
+
+        if not self.rollups_from_cells:
+            self.total_words_frequency.update(words_counted)
+            self.data_by_channel[channel].update(words_counted)
+            self.data_by_category[category].update(words_counted)
+
+        self._compact_vocabulary()
+
+    def merge(self, other: "WordCloudPartialAggregate") -> "WordCloudPartialAggregate":
+        ids_mapping = None if other.vocabulary is self.vocabulary else self.vocabulary.translate_ids(other.vocabulary)
+
+        self.total_words += other.total_words
+
+        for channel_name, channel_data in other.data_by_channel_by_category.items():
+            if any(channel_data.values()):
+                self._merge_counters(self.data_by_channel_by_category.setdefault(channel_name, {}), channel_data, ids_mapping)
+
+        if self.rollups_from_cells:
+            self._compact_vocabulary()
+            return self
+
+        if other.rollups_from_cells:
+            other.derive_rollups()
+
+        self.total_words_frequency.update(self._translate(other.total_words_frequency, ids_mapping))
+        self._merge_counters(self.data_by_channel, other.data_by_channel, ids_mapping)
+        self._merge_counters(self.data_by_category, other.data_by_category, ids_mapping)
+
+        self._compact_vocabulary()
+
+        return self
+
+    def derive_rollups(self) -> None:
+        self.total_words_frequency = self.counter_factory()
+        self.data_by_channel = {channel_name: self.counter_factory() for channel_name in self.data_by_channel}
+        self.data_by_category = {category: self.counter_factory() for category in self.data_by_category}
+
+        for channel_name, channel_data in self.data_by_channel_by_category.items():
+            for category, words_frequency in channel_data.items():
+                if not words_frequency:
+                    continue
+
+                self._merge_counters(self.data_by_channel, {channel_name: words_frequency}, None)
+                self._merge_counters(self.data_by_category, {category: words_frequency}, None)
+                self.total_words_frequency.update(words_frequency)
+
+    def most_common(self, words_frequency: Counter, n: int) -> list[tuple[str, int]]:
+        token = self.vocabulary.token
+        return [(token(word_id), count) for word_id, count in words_frequency.most_common(n)]
+
+    def to_dict(self) -> dict[str, Any]:
+        decode = self.vocabulary.decode
+
+        return {
+            "total_words": self.total_words,
+            "total_words_frequency": decode(self.total_words_frequency),
+            "data_by_channel": {key: decode(value) for key, value in self.data_by_channel.items()},
+            "data_by_category": {key: decode(value) for key, value in self.data_by_category.items()},
+            "data_by_channel_by_category": {
+                channel_name: {key: decode(value) for key, value in channel_data.items()}
+                for channel_name, channel_data in self.data_by_channel_by_category.items()
+            },
+        }
+
+    def iter_json(self) -> Iterator[str]:
+        # only one counter at a time is turned into strings
+        yield f'{{"total_words": {json.dumps(self.total_words)}, "total_words_frequency": '
+        yield json.dumps(self.vocabulary.decode(self.total_words_frequency))
+
+        yield ', "data_by_channel": '
+        yield from self._iter_counters_json(self.data_by_channel)
+
+        yield ', "data_by_category": '
+        yield from self._iter_counters_json(self.data_by_category)
+
+        yield ', "data_by_channel_by_category": {'
+        for index, (channel_name, channel_data) in enumerate(self.data_by_channel_by_category.items()):
+            yield f'{", " if index else ""}{json.dumps(channel_name)}: '
+            yield from self._iter_counters_json(channel_data)
+
+        yield "}}"
+
+    def _iter_counters_json(self, data: dict[str, Counter]) -> Iterator[str]:
+        yield "{"
+
+        for index, (key, words_frequency) in enumerate(data.items()):
+            yield f'{", " if index else ""}{json.dumps(key)}: {json.dumps(self.vocabulary.decode(words_frequency))}'
+
+        yield "}"
+
+    def _merge_counters(self, target: dict[str, Counter], source: dict[str, Counter], ids_mapping: list[int] | None) -> None:
+        # empty counters are skipped, so merging doesn't bring in the channels of other reports
+        for key, words_frequency in source.items():
+            if not words_frequency:
+                continue
+
+            if key not in target:
+                target[key] = self.counter_factory()
+
+            target[key].update(self._translate(words_frequency, ids_mapping))
+
+    def _compact_vocabulary(self) -> None:
+        if not isinstance(self.total_words_frequency, SpaceSavingCounter):
+            return
+
+        if len(self.vocabulary) < self._vocabulary_size_to_compact:
+            return
+
+        counters = [self.total_words_frequency, *self.data_by_channel.values(), *self.data_by_category.values()]
+        for channel_data in self.data_by_channel_by_category.values():
+            counters.extend(channel_data.values())
+
+        ids_mapping = self.vocabulary.compact(word_id for words_frequency in counters for word_id in words_frequency)
+
+        self.total_words_frequency = self._remap(self.total_words_frequency, ids_mapping)
+        self.data_by_channel = {key: self._remap(value, ids_mapping) for key, value in self.data_by_channel.items()}
+        self.data_by_category = {key: self._remap(value, ids_mapping) for key, value in self.data_by_category.items()}
+        self.data_by_channel_by_category = {
+            channel_name: {key: self._remap(value, ids_mapping) for key, value in channel_data.items()}
+            for channel_name, channel_data in self.data_by_channel_by_category.items()
+        }
+
+        self._vocabulary_size_to_compact = max(2 * len(self.vocabulary), self._MIN_VOCABULARY_SIZE_TO_COMPACT)
+
+    @staticmethod
+    def _remap(words_frequency: Counter, ids_mapping: dict[int, int]) -> Counter:
+        counts = {ids_mapping[word_id]: count for word_id, count in words_frequency.items()}
+
+        if isinstance(words_frequency, SpaceSavingCounter):
+            errors = {ids_mapping[word_id]: error for word_id, error in words_frequency.errors.items()}
+            return SpaceSavingCounter(words_frequency.capacity, counts, errors)
+
+        return Counter(counts)
+
+    @staticmethod
+    def _translate(words_frequency: Counter, ids_mapping: list[int] | None) -> Counter:
+        if ids_mapping is None:
+            return words_frequency
+
+        return Counter({ids_mapping[word_id]: count for word_id, count in words_frequency.items()})
@@ -0,0 +1,80 @@
+import heapq
+import math
+from collections import Counter
+from typing import Iterable, Mapping
+
+
+class SpaceSavingCounter(Counter):
+    # Space-Saving counts are overestimated by at most N / capacity for N counted words
+
+    def __init__(self, capacity: int, counts: Mapping[str, int] | None = None, errors: Mapping[str, int] | None = None) -> None:
+        super().__init__()
+
+        if capacity <= 0:
+            raise ValueError("SpaceSavingCounter capacity must be positive.")
+
+        self.capacity = capacity
+        self.errors: dict[str, int] = dict(errors) if errors else {}  # overestimation of the words that replaced others
+        self._min_heap: list[tuple[int, str]] | None = None  # built lazily once the counter is full
+
+        if counts:
+            self.update(counts)
+
+    @classmethod
+    def from_error_rate(cls, error_rate: float, min_capacity: int = 0) -> "SpaceSavingCounter":
+        return cls(max(math.ceil(1 / error_rate), min_capacity))
+
+    def update(self, iterable: Iterable[str] | Mapping[str, int] | None = None, /, **kwargs: int) -> None:
+        if iterable is None:
+            return
+
+        if not isinstance(iterable, Mapping):
+            iterable = Counter(iterable)
+
+        for word, count in iterable.items():
+            self._add(word, count)
+
+    def _add(self, word: str, count: int) -> None:
+        if word in self:
+            self[word] += count
+            return
+
+        if len(self) < self.capacity:
+            self[word] = count
+
+            if self._min_heap is not None:
+                heapq.heappush(self._min_heap, (count, word))
+
+            return
+
+        min_word, min_count = self._pop_min()
+
+        del self[min_word]
+        self.errors.pop(min_word, None)
+
+        self[word] = min_count + count
+        self.errors[word] = min_count
+
+        heapq.heappush(self._min_heap, (self[word], word))
+
+    def _pop_min(self) -> tuple[str, int]:
+        if self._min_heap is None:
+            self._min_heap = [(count, word) for word, count in self.items()]
+            heapq.heapify(self._min_heap)
+
+        # counts only grow, so the heap entries are refreshed lazily when they reach the top
+        while True:
+            count, word = heapq.heappop(self._min_heap)
+            actual_count = self.get(word)
+
+            if actual_count == count:
+                return word, count
+
+            if actual_count is not None:
+                heapq.heappush(self._min_heap, (actual_count, word))
+
+    def __reduce__(self):
+        return self.__class__, (self.capacity, dict(self), self.errors)
+
+    def copy(self) -> "SpaceSavingCounter":
+        return self.__class__(self.capacity, dict(self), self.errors)
@@ -0,0 +1,63 @@
+from collections import Counter
+from typing import Iterable
+
+
+class Vocabulary:
+    def __init__(self, tokens: Iterable[str] = ()) -> None:
+        self._ids: dict[str, int] = {}
+        self._tokens: list[str] = []
+
+        for token in tokens:
+            self.intern(token)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    @property
+    def tokens(self) -> list[str]:
+        return self._tokens
+
+    def intern(self, token: str) -> int:
+        token_id = self._ids.get(token)
+
+        if token_id is None:
+            token_id = self._ids[token] = len(self._tokens)
+            self._tokens.append(token)
+
+        return token_id
+
+    def token(self, token_id: int) -> str:
+        return self._tokens[token_id]
+
+    def count(self, tokens: Iterable[str]) -> Counter:
+        intern = self.intern
+        return Counter({intern(token): count for token, count in Counter(tokens).items()})
+
+    def decode(self, counter: Counter) -> Counter:
+        tokens = self._tokens
+        return Counter({tokens[token_id]: count for token_id, count in counter.items()})
+
+    def translate_ids(self, other: "Vocabulary") -> list[int]:
+        intern = self.intern
+        return [intern(token) for token in other.tokens]
+
+    def compact(self, live_ids: Iterable[int]) -> dict[int, int]:
+        # counters keyed by the old ids have to be translated with the returned mapping
+        ids_mapping: dict[int, int] = {}
+        tokens: list[str] = []
+
+        for token_id in sorted(set(live_ids)):
+            ids_mapping[token_id] = len(tokens)
+            tokens.append(self._tokens[token_id])
+
+        self._tokens = tokens
+        self._ids = {token: token_id for token_id, token in enumerate(tokens)}
+
+        return ids_mapping
+
+    def __getstate__(self) -> list[str]:
+        return self._tokens
+
+    def __setstate__(self, tokens: list[str]) -> None:
+        self._tokens = tokens
+        self._ids = {token: token_id for token_id, token in enumerate(tokens)}
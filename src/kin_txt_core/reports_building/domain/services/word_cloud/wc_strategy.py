@@ -1,15 +1,22 @@
-import json
+import gzip
+import functools
 import tempfile
 from collections import Counter
-from typing import Any
+from typing import Any, Iterable
 
+from kin_txt_core.cache.aggregates import AbstractAggregatesStore
+from kin_txt_core.cache.predictions import AbstractPredictionCache
 from kin_txt_core.datasources.common.entities import ClassificationEntity
 from kin_txt_core.messaging import AbstractEventProducer
+from kin_txt_core.utils import batched
+from kin_txt_core.reports_building.constants import ReportDataCompressions
 from kin_txt_core.reports_building.domain.entities import WordCloudReport
 from kin_txt_core.reports_building.domain.entities.generation_template_wrapper import GenerationTemplateWrapper
 from kin_txt_core.reports_building.domain.services.datasources.interface import IDataSourceFactory
 from kin_txt_core.reports_building.domain.services.generate_report import IGeneratingReportsService
 from kin_txt_core.reports_building.domain.services.predicting.predictor import IPredictorFactory
+from kin_txt_core.reports_building.domain.services.word_cloud.aggregation import WordCloudPartialAggregate
+from kin_txt_core.reports_building.domain.services.word_cloud.sketches import SpaceSavingCounter
 from kin_txt_core.reports_building.domain.services.word_cloud.reports_builder import (
     WordCloudReportsBuilder,
 )
@@ -27,50 +34,89 @@ class WordCloudStrategy(IGeneratingReportsService):
         statistics_service: StatisticsService,
         predictor_factory: IPredictorFactory,
         datasource_factory: IDataSourceFactory,
+        gathering_concurrency: int = 1,
+        prediction_batch_size: int = 256,
+        prediction_workers: int = 1,
+        prediction_cache: AbstractPredictionCache | None = None,
+        aggregates_store: AbstractAggregatesStore | None = None,
+        upload_workers: int = 1,
+        sketch_error_rate: float | None = None,
+        rollups_from_cells: bool = False,
+        report_data_compression: ReportDataCompressions | None = None,
     ) -> None:
-        super().__init__(events_producer, model_types_service, predictor_factory, datasource_factory)
+        super().__init__(
+            events_producer,
+            model_types_service,
+            predictor_factory,
+            datasource_factory,
+            gathering_concurrency=gathering_concurrency,
+            prediction_batch_size=prediction_batch_size,
+            prediction_workers=prediction_workers,
+            prediction_cache=prediction_cache,
+            aggregates_store=aggregates_store,
+            upload_workers=upload_workers,
+        )
         self._statistics_service = statistics_service
+        self._rollups_from_cells = rollups_from_cells
+        self._report_data_compression = report_data_compression
+
+        # approximate counting keeps O(1 / error rate) words per cell instead of the whole vocabulary
+        self._counter_factory = Counter
+        if sketch_error_rate is not None:
+            self._counter_factory = functools.partial(
+                SpaceSavingCounter.from_error_rate,
+                sketch_error_rate,
+                min_capacity=self._MAX_MOST_COMMON_WORDS,
+            )
 
     def handle_posts(
         self,
-        posts: list[ClassificationEntity],
+        posts: Iterable[ClassificationEntity],
         generate_report_wrapper: GenerationTemplateWrapper,
     ) -> dict[str, Any]:
-        generate_report_meta = generate_report_wrapper.generate_report_metadata
-        predictor = generate_report_wrapper.predictor
-
-        _data = self._initialize_data(
-            channels=generate_report_meta.channel_list,
-            categories=[category for category in generate_report_wrapper.model_metadata.category_mapping.values()],
-        )
+        partial_aggregate = self._aggregate_report(posts, generate_report_wrapper)
 
-        for message in posts:
-            source_name = message.source_link
-            message_text_preprocessed = predictor.preprocess_text(message.text)
+        if partial_aggregate.rollups_from_cells:
+            partial_aggregate.derive_rollups()
 
-            category = predictor.predict_post(message)
-
-            message_words = message_text_preprocessed.split()
-            words_counted = Counter(message_words)
-
-            _data["total_words"] += len(message_words)
+        # the aggregate is only read from now on, so it's encoded and uploaded while the report is built
+        self._upload_report_data(
+            self._save_word_cloud_data_to_file,
+            generate_report_wrapper.generate_report_metadata.report_id,
+            partial_aggregate,
+        )
 
-            _data["total_words_frequency"].update(words_counted)
+        return self._finalize_aggregate(partial_aggregate)
 
-            _data["data_by_channel"][source_name].update(words_counted)
+    def _aggregate_posts(
+        self,
+        posts: Iterable[ClassificationEntity],
+        generate_report_wrapper: GenerationTemplateWrapper,
+    ) -> WordCloudPartialAggregate:
+        predictor = generate_report_wrapper.predictor
+        partial_aggregate = self._initialize_aggregate(generate_report_wrapper)
 
-            _data["data_by_category"][category].update(words_counted)
+        for posts_batch in batched(posts, self._prediction_batch_size):
+            preprocessed_posts = predictor.preprocess_and_predict_posts(posts_batch)
 
-            _data["data_by_channel_by_category"][source_name][category].update(words_counted)
+            for message, (message_text_preprocessed, category) in zip(posts_batch, preprocessed_posts):
+                partial_aggregate.add(message.source_link, category, message_text_preprocessed.split())
 
-        self._save_word_cloud_data_to_file(generate_report_meta.report_id, _data)
+        return partial_aggregate
 
+    def _finalize_aggregate(self, partial_aggregate: WordCloudPartialAggregate) -> dict[str, Any]:
         return {
-            "total_words": _data["total_words"],
-            "data_by_channel_by_category": self._truncate_only_most_popular_words(_data["data_by_channel_by_category"]),
-            "data_by_category": self._truncate_only_most_popular_words(_data["data_by_category"]),
-            "data_by_channel": self._truncate_only_most_popular_words(_data["data_by_channel"]),
-            "total_words_frequency": _data["total_words_frequency"].most_common(self._MAX_MOST_COMMON_WORDS),
+            "total_words": partial_aggregate.total_words,
+            "data_by_channel_by_category": self._truncate_only_most_popular_words(
+                partial_aggregate.data_by_channel_by_category,
+                partial_aggregate,
+            ),
+            "data_by_category": self._truncate_only_most_popular_words(partial_aggregate.data_by_category, partial_aggregate),
+            "data_by_channel": self._truncate_only_most_popular_words(partial_aggregate.data_by_channel, partial_aggregate),
+            "total_words_frequency": partial_aggregate.most_common(
+                partial_aggregate.total_words_frequency,
+                self._MAX_MOST_COMMON_WORDS,
+            ),
         }
 
     def build_report(
@@ -91,42 +137,41 @@ class WordCloudStrategy(IGeneratingReportsService):
             .build()
         )
 
-    def _save_word_cloud_data_to_file(self, report_id: int, _data: dict[str, int]) -> None:
+    def _save_word_cloud_data_to_file(self, report_id: int, partial_aggregate: WordCloudPartialAggregate) -> None:
         tmp_file = tempfile.NamedTemporaryFile()
+        is_compressed = self._report_data_compression == ReportDataCompressions.GZIP
 
-        with open(tmp_file.name, "w") as file:
-            encoded_data = json.dumps(_data)
-            file.write(encoded_data)
+        with gzip.open(tmp_file.name, "wt", encoding="utf-8") if is_compressed else open(tmp_file.name, "w") as file:
+            file.writelines(partial_aggregate.iter_json())
 
-        with open(tmp_file.name, "r") as file:
-            self._statistics_service.save_report_data(report_id=report_id, data=file, file_type="json")
+        with open(tmp_file.name, "rb" if is_compressed else "r") as file:
+            self._statistics_service.save_report_data(
+                report_id=report_id,
+                data=file,
+                file_type="json",
+                compression=self._report_data_compression.value if is_compressed else None,
+            )
 
-    def _truncate_only_most_popular_words(self, data: dict[str, Any]) -> dict[str, Any]:
+    def _truncate_only_most_popular_words(
+        self,
+        data: dict[str, Any],
+        partial_aggregate: WordCloudPartialAggregate,
+    ) -> dict[str, Any]:
         result_data: dict[str, Any] = {}
 
         for key, word_freq in data.items():
             if isinstance(word_freq, Counter):
-                result_data[key] = word_freq.most_common(self._MAX_MOST_COMMON_WORDS)
+                result_data[key] = partial_aggregate.most_common(word_freq, self._MAX_MOST_COMMON_WORDS)
                 continue
 
-            result_data[key] = self._truncate_only_most_popular_words(word_freq)
+            result_data[key] = self._truncate_only_most_popular_words(word_freq, partial_aggregate)
 
         return result_data
 
-    @staticmethod
-    def _initialize_data(channels: list[str], categories: list[str]) -> dict[str, Any]:
-        return {
-            "total_words": 0,
-            "total_words_frequency": Counter(),
-            "data_by_channel": {
-                channel_name: Counter() for channel_name in channels
-            },
-            "data_by_category": {
-                category: Counter() for category in categories
-            },
-            "data_by_channel_by_category": {
-                channel_name: {
-                    category: Counter() for category in categories
-                } for channel_name in channels
-            },
-        }
+    def _initialize_aggregate(self, generate_report_wrapper: GenerationTemplateWrapper) -> WordCloudPartialAggregate:
+        return WordCloudPartialAggregate.initialize(
+            channels=generate_report_wrapper.generate_report_metadata.channel_list,
+            categories=[category for category in generate_report_wrapper.model_metadata.category_mapping.values()],
+            counter_factory=self._counter_factory,
+            rollups_from_cells=self._rollups_from_cells,
+        )
@@ -1,48 +1,29 @@
-from typing import Any
+from typing import Iterable
 
 from kin_txt_core.datasources.common.entities import ClassificationEntity
+from kin_txt_core.utils import batched
 from kin_txt_core.reports_building.domain.entities.generation_template_wrapper import GenerationTemplateWrapper
+from kin_txt_core.reports_building.domain.services.word_cloud.aggregation import WordCloudPartialAggregate
 from kin_txt_core.reports_building.domain.services.word_cloud.wc_strategy import WordCloudStrategy
 
 
 class BuildWordCloudTokenClassificationStrategy(WordCloudStrategy):
-    def handle_posts(
+    def _aggregate_posts(
         self,
-        posts: list[ClassificationEntity],
+        posts: Iterable[ClassificationEntity],
         generate_report_wrapper: GenerationTemplateWrapper,
-    ) -> dict[str, Any]:
-        generate_report_meta = generate_report_wrapper.generate_report_metadata
+    ) -> WordCloudPartialAggregate:
         predictor = generate_report_wrapper.predictor
+        partial_aggregate = self._initialize_aggregate(generate_report_wrapper)
 
-        _data = self._initialize_data(
-            channels=generate_report_meta.channel_list,
-            categories=[category for category in generate_report_wrapper.model_metadata.category_mapping.values()],
-        )
+        for posts_batch in batched(posts, self._prediction_batch_size):
+            posts_tokens_categories: list[dict[str, list[str]]] = predictor.predict_posts_tokens(posts_batch)
 
-        for message in posts:
-            source_name = message.source_link
+            for message, words_to_category_mapping in zip(posts_batch, posts_tokens_categories):
+                for category, word_list in words_to_category_mapping.items():
+                    if not category:  # usually if category is not recognized it's empty
+                        continue
 
-            words_to_category_mapping: dict[str, list[str]] = predictor.predict_post_tokens(message)
+                    partial_aggregate.add(message.source_link, category, word_list)  # for each token was recognized
 
-            for category, word_list in words_to_category_mapping.items():
-                if not category:  # usually if category is not recognized it's empty
-                    continue
-
-                _data["total_words"] += len(word_list)  # for each token was recognized
-
-                _data["total_words_frequency"].update(word_list)
-
-                _data["data_by_channel"][source_name].update(word_list)
-
-                _data["data_by_category"][category].update(word_list)
-                _data["data_by_channel_by_category"][source_name][category].update(word_list)
-
-        self._save_word_cloud_data_to_file(generate_report_meta.report_id, _data)
-
-        return {
-            "total_words": _data["total_words"],
-            "data_by_channel_by_category": self._truncate_only_most_popular_words(_data["data_by_channel_by_category"]),
-            "data_by_category": self._truncate_only_most_popular_words(_data["data_by_category"]),
-            "data_by_channel": self._truncate_only_most_popular_words(_data["data_by_channel"]),
-            "total_words_frequency": _data["total_words_frequency"].most_common(self._MAX_MOST_COMMON_WORDS),
-        }
+        return partial_aggregate
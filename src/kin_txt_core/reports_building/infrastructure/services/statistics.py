@@ -1,25 +1,137 @@
-from typing import Optional, TextIO
+import io
+import os
+import time
+import uuid
+import hashlib
+from typing import BinaryIO, Iterator, Optional, TextIO
 
-from requests import JSONDecodeError
+from requests import JSONDecodeError, RequestException, Response
 
 from kin_txt_core.service_proxy import ServiceProxy, ServiceProxyError
 
 
 class StatisticsService(ServiceProxy):
-    def __init__(self, url: str, kin_token: Optional[str] = None, jwt_token: Optional[str] = None) -> None:
+    _COMPRESSED_FILE_EXTENSIONS = {'gzip': 'gz'}
+
+    _PART_UPLOAD_ATTEMPTS = 4
+    _PART_UPLOAD_BACKOFF_SECONDS = 0.5
+
+    def __init__(
+        self,
+        url: str,
+        kin_token: Optional[str] = None,
+        jwt_token: Optional[str] = None,
+        upload_part_size: Optional[int] = None,
+    ) -> None:
         super().__init__(jwt_token=jwt_token, kin_token=kin_token)
         self._base_url = url
+        self._upload_part_size = upload_part_size
 
-    def save_report_data(self, report_id: int, file_type: str, data: TextIO) -> None:
+    def save_report_data(
+        self,
+        report_id: int,
+        file_type: str,
+        data: TextIO | BinaryIO,
+        compression: Optional[str] = None,
+    ) -> None:
         self._logger.info(f'Saving data for processed report={report_id} in statistics service...')
 
+        if self._upload_part_size:
+            self._save_report_data_in_parts(report_id, file_type, data, compression)
+            return
+
         target_url = f'{self._base_url}/reports-data/save'
+
+        if compression is None:
+            response = self._session.post(
+                url=target_url,
+                files={'report_data_file': data},
+                data={'report_id': report_id, 'file_type': file_type},
+            )
+        else:
+            # compressed files are streamed from the disk instead of being encoded into the request body in memory
+            body = _MultipartFileBody(
+                fields={'report_id': report_id, 'file_type': file_type, 'compression': compression},
+                file_field='report_data_file',
+                file_name=f'report_data.{file_type}.{self._COMPRESSED_FILE_EXTENSIONS.get(compression, compression)}',
+                file=self._as_binary_file(data),
+            )
+
+            response = self._session.post(url=target_url, data=body, headers={'Content-Type': body.content_type})
+
+        self._check_response(response, target_url)
+
+    def _save_report_data_in_parts(
+        self,
+        report_id: int,
+        file_type: str,
+        data: TextIO | BinaryIO,
+        compression: Optional[str],
+    ) -> None:
+        target_url = f'{self._base_url}/reports-data/uploads'
         response = self._session.post(
             url=target_url,
-            files={'report_data_file': data},
-            data={'report_id': report_id, 'file_type': file_type},
+            json={'report_id': report_id, 'file_type': file_type, 'compression': compression},
         )
+        self._check_response(response, target_url)
+
+        upload_id = response.json()['upload_id']
+        file_checksum = hashlib.sha256()
+        parts = []
 
+        for part_number, part in enumerate(self._iter_parts(self._as_binary_file(data)), start=1):
+            part_checksum = hashlib.sha256(part).hexdigest()
+            file_checksum.update(part)
+
+            self._upload_part(upload_id, part_number, part, part_checksum)
+            parts.append({'part_number': part_number, 'sha256': part_checksum})
+
+        target_url = f'{self._base_url}/reports-data/uploads/{upload_id}/complete'
+        response = self._session.post(url=target_url, json={'parts': parts, 'sha256': file_checksum.hexdigest()})
+        self._check_response(response, target_url)
+
+        self._logger.info(f'[StatisticsService] Report={report_id} data uploaded in {len(parts)} parts.')
+
+    def _upload_part(self, upload_id: str, part_number: int, part: bytes, part_checksum: str) -> None:
+        target_url = f'{self._base_url}/reports-data/uploads/{upload_id}/parts/{part_number}'
+
+        for attempt in range(1, self._PART_UPLOAD_ATTEMPTS + 1):
+            try:
+                response = self._session.put(
+                    url=target_url,
+                    data=part,
+                    headers={'Content-Type': 'application/octet-stream', 'X-Content-SHA256': part_checksum},
+                )
+            except RequestException as error:
+                failure = f'{error.__class__.__name__}: {error}'
+            else:
+                # client errors other than a checksum mismatch won't be fixed by sending the part again
+                if response.ok or (400 <= response.status_code < 500 and response.status_code != 422):
+                    self._check_response(response, target_url)
+                    return
+
+                failure = f'status {response.status_code}'
+
+            self._logger.warning(
+                f'[StatisticsService] Uploading part {part_number} of {upload_id} failed with {failure},'
+                f' attempt {attempt} of {self._PART_UPLOAD_ATTEMPTS}.'
+            )
+
+            if attempt < self._PART_UPLOAD_ATTEMPTS:
+                time.sleep(self._PART_UPLOAD_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+        raise ServiceProxyError(f'Uploading part {part_number} to {target_url} failed {self._PART_UPLOAD_ATTEMPTS} times')
+
+    def _iter_parts(self, data: BinaryIO) -> Iterator[bytes]:
+        while part := data.read(self._upload_part_size):
+            yield part
+
+    @staticmethod
+    def _as_binary_file(data: TextIO | BinaryIO) -> BinaryIO:
+        # parts and lengths are counted in bytes, so text files are read through their underlying binary buffer
+        return data.buffer if isinstance(data, io.TextIOBase) else data
+
+    def _check_response(self, response: Response, target_url: str) -> None:
         if not response.ok:
             try:
                 message = response.json()
@@ -32,3 +144,50 @@ class StatisticsService(ServiceProxy):
             )
 
             raise ServiceProxyError(f'Request to {target_url} failed with status: {response.status_code}')
+
+
+class _MultipartFileBody:
+    # the file is streamed in chunks, with the length known up front
+
+    _CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, fields: dict[str, object], file_field: str, file_name: str, file: BinaryIO) -> None:
+        boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+
+        head = b''.join(
+            (
+                f'--{boundary}\r\n'
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f'{value}\r\n'
+            ).encode()
+            for name, value in fields.items()
+        )
+        head += (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{file_name}"\r\n'
+            f'Content-Type: application/octet-stream\r\n\r\n'
+        ).encode()
+
+        self._head = head
+        self._tail = f'\r\n--{boundary}--\r\n'.encode()
+        self._file = file
+        self._file_size = os.fstat(file.fileno()).st_size - file.tell()
+        self._chunks = self._iter_chunks()
+
+    def __len__(self) -> int:
+        return len(self._head) + self._file_size + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._chunks
+
+    def read(self, size: int = -1) -> bytes:
+        return next(self._chunks, b'')
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        yield self._head
+
+        while chunk := self._file.read(self._CHUNK_SIZE):
+            yield chunk
+
+        yield self._tail
@@ -1,6 +1,8 @@
 from pydantic import Field, ConfigDict
 from pydantic_settings import BaseSettings
 
+from kin_txt_core.reports_building.constants import ReportDataCompressions, ReportDataFormats
+
 
 class TelegramSettings(BaseSettings):
     api_id: int = Field(..., validation_alias="TELEGRAM_API_ID")
@@ -17,6 +19,33 @@ class Settings(BaseSettings):
     rabbitmq_connection_string: str = Field(..., validation_alias="RABBITMQ_CONNECTION_STRING")
     model_types_service_url: str = Field(..., validation_alias="MODEL_TYPES_SERVICE_URL")
 
+    statistics_upload_part_size: int | None = Field(None, validation_alias="STATISTICS_UPLOAD_PART_SIZE")
+
     rabbitmq_queue_name: str | None = Field(None, validation_alias="RABBITMQ_QUEUE_NAME")
 
+    datasource_pooling: bool = Field(False, validation_alias="DATASOURCE_POOLING")
+    telegram_keep_alive_session: bool = Field(False, validation_alias="TELEGRAM_KEEP_ALIVE_SESSION")
+    gathering_concurrency: int = Field(1, validation_alias="REPORTS_GATHERING_CONCURRENCY")
+    prediction_batch_size: int = Field(256, validation_alias="PREDICTION_BATCH_SIZE")
+    prediction_workers: int = Field(1, validation_alias="PREDICTION_WORKERS")
+
+    prediction_cache_size: int = Field(0, validation_alias="PREDICTION_CACHE_SIZE")
+    prediction_cache_redis_url: str | None = Field(None, validation_alias="PREDICTION_CACHE_REDIS_URL")
+    prediction_cache_ttl_seconds: int | None = Field(7 * 24 * 60 * 60, validation_alias="PREDICTION_CACHE_TTL_SECONDS")
+
+    # every word cloud counter keeps at most 1 / error rate words, and the vocabulary about twice as many as all the counters
+    word_cloud_sketch_error_rate: float | None = Field(None, validation_alias="WORD_CLOUD_SKETCH_ERROR_RATE")
+    word_cloud_rollups_from_cells: bool = Field(False, validation_alias="WORD_CLOUD_ROLLUPS_FROM_CELLS")
+
+    report_data_upload_workers: int = Field(1, validation_alias="REPORT_DATA_UPLOAD_WORKERS")
+    report_data_compression: ReportDataCompressions | None = Field(None, validation_alias="REPORT_DATA_COMPRESSION")
+    statistical_report_data_format: ReportDataFormats = Field(
+        ReportDataFormats.CSV,
+        validation_alias="STATISTICAL_REPORT_DATA_FORMAT",
+    )
+
+    # word cloud reports only, statistical reports upload the per-post rows, which are not stored
+    report_aggregates_store_path: str | None = Field(None, validation_alias="REPORT_AGGREGATES_STORE_PATH")
+    datasource_cache_path: str | None = Field(None, validation_alias="DATASOURCE_CACHE_PATH")
+
     model_config = ConfigDict(protected_namespaces=("settings_",))
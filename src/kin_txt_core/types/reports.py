@@ -29,19 +29,19 @@ class DiagramTypes(str, Enum):
 
 
 class VisualizationDiagramTypes(str, Enum):
-    BY_CATEGORY__PIE = f"{RawContentTypes.BY_CATEGORY}__{DiagramTypes.PIE}"
-    BY_CHANNEL__PIE = f"{RawContentTypes.BY_CHANNEL}__{DiagramTypes.PIE}"
-    BY_CHANNEL_PLUS_BY_CATEGORY__PIE = f"{RawContentTypes.BY_CHANNEL}+{RawContentTypes.BY_CATEGORY}__{DiagramTypes.TWO_LEVEL_PIE}"
+    BY_CATEGORY__PIE = f"{RawContentTypes.BY_CATEGORY.value}__{DiagramTypes.PIE.value}"
+    BY_CHANNEL__PIE = f"{RawContentTypes.BY_CHANNEL.value}__{DiagramTypes.PIE.value}"
+    BY_CHANNEL_PLUS_BY_CATEGORY__PIE = f"{RawContentTypes.BY_CHANNEL.value}+{RawContentTypes.BY_CATEGORY.value}__{DiagramTypes.TWO_LEVEL_PIE.value}"
 
-    BY_CATEGORY__BAR = f"{RawContentTypes.BY_CATEGORY}__{DiagramTypes.BAR}"
-    BY_CHANNEL__BAR = f"{RawContentTypes.BY_CHANNEL}__{DiagramTypes.BAR}"
-    BY_HOUR__BAR = f"{RawContentTypes.BY_DAY_HOUR}__{DiagramTypes.BAR}"
-    BY_CHANNEL_BY_CATEGORY_STACKED_BAR = f"{RawContentTypes.BY_CHANNEL_BY_CATEGORY}__{DiagramTypes.STACKED_BAR}"
+    BY_CATEGORY__BAR = f"{RawContentTypes.BY_CATEGORY.value}__{DiagramTypes.BAR.value}"
+    BY_CHANNEL__BAR = f"{RawContentTypes.BY_CHANNEL.value}__{DiagramTypes.BAR.value}"
+    BY_HOUR__BAR = f"{RawContentTypes.BY_DAY_HOUR.value}__{DiagramTypes.BAR.value}"
+    BY_CHANNEL_BY_CATEGORY_STACKED_BAR = f"{RawContentTypes.BY_CHANNEL_BY_CATEGORY.value}__{DiagramTypes.STACKED_BAR.value}"
 
-    BY_DATE_LINE = f"{RawContentTypes.BY_DATE}__{DiagramTypes.LINE}"
-    BY_DATE_BY_CATEGORY_MULTI_LINE = f"{RawContentTypes.BY_DATE_BY_CATEGORY}__{DiagramTypes.MULTI_LINE}"
-    BY_DATE_BY_CHANNEL_MULTI_LINE = f"{RawContentTypes.BY_DATE_BY_CHANNEL}__{DiagramTypes.MULTI_LINE}"
+    BY_DATE_LINE = f"{RawContentTypes.BY_DATE.value}__{DiagramTypes.LINE.value}"
+    BY_DATE_BY_CATEGORY_MULTI_LINE = f"{RawContentTypes.BY_DATE_BY_CATEGORY.value}__{DiagramTypes.MULTI_LINE.value}"
+    BY_DATE_BY_CHANNEL_MULTI_LINE = f"{RawContentTypes.BY_DATE_BY_CHANNEL.value}__{DiagramTypes.MULTI_LINE.value}"
 
-    BY_DATE_BY_CATEGORY_MULTI_AREA = f"{RawContentTypes.BY_DATE_BY_CATEGORY}__{DiagramTypes.MULTI_AREA}"
+    BY_DATE_BY_CATEGORY_MULTI_AREA = f"{RawContentTypes.BY_DATE_BY_CATEGORY.value}__{DiagramTypes.MULTI_AREA.value}"
 
-    BY_CATEGORY_RADAR = f"{RawContentTypes.BY_CATEGORY}__{DiagramTypes.RADAR}"
+    BY_CATEGORY_RADAR = f"{RawContentTypes.BY_CATEGORY.value}__{DiagramTypes.RADAR.value}"
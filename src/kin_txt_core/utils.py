@@ -1,4 +1,6 @@
-from typing import Any
+from typing import Any, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
 
 
 def pydantic_errors_prettifier(errors: list[dict[str, Any]]) -> list[str]:
@@ -17,3 +19,20 @@ def pydantic_errors_prettifier(errors: list[dict[str, Any]]) -> list[str]:
         prettified_errors.append(f"{error_fields_string}: {error_msg}")
 
     return prettified_errors
+
+
+def batched(iterable: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least one")
+
+    batch: list[T] = []
+
+    for item in iterable:
+        batch.append(item)
+
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
@@ -0,0 +1,17 @@
+import os
+
+# settings of the reports building are read from the environment when the services are created
+for name, value in {
+    "SECRET_KEY": "secret",
+    "KIN_TOKEN": "token",
+    "STATISTICS_SERVICE_URL": "http://statistics.local",
+    "RABBITMQ_CONNECTION_STRING": "amqp://localhost",
+    "MODEL_TYPES_SERVICE_URL": "http://model-types.local",
+    "TELEGRAM_API_ID": "1",
+    "TELEGRAM_API_HASH": "hash",
+    "TELEGRAM_SESSION_STRING": "",
+    "REDDIT_CLIENT_ID": "client",
+    "REDDIT_CLIENT_SECRET": "secret",
+    "REDDIT_USER_AGENT": "kin-txt-tests",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,394 @@
+import asyncio
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Iterator
+from unittest import mock
+
+from telethon.errors import FloodWaitError
+
+from kin_txt_core.datasources.common.entities import ClassificationEntity, DatasourceLink
+from kin_txt_core.datasources.common.interface import IDataSource
+from kin_txt_core.datasources.common.utils import to_aware_utc
+from kin_txt_core.exceptions import InvalidChannelURLError
+from kin_txt_core.reports_building.domain.entities import GenerateReportEntity
+from kin_txt_core.reports_building.domain.services.datasources.interface import IDataSourceFactory
+from kin_txt_core.datasources.telegram.client import TelegramDatasource
+from kin_txt_core.reports_building.domain.services.predicting.predictor import IPredictor, IPredictorFactory
+from kin_txt_core.types.reports import VisualizationDiagramTypes
+
+CATEGORY_MAPPING = {"0": "war", "1": "sport", "2": "other"}
+WORDS = "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu".split()
+LATEST_POST_DATE = datetime(2024, 3, 20, 12, tzinfo=timezone.utc)
+
+
+def make_posts(channel: str, count: int = 300, latest: datetime = LATEST_POST_DATE) -> list[ClassificationEntity]:
+    """Posts of the channel, the newest first, as datasources yield them."""
+
+    random_generator = random.Random(channel)
+    created_at = latest
+    posts = []
+
+    for _ in range(count):
+        created_at -= timedelta(minutes=random_generator.randint(10, 200))
+        text = " ".join(random_generator.choice(WORDS) for _ in range(random_generator.randint(1, 12)))
+        posts.append(ClassificationEntity(text=text, created_at=created_at, source_link=channel))
+
+    return posts
+
+
+class FakeDataSource(IDataSource):
+    """Serves `channels` posts, filtered by the requested window the way the real datasources filter them."""
+
+    def __init__(self, channels: dict[str, list[ClassificationEntity]]) -> None:
+        self.channels = channels
+        self.requests: list[DatasourceLink] = []
+        self._lock = threading.Lock()
+
+    def fetch_data(self, source: DatasourceLink) -> list[ClassificationEntity]:
+        with self._lock:
+            self.requests.append(source)
+
+        if source.source_link not in self.channels:
+            raise InvalidChannelURLError(f"Channel {source.source_link} does not exist")
+
+        earliest_date, offset_date = to_aware_utc(source.earliest_date), to_aware_utc(source.offset_date)
+
+        return [
+            post for post in self.channels[source.source_link]
+            if (earliest_date is None or to_aware_utc(post.created_at) >= earliest_date)
+            and (offset_date is None or to_aware_utc(post.created_at) <= offset_date)
+        ]
+
+
+def make_telegram_history(channel: str, count: int = 1000, latest: datetime = LATEST_POST_DATE) -> list[SimpleNamespace]:
+    """Telegram messages of the channel, the newest first, every tenth of them without text."""
+
+    return [
+        SimpleNamespace(
+            id=count - index,
+            date=latest - timedelta(minutes=37 * (index + 1)),
+            text=f"{channel} {index}" if index % 10 else "",
+        )
+        for index in range(count)
+    ]
+
+
+class FakeTelegramClient:
+    """
+    Mimics the parts of `TelegramClient` used by `TelegramDatasource` over in-memory channels histories.
+
+    Like telethon, the client refuses to run on another event loop than its own.
+    `flooded` channels raise `FloodWaitError`, the requests with numbers in `failing_requests` lose the connection.
+    """
+
+    def __init__(
+        self,
+        channels: dict[str, list[SimpleNamespace]],
+        flooded: dict[str, int] | None = None,
+        failing_requests: set[int] | None = None,
+    ) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.channels = channels
+        self.flooded = flooded or {}
+        self.failing_requests = failing_requests or set()
+
+        self.connected = False
+        self.connects = 0
+        self.requests = 0
+        self.threads: set[int] = set()
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def start(self):
+        return self._sync(self._connect())
+
+    def disconnect(self):
+        return self._sync(self._disconnect())
+
+    def __enter__(self) -> "FakeTelegramClient":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.disconnect()
+
+    async def __aenter__(self) -> "FakeTelegramClient":
+        await self._connect()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self._disconnect()
+
+    async def __call__(self, request) -> SimpleNamespace:
+        self._check_request()
+
+        if request.channel not in self.channels:
+            raise ValueError(f"No channel {request.channel}")
+
+        return SimpleNamespace(
+            chats=[SimpleNamespace(username=request.channel, title=request.channel)],
+            full_chat=SimpleNamespace(about="", participants_count=5),
+        )
+
+    async def get_messages(
+        self,
+        channel_link: str,
+        limit: int,
+        offset_date: datetime | None = None,
+        offset_id: int = 0,
+        reverse: bool = False,
+        min_id: int = 0,
+    ) -> list[SimpleNamespace]:
+        self._check_request()
+        await asyncio.sleep(0)
+
+        if channel_link in self.flooded:
+            raise FloodWaitError(request=None, capture=self.flooded[channel_link])
+
+        messages = [
+            message for message in self.channels[channel_link]
+            if (offset_date is None or (message.date > offset_date if reverse else message.date < offset_date))
+            and (not offset_id or (message.id > offset_id if reverse else message.id < offset_id))
+            and message.id > min_id
+        ]
+
+        return (messages[::-1] if reverse else messages)[:limit]
+
+    async def _connect(self) -> None:
+        self._check_loop()
+
+        if not self.connected:
+            self.connects += 1
+            self.connected = True
+
+    async def _disconnect(self) -> None:
+        self._check_loop()
+        self.connected = False
+
+    def _sync(self, coroutine):
+        if self.loop.is_running():
+            return coroutine
+
+        return self.loop.run_until_complete(coroutine)
+
+    def _check_request(self) -> None:
+        self._check_loop()
+
+        if not self.connected:
+            raise ConnectionError("Cannot send requests while disconnected")
+
+        self.requests += 1
+
+        if self.requests in self.failing_requests:
+            self.connected = False
+            raise ConnectionError("Connection to Telegram failed")
+
+    def _check_loop(self) -> None:
+        if asyncio.get_running_loop() is not self.loop:
+            raise RuntimeError("The asyncio event loop must not change after connection")
+
+        self.threads.add(threading.get_ident())
+
+
+def make_telegram_datasource(client: FakeTelegramClient, **kwargs: Any) -> TelegramDatasource:
+    """Datasource connecting the fake client, every initialization of the client returns the same one."""
+
+    datasource = TelegramDatasource(session_str="", api_id=1, api_hash="hash", **kwargs)
+    datasource._initialize_client = lambda: client
+
+    return datasource
+
+
+def make_reddit_submissions(subreddit: str, count: int = 250, latest: datetime = LATEST_POST_DATE) -> list[SimpleNamespace]:
+    """Reddit submissions of the subreddit, the newest first, as the `new` listing returns them."""
+
+    return [
+        SimpleNamespace(
+            fullname=f"t3_{subreddit}{count - index}",
+            title=f"{subreddit} {index}",
+            selftext="",
+            created_utc=(latest - timedelta(minutes=53 * (index + 1))).timestamp(),
+        )
+        for index in range(count)
+    ]
+
+
+class FakeRedditClient:
+    """
+    Mimics the parts of `praw.Reddit` used by `RedditDatasource`, records the listing requests.
+    Like praw, the client is not meant to be shared, so it refuses to be used from another thread than its creator.
+    """
+
+    instances: list["FakeRedditClient"] = []
+    subreddits: dict[str, list[SimpleNamespace]] = {}
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.thread = threading.get_ident()
+        self.requests: list[tuple[str, str | None]] = []
+        self.auth = SimpleNamespace(limits={"remaining": None, "reset_timestamp": None})
+
+        self.instances.append(self)
+
+    def subreddit(self, name: str) -> SimpleNamespace:
+        return SimpleNamespace(new=lambda limit, params=None: self._new(name, limit, params))
+
+    def _new(self, name: str, limit: int, params: dict[str, str] | None) -> Iterator[SimpleNamespace]:
+        if threading.get_ident() != self.thread:
+            raise RuntimeError("praw client is used from another thread")
+
+        after = (params or {}).get("after")
+        self.requests.append((name, after))
+
+        submissions = self.subreddits[name]
+        start = next(index for index, submission in enumerate(submissions) if submission.fullname == after) + 1 if after else 0
+
+        return iter(submissions[start:start + limit])
+
+    @classmethod
+    def serving(cls, subreddits: dict[str, list[SimpleNamespace]]) -> type["FakeRedditClient"]:
+        """Client class serving `subreddits`, every client it creates is kept in `instances`."""
+
+        return type(cls.__name__, (cls,), {"instances": [], "subreddits": subreddits})
+
+
+class FakeDataSourceFactory(IDataSourceFactory):
+    def __init__(self, datasource: IDataSource) -> None:
+        super().__init__()
+        self.datasource = datasource
+
+    def get_data_source(self, source) -> IDataSource:
+        return self.datasource
+
+
+class FakePredictor(IPredictor):
+    def __init__(self) -> None:
+        self.predicted_posts = 0
+        self.closed = False
+
+    def preprocess_text(self, text: str) -> str:
+        return text.lower()
+
+    def predict_post(self, entity: ClassificationEntity) -> str:
+        self.predicted_posts += 1
+        return CATEGORY_MAPPING[str(len(entity.text) % 3)]
+
+    def predict_post_tokens(self, entity: ClassificationEntity) -> dict[str, list[str]]:
+        self.predicted_posts += 1
+
+        tokens: dict[str, list[str]] = {}
+        for word in entity.text.split():
+            tokens.setdefault(CATEGORY_MAPPING[str(len(word) % 3)], []).append(word)
+
+        return tokens
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakePredictorFactory(IPredictorFactory):
+    model_types = "GenericModel"
+
+    def __init__(self, predictor_class: type[FakePredictor] = FakePredictor) -> None:
+        self.predictor_class = predictor_class
+        self.predictors: list[FakePredictor] = []
+
+    def create_predictor(self, model_entity, generation_request) -> FakePredictor:
+        predictor = self.predictor_class()
+        self.predictors.append(predictor)
+        return predictor
+
+    def is_handling(self, model_type, model_code) -> bool:
+        return True
+
+
+def model_metadata(**overrides: Any) -> dict[str, Any]:
+    return {
+        "name": "model",
+        "code": "model-code",
+        "ownerUsername": "user",
+        "modelType": "Sklearn Model",
+        "categoryMapping": CATEGORY_MAPPING,
+        "preprocessingConfig": {},
+        "modelStatus": "Validated",
+        **overrides,
+    }
+
+
+STATISTICAL_TEMPLATE = {
+    "name": "template",
+    "visualizationDiagramTypes": [
+        VisualizationDiagramTypes.BY_CATEGORY__PIE,
+        VisualizationDiagramTypes.BY_CHANNEL__PIE,
+        VisualizationDiagramTypes.BY_HOUR__BAR,
+        VisualizationDiagramTypes.BY_CHANNEL_BY_CATEGORY_STACKED_BAR,
+        VisualizationDiagramTypes.BY_DATE_LINE,
+        VisualizationDiagramTypes.BY_DATE_BY_CATEGORY_MULTI_LINE,
+        VisualizationDiagramTypes.BY_DATE_BY_CHANNEL_MULTI_LINE,
+    ],
+}
+
+
+def build_strategy(
+    strategy_class: type,
+    datasource: IDataSource,
+    predictor_factory: IPredictorFactory | None = None,
+    **kwargs: Any,
+):
+    """Strategy with mocked services, `strategy.uploaded` collects the uploaded report data by file type."""
+
+    model_types_service = mock.Mock()
+    model_types_service.get_model_metadata.return_value = model_metadata()
+    model_types_service.get_visualization_templates.return_value = STATISTICAL_TEMPLATE
+
+    uploaded: dict[str, Any] = {}
+
+    def save_report_data(report_id: int, file_type: str, data, **_) -> None:
+        uploaded[file_type] = data.read()
+
+    statistics_service = mock.Mock()
+    statistics_service.save_report_data.side_effect = save_report_data
+
+    strategy = strategy_class(
+        events_producer=mock.Mock(),
+        model_types_service=model_types_service,
+        statistics_service=statistics_service,
+        predictor_factory=predictor_factory or FakePredictorFactory(),
+        datasource_factory=FakeDataSourceFactory(datasource),
+        **kwargs,
+    )
+    strategy.uploaded = uploaded
+
+    return strategy
+
+
+def make_generate_request(
+    channels: list[str],
+    start_date: str,
+    end_date: str,
+    report_type: str,
+    **kwargs: Any,
+) -> GenerateReportEntity:
+    return GenerateReportEntity(
+        name="report",
+        username="user",
+        report_id=1,
+        model_code="model-code",
+        template_id=1 if report_type == "Statistical" else None,
+        start_date=start_date,
+        end_date=end_date,
+        channel_list=channels,
+        model_type="Sklearn Model",
+        report_type=report_type,
+        **kwargs,
+    )
+
+
+def generate_report(strategy, channels: list[str], start_date: str, end_date: str, report_type: str, **kwargs: Any):
+    """Generates the report and returns the published report event."""
+
+    strategy.generate_report(make_generate_request(channels, start_date, end_date, report_type, **kwargs))
+
+    return strategy._events_producer.publish.call_args_list[-1][0][1][0]
@@ -0,0 +1,205 @@
+"""
+Stand-in for the report data endpoints of the statistics service, for the tests and local runs of `StatisticsService`.
+
+    python tests/statistics_stub.py --port 8001
+"""
+import re
+import json
+import uuid
+import email
+import hashlib
+import argparse
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+__all__ = ["StatisticsStubServer", "StoredReportData"]
+
+
+@dataclass
+class StoredReportData:
+    file_type: str
+    compression: str | None
+    data: bytes
+
+
+@dataclass
+class _Upload:
+    report_id: int
+    file_type: str
+    compression: str | None
+    parts: dict[int, bytes] = field(default_factory=dict)
+
+
+class StatisticsStubServer:
+    """
+    Keeps the uploaded report data in memory.
+    `failing_parts` maps part numbers to the number of times their upload is answered with 503 before it's accepted.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, failing_parts: dict[int, int] | None = None) -> None:
+        self.reports_data: dict[int, StoredReportData] = {}
+        self.part_requests_count = 0
+
+        self._uploads: dict[str, _Upload] = {}
+        self._failing_parts = dict(failing_parts or {})
+        self._lock = threading.Lock()
+
+        self._http_server = ThreadingHTTPServer((host, port), _StatisticsStubHandler)
+        self._http_server.stub = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._http_server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        self._http_server.serve_forever()
+
+    def start(self) -> "StatisticsStubServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+    def __enter__(self) -> "StatisticsStubServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start_upload(self, payload: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        upload_id = uuid.uuid4().hex
+
+        with self._lock:
+            self._uploads[upload_id] = _Upload(
+                report_id=int(payload["report_id"]),
+                file_type=payload["file_type"],
+                compression=payload.get("compression"),
+            )
+
+        return 201, {"upload_id": upload_id}
+
+    def upload_part(self, upload_id: str, part_number: int, part: bytes, checksum: str | None) -> tuple[int, dict[str, Any]]:
+        with self._lock:
+            self.part_requests_count += 1
+
+            if upload_id not in self._uploads:
+                return 404, {"detail": "Upload does not exist."}
+
+            if self._failing_parts.get(part_number, 0) > 0:
+                self._failing_parts[part_number] -= 1
+                return 503, {"detail": "Part upload failed, try again."}
+
+            if checksum != hashlib.sha256(part).hexdigest():
+                return 422, {"detail": "Part checksum mismatch."}
+
+            self._uploads[upload_id].parts[part_number] = part
+
+        return 200, {"part_number": part_number}
+
+    def complete_upload(self, upload_id: str, payload: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        with self._lock:
+            upload = self._uploads.get(upload_id)
+
+            if upload is None:
+                return 404, {"detail": "Upload does not exist."}
+
+            part_numbers = [part["part_number"] for part in payload["parts"]]
+            if part_numbers != sorted(upload.parts) or any(
+                hashlib.sha256(upload.parts[part["part_number"]]).hexdigest() != part["sha256"] for part in payload["parts"]
+            ):
+                return 422, {"detail": "Uploaded parts do not match."}
+
+            data = b"".join(upload.parts[part_number] for part_number in part_numbers)
+            if hashlib.sha256(data).hexdigest() != payload["sha256"]:
+                return 422, {"detail": "File checksum mismatch."}
+
+            self.reports_data[upload.report_id] = StoredReportData(upload.file_type, upload.compression, data)
+            del self._uploads[upload_id]
+
+        return 200, {"report_id": upload.report_id}
+
+    def save_multipart(self, content_type: str, body: bytes) -> tuple[int, dict[str, Any]]:
+        message = email.message_from_bytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+        fields = {
+            part.get_param("name", header="content-disposition"): part.get_payload(decode=True)
+            for part in message.get_payload()
+        }
+
+        compression = fields.get("compression")
+        report_id = int(fields["report_id"])
+
+        with self._lock:
+            self.reports_data[report_id] = StoredReportData(
+                file_type=fields["file_type"].decode(),
+                compression=compression.decode() if compression else None,
+                data=fields["report_data_file"],
+            )
+
+        return 200, {"report_id": report_id}
+
+
+class _StatisticsStubHandler(BaseHTTPRequestHandler):
+    _PART_URL = re.compile(r"^/reports-data/uploads/(?P<upload_id>\w+)/parts/(?P<part_number>\d+)$")
+    _COMPLETE_URL = re.compile(r"^/reports-data/uploads/(?P<upload_id>\w+)/complete$")
+
+    server: ThreadingHTTPServer
+
+    def do_POST(self) -> None:
+        stub: StatisticsStubServer = self.server.stub
+        body = self._read_body()
+
+        if self.path == "/reports-data/save":
+            self._respond(*stub.save_multipart(self.headers["Content-Type"], body))
+        elif self.path == "/reports-data/uploads":
+            self._respond(*stub.start_upload(json.loads(body)))
+        elif match := self._COMPLETE_URL.match(self.path):
+            self._respond(*stub.complete_upload(match["upload_id"], json.loads(body)))
+        else:
+            self._respond(404, {"detail": "Not found."})
+
+    def do_PUT(self) -> None:
+        stub: StatisticsStubServer = self.server.stub
+        body = self._read_body()
+
+        if match := self._PART_URL.match(self.path):
+            self._respond(*stub.upload_part(
+                match["upload_id"],
+                int(match["part_number"]),
+                body,
+                self.headers.get("X-Content-SHA256"),
+            ))
+        else:
+            self._respond(404, {"detail": "Not found."})
+
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _respond(self, status: int, payload: dict[str, Any]) -> None:
+        encoded_payload = json.dumps(payload).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded_payload)))
+        self.end_headers()
+        self.wfile.write(encoded_payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Statistics service stand-in for report data uploads.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    arguments = parser.parse_args()
+
+    stub_server = StatisticsStubServer(arguments.host, arguments.port)
+    print(f"Statistics stub is listening on {stub_server.url}")
+    stub_server.serve_forever()
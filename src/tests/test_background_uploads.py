@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from kin_txt_core.reports_building.constants import ReportProcessingResult
+from kin_txt_core.reports_building.domain.services.word_cloud.wc_strategy import WordCloudStrategy
+
+from fakes import FakeDataSource, build_strategy, generate_report, make_posts
+
+
+def build_word_cloud_strategy(upload_workers: int, upload):
+    datasource = FakeDataSource({"a": make_posts("a")})
+    strategy = build_strategy(WordCloudStrategy, datasource, upload_workers=upload_workers)
+    strategy._statistics_service.save_report_data.side_effect = upload
+
+    return strategy
+
+
+@pytest.mark.parametrize("upload_workers", [0, 2])
+def test_report_is_published_after_upload(upload_workers):
+    upload_threads = []
+    published_before_upload = []
+
+    def upload(*args, **kwargs):
+        upload_threads.append(threading.current_thread().name)
+        published_before_upload.append(strategy._events_producer.publish.call_count)
+
+    strategy = build_word_cloud_strategy(upload_workers, upload)
+    event = generate_report(strategy, ["a"], "10/03/2024", "20/03/2024", "WordCloud")
+
+    assert event.processing_status == ReportProcessingResult.READY
+    assert len(upload_threads) == 1
+    assert upload_threads[0].startswith("ReportDataUpload") == (upload_workers > 0)
+    # only the "processing started" event precedes the upload
+    assert published_before_upload == [1]
+    assert strategy._pending_uploads == []
+
+
+def test_failed_upload_postpones_report():
+    def upload(*args, **kwargs):
+        raise ConnectionError("Statistics service is unavailable")
+
+    strategy = build_word_cloud_strategy(1, upload)
+    event = generate_report(strategy, ["a"], "10/03/2024", "20/03/2024", "WordCloud")
+
+    assert event.processing_status == ReportProcessingResult.POSTPONED
+    assert "Statistics service is unavailable" in event.report_failed_reason
+    assert strategy._pending_uploads == []
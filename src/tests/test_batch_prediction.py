@@ -0,0 +1,63 @@
+import pytest
+
+from kin_txt_core.reports_building.domain.services.statistical_report.statistical_strategy import StatisticalStrategy
+from kin_txt_core.reports_building.domain.services.word_cloud.wc_strategy import WordCloudStrategy
+from kin_txt_core.reports_building.domain.services.word_cloud.wc_token_classification_strategy import (
+    BuildWordCloudTokenClassificationStrategy,
+)
+
+from fakes import FakeDataSource, FakePredictor, FakePredictorFactory, build_strategy, generate_report, make_posts
+
+
+class BatchRecordingPredictor(FakePredictor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_sizes: list[int] = []
+
+    def predict_posts(self, entities):
+        self.batch_sizes.append(len(entities))
+        return super().predict_posts(entities)
+
+    def predict_posts_tokens(self, entities):
+        self.batch_sizes.append(len(entities))
+        return super().predict_posts_tokens(entities)
+
+
+def test_batch_prediction_falls_back_to_single_posts_in_order():
+    predictor = FakePredictor()
+    posts = make_posts("a", count=50)
+
+    assert predictor.predict_posts(posts) == [predictor.predict_post(post) for post in posts]
+    assert predictor.predict_posts_tokens(posts) == [predictor.predict_post_tokens(post) for post in posts]
+    assert predictor.preprocess_and_predict_posts(posts) == [
+        (predictor.preprocess_text(post.text), predictor.predict_post(post)) for post in posts
+    ]
+
+
+@pytest.mark.parametrize(("strategy_class", "report_type"), [
+    (StatisticalStrategy, "Statistical"),
+    (WordCloudStrategy, "WordCloud"),
+    (BuildWordCloudTokenClassificationStrategy, "WordCloud"),
+])
+def test_strategies_predict_in_micro_batches(strategy_class, report_type):
+    channels = {"a": make_posts("a"), "b": make_posts("b")}
+
+    def build(batch_size: int):
+        predictor_factory = FakePredictorFactory(BatchRecordingPredictor)
+        strategy = build_strategy(
+            strategy_class,
+            FakeDataSource(channels),
+            predictor_factory=predictor_factory,
+            prediction_batch_size=batch_size,
+        )
+        event = generate_report(strategy, ["a", "b"], "10/03/2024", "20/03/2024", report_type)
+
+        return event.model_dump(exclude={"generation_date", "event_id", "timestamp"}), predictor_factory.predictors[0]
+
+    single_event, single_predictor = build(batch_size=1)
+    batched_event, batched_predictor = build(batch_size=64)
+
+    assert batched_event == single_event
+    assert single_event["processing_status"] == "Ready"
+    assert max(batched_predictor.batch_sizes) == 64
+    assert sum(batched_predictor.batch_sizes) == sum(single_predictor.batch_sizes) > 64
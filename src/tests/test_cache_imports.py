@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+
+# aioredis fails to import on Python 3.11+, which is imitated by blocking its import
+BLOCKED_AIOREDIS_IMPORT = "import sys; sys.modules['aioredis'] = None; "
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", BLOCKED_AIOREDIS_IMPORT + code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+
+def test_reports_building_does_not_need_aioredis():
+    result = run_python("import kin_txt_core.reports_building.containers")
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_async_redis_cache_is_imported_when_asked_for():
+    result = run_python("from kin_txt_core.cache import AsyncRedisCache")
+
+    assert result.returncode != 0
+    assert "aioredis" in result.stderr
@@ -0,0 +1,65 @@
+import pytest
+
+from kin_txt_core.reports_building.domain.entities import PreprocessingConfig
+from kin_txt_core.reports_building.domain.services.predicting.preprocessing import CompiledTextPreprocessor
+
+TEXT = "<b>Breaking</b>: Read https://example.com/news NOW, or www.example.org — it's   big! 🔥"
+
+
+def preprocess(text: str = TEXT, stop_words_path: str | None = None, lemmatizer=None, **config) -> str:
+    preprocessor = CompiledTextPreprocessor(PreprocessingConfig(**config), stop_words_path=stop_words_path, lemmatizer=lemmatizer)
+    return preprocessor.preprocess_text(text)
+
+
+def test_default_config():
+    assert preprocess() == "breaking read now or it s big 🔥"
+
+
+def test_removes_emoji():
+    assert preprocess(remove_emoji=True) == "breaking read now or it s big"
+
+
+def test_keeps_everything_when_disabled():
+    text = preprocess(
+        lowercase=False,
+        remove_links=False,
+        remove_punctuation=False,
+        remove_extra_spaces=False,
+        remove_html_tags=False,
+    )
+
+    assert text == TEXT
+
+
+def test_removes_stop_words(tmp_path):
+    stop_words_path = tmp_path / "stop_words"
+    stop_words_path.write_text("Or\nIT\ns")
+
+    assert preprocess(stop_words_path=str(stop_words_path), remove_stop_words=True) == "breaking read now big 🔥"
+
+
+@pytest.mark.parametrize(("truncating", "expected"), [("pre", "it s big 🔥"), ("post", "breaking read now or")])
+def test_truncates_tokens(truncating, expected):
+    assert preprocess(max_tokens=4, truncating=truncating) == expected
+
+
+def test_lemmatizes_tokens():
+    lemmatized = []
+
+    def lemmatizer(token: str) -> str:
+        lemmatized.append(token)
+        return token.rstrip("s")
+
+    preprocessor = CompiledTextPreprocessor(PreprocessingConfig(lemmatize_text=True), lemmatizer=lemmatizer)
+
+    assert preprocessor.preprocess_texts(["cats and dogs", "cats"]) == ["cat and dog", "cat"]
+    assert lemmatized == ["cats", "and", "dogs"]  # every token is lemmatized once
+
+
+def test_lemmatization_requires_lemmatizer():
+    with pytest.raises(ValueError):
+        CompiledTextPreprocessor(PreprocessingConfig(lemmatize_text=True))
+
+
+def test_empty_text():
+    assert preprocess("") == ""
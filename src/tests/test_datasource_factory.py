@@ -0,0 +1,102 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from kin_txt_core.datasources.common.entities import DatasourceLink
+from kin_txt_core.datasources.constants import DataSourceTypes
+from kin_txt_core.datasources.reddit import RedditDatasource
+from kin_txt_core.datasources.telegram import TelegramDatasource, TelegramSessionPool
+from kin_txt_core.reports_building.domain.services.datasources.factory import DataSourceFactory
+
+from fakes import FakeTelegramClient, make_telegram_history
+
+CHANNELS = ["a", "b", "c", "d"]
+
+
+@pytest.fixture
+def telegram_clients(monkeypatch) -> list[FakeTelegramClient]:
+    clients: list[FakeTelegramClient] = []
+    lock = threading.Lock()
+
+    def initialize_client(datasource: TelegramDatasource) -> FakeTelegramClient:
+        with lock:
+            if "fake_client" not in datasource.__dict__:
+                datasource.fake_client = FakeTelegramClient({channel: make_telegram_history(channel, count=40) for channel in CHANNELS})
+                clients.append(datasource.fake_client)
+
+        return datasource.fake_client
+
+    monkeypatch.setattr(TelegramDatasource, "_initialize_client", initialize_client)
+
+    return clients
+
+
+@pytest.fixture
+def pooling_factory(monkeypatch) -> DataSourceFactory:
+    monkeypatch.setenv("DATASOURCE_POOLING", "true")
+    return DataSourceFactory()
+
+
+def fetch_from_threads(factory: DataSourceFactory) -> list:
+    def fetch(channel: str) -> tuple:
+        datasource = factory.get_data_source(DataSourceTypes.TELEGRAM)
+        return datasource, len(datasource.fetch_data(DatasourceLink(source_link=channel)))
+
+    with ThreadPoolExecutor(max_workers=len(CHANNELS)) as executor:
+        return list(executor.map(fetch, CHANNELS))
+
+
+def test_pooled_telegram_sessions_are_shared_by_threads(pooling_factory, telegram_clients):
+    results = fetch_from_threads(pooling_factory)
+
+    (datasource,) = {id(datasource): datasource for datasource, _ in results}.values()
+    (client,) = telegram_clients
+
+    assert isinstance(datasource, TelegramSessionPool)
+    assert [messages for _, messages in results] == [40] * len(CHANNELS)
+    assert client.connects == 1
+
+    pooling_factory.close()
+
+    assert not client.is_connected()
+    assert len(client.threads) == 1
+
+
+def test_unhealthy_telegram_sessions_are_replaced(pooling_factory, telegram_clients):
+    datasource = pooling_factory.get_data_source(DataSourceTypes.TELEGRAM)
+    datasource.fetch_data(DatasourceLink(source_link="a"))
+
+    assert pooling_factory.get_data_source(DataSourceTypes.TELEGRAM) is datasource
+
+    telegram_clients[0].connected = False
+    replacement = pooling_factory.get_data_source(DataSourceTypes.TELEGRAM)
+    replacement.fetch_data(DatasourceLink(source_link="a"))
+
+    assert replacement is not datasource
+    assert len(telegram_clients) == 2
+    assert all(len(client.threads) == 1 for client in telegram_clients)
+
+    pooling_factory.close()
+
+    assert not any(client.is_connected() for client in telegram_clients)
+
+
+def test_keep_alive_pools_only_telegram(monkeypatch, telegram_clients):
+    monkeypatch.setenv("TELEGRAM_KEEP_ALIVE_SESSION", "true")
+    factory = DataSourceFactory()
+
+    assert factory.get_data_source(DataSourceTypes.TELEGRAM) is factory.get_data_source(DataSourceTypes.TELEGRAM)
+    assert isinstance(factory.get_data_source(DataSourceTypes.REDDIT), RedditDatasource)
+    assert factory.get_data_source(DataSourceTypes.REDDIT) is not factory.get_data_source(DataSourceTypes.REDDIT)
+
+    factory.close()
+
+
+def test_datasources_are_built_per_report_without_pooling(telegram_clients):
+    factory = DataSourceFactory()
+
+    datasource = factory.get_data_source(DataSourceTypes.TELEGRAM)
+
+    assert isinstance(datasource, TelegramDatasource)
+    assert factory.get_data_source(DataSourceTypes.TELEGRAM) is not datasource
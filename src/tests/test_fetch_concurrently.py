@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from kin_txt_core.datasources.common.entities import DatasourceLink
+from kin_txt_core.exceptions import InvalidChannelURLError
+from kin_txt_core.reports_building.domain.services.statistical_report.statistical_strategy import StatisticalStrategy
+from kin_txt_core.reports_building.domain.services.word_cloud.wc_strategy import WordCloudStrategy
+
+from fakes import FakeDataSource, build_strategy, generate_report, make_posts
+
+CHANNELS = ["a", "b", "missing", "empty", "c"]
+
+
+class SlowDataSource(FakeDataSource):
+    def __init__(self, channels) -> None:
+        super().__init__(channels)
+        self.running = 0
+        self.max_running = 0
+        self._running_lock = threading.Lock()
+
+    def fetch_data(self, source):
+        with self._running_lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+        try:
+            time.sleep(0.02)
+            return super().fetch_data(source)
+        finally:
+            with self._running_lock:
+                self.running -= 1
+
+
+def make_datasource(datasource_class=FakeDataSource):
+    return datasource_class({"a": make_posts("a"), "b": make_posts("b"), "empty": [], "c": make_posts("c")})
+
+
+def test_results_are_returned_in_sources_order_with_errors_in_place():
+    datasource = make_datasource()
+    sources = [DatasourceLink(source_link=channel) for channel in CHANNELS]
+
+    results = datasource.fetch_data_concurrently(sources, max_concurrency=3)
+
+    assert isinstance(results[2], InvalidChannelURLError)
+    assert results[3] == []
+    for index in (0, 1, 4):
+        assert results[index] == datasource.fetch_data(sources[index])
+
+
+def test_concurrency_is_bounded():
+    datasource = make_datasource(SlowDataSource)
+    sources = [DatasourceLink(source_link=channel) for channel in ["a", "b", "c", "empty"] * 3]
+
+    datasource.fetch_data_concurrently(sources, max_concurrency=2)
+
+    assert datasource.max_running == 2
+
+
+@pytest.mark.parametrize(("strategy_class", "report_type"), [
+    (StatisticalStrategy, "Statistical"),
+    (WordCloudStrategy, "WordCloud"),
+])
+def test_concurrent_gathering_builds_the_same_report(strategy_class, report_type):
+    def build(**kwargs):
+        strategy = build_strategy(strategy_class, make_datasource(), **kwargs)
+        event = generate_report(strategy, CHANNELS, "10/03/2024", "20/03/2024", report_type)
+        return event.model_dump(exclude={"generation_date", "event_id", "timestamp"}), strategy.uploaded
+
+    sequential_event, sequential_uploads = build()
+    concurrent_event, concurrent_uploads = build(gathering_concurrency=4)
+
+    assert concurrent_event == sequential_event
+    assert concurrent_uploads == sequential_uploads
+    assert sequential_event["processing_status"] == "Ready"
+    assert len(sequential_event["report_warnings"]) == 2
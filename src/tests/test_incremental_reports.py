@@ -0,0 +1,71 @@
+import time
+from datetime import datetime
+
+import pytest
+
+from kin_txt_core.cache.aggregates import FileSystemAggregatesStore
+from kin_txt_core.reports_building.domain.services.statistical_report.statistical_strategy import StatisticalStrategy
+from kin_txt_core.reports_building.domain.services.word_cloud.wc_strategy import WordCloudStrategy
+from kin_txt_core.reports_building.domain.services.word_cloud.wc_token_classification_strategy import (
+    BuildWordCloudTokenClassificationStrategy,
+)
+
+from fakes import FakeDataSource, build_strategy, generate_report, make_posts
+
+CHANNELS = ["a", "b", "missing"]
+
+
+@pytest.fixture
+def new_york_timezone(monkeypatch):
+    # posts are dated in UTC, the local midnights of the report windows are hours apart from the UTC ones
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.fixture
+def datasource() -> FakeDataSource:
+    return FakeDataSource({"a": make_posts("a", count=600), "b": make_posts("b", count=600)})
+
+
+def build_report(strategy, start_date: str, end_date: str) -> dict:
+    event = generate_report(strategy, CHANNELS, start_date, end_date, "WordCloud")
+    return event.model_dump(exclude={"generation_date", "event_id", "timestamp"})
+
+
+@pytest.mark.usefixtures("new_york_timezone")
+@pytest.mark.parametrize("strategy_class", [WordCloudStrategy, BuildWordCloudTokenClassificationStrategy])
+def test_overlapping_incremental_reports_match_full_rebuilds(tmp_path, datasource, strategy_class):
+    store = FileSystemAggregatesStore(str(tmp_path))
+
+    first_report = build_report(build_strategy(strategy_class, datasource, aggregates_store=store), "05/03/2024", "12/03/2024")
+    datasource.requests.clear()
+    second_report = build_report(build_strategy(strategy_class, datasource, aggregates_store=store), "10/03/2024", "20/03/2024")
+
+    # only the days missing in the store are fetched
+    assert {(source.source_link, source.earliest_date.day) for source in datasource.requests} == {
+        ("a", 13), ("b", 13), ("missing", 10),
+    }
+
+    assert first_report == build_report(build_strategy(strategy_class, datasource), "05/03/2024", "12/03/2024")
+    assert second_report == build_report(build_strategy(strategy_class, datasource), "10/03/2024", "20/03/2024")
+    assert second_report["processing_status"] == "Ready"
+
+
+
+def test_statistical_report_uploads_every_post(datasource):
+    # the per-post rows can't be restored from per-day aggregates, so statistical reports are not built incrementally
+    strategy = build_strategy(StatisticalStrategy, datasource)
+    generate_report(strategy, CHANNELS, "10/03/2024", "20/03/2024", "Statistical")
+
+    window_start, window_end = datetime(2024, 3, 10), datetime(2024, 3, 21)
+    expected_rows_count = sum(
+        window_start <= post.created_at.astimezone().replace(tzinfo=None) <= window_end
+        for channel in ("a", "b")
+        for post in datasource.channels[channel]
+    )
+
+    assert strategy._aggregates_store is None
+    assert len(strategy.uploaded["csv"].splitlines()) == expected_rows_count + 1
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from kin_txt_core.cache.messages import FileSystemMessagesStore
+from kin_txt_core.datasources.common.caching import CachingDataSource
+from kin_txt_core.datasources.common.entities import DatasourceLink
+from kin_txt_core.datasources.constants import DataSourceTypes
+
+from fakes import FakeDataSource, LATEST_POST_DATE, make_posts
+
+WINDOW = {
+    "earliest_date": datetime(2024, 3, 12, tzinfo=timezone.utc),
+    "offset_date": datetime(2024, 3, 18, tzinfo=timezone.utc),
+}
+
+
+class TruncatingDataSource(FakeDataSource):
+    """Returns at most `limit` posts of a request, the newest ones, as the datasources limits cut long fetches short."""
+
+    def __init__(self, channels, limit: int) -> None:
+        super().__init__(channels)
+        self.limit = limit
+
+    def fetch_data(self, source: DatasourceLink):
+        return super().fetch_data(source)[:self.limit]
+
+
+def expected_posts(channel: str, earliest_date: datetime, offset_date: datetime) -> list[tuple[datetime, str]]:
+    return [(post.created_at, post.text) for post in make_posts(channel) if earliest_date <= post.created_at <= offset_date]
+
+
+def as_tuples(posts) -> list[tuple[datetime, str]]:
+    return [(post.created_at, post.text) for post in posts]
+
+
+@pytest.fixture
+def store(tmp_path) -> FileSystemMessagesStore:
+    return FileSystemMessagesStore(str(tmp_path / "messages"))
+
+
+def test_store_reads_back_the_appended_posts(store):
+    posts = make_posts("a", count=100)
+
+    assert list(store.append("a", posts)) == posts
+    # an interrupted fetch repeated over the same posts
+    list(store.append("a", posts[:30]))
+
+    start, end = posts[80].created_at, posts[10].created_at
+
+    assert as_tuples(store.read("a", start, end)) == as_tuples(posts[10:81])
+    assert list(store.read("b", start, end)) == []
+
+
+def test_store_merges_coverage(store):
+    day = timedelta(days=1)
+
+    store.add_coverage("a", LATEST_POST_DATE - 5 * day, LATEST_POST_DATE - 3 * day)
+    store.add_coverage("a", LATEST_POST_DATE - 2 * day, LATEST_POST_DATE)
+    store.add_coverage("a", LATEST_POST_DATE - 4 * day, LATEST_POST_DATE - 2 * day)
+
+    assert store.get_coverage("a") == [(LATEST_POST_DATE - 5 * day, LATEST_POST_DATE)]
+    assert store.get_coverage("b") == []
+
+
+@pytest.mark.parametrize("concurrently", [False, True])
+def test_truncated_fetch_covers_only_the_returned_posts(store, concurrently):
+    datasource = TruncatingDataSource({"a": make_posts("a")}, limit=20)
+    caching_datasource = CachingDataSource(datasource, store, DataSourceTypes.TELEGRAM)
+    source = DatasourceLink(source_link="a", **WINDOW)
+
+    def fetch():
+        if concurrently:
+            return caching_datasource.fetch_data_concurrently([source], max_concurrency=2)[0]
+
+        return caching_datasource.fetch_data(source)
+
+    first_posts = fetch()
+    (covered_start, covered_end), = store.get_coverage(caching_datasource._build_key(source))
+
+    assert len(first_posts) == 20
+    assert (covered_start, covered_end) == (first_posts[-1].created_at, WINDOW["offset_date"])
+
+    # every next fetch requests only what is older than the covered span, until the window start is reached
+    for _ in range(20):
+        posts = fetch()
+
+        if store.get_coverage(caching_datasource._build_key(source))[0][0] == WINDOW["earliest_date"]:
+            break
+
+    assert all(request.offset_date < covered_end for request in datasource.requests[1:])
+    assert as_tuples(posts) == expected_posts("a", **WINDOW)
+    assert store.get_coverage(caching_datasource._build_key(source)) == [(WINDOW["earliest_date"], WINDOW["offset_date"])]
+
+    requests_count = len(datasource.requests)
+    fetch()
+
+    assert len(datasource.requests) == requests_count
+
+
+def test_future_window_is_covered_up_to_the_fetch(store):
+    datasource = FakeDataSource({"a": make_posts("a")})
+    caching_datasource = CachingDataSource(datasource, store, DataSourceTypes.TELEGRAM)
+    source = DatasourceLink(
+        source_link="a",
+        earliest_date=datetime(2024, 3, 19, tzinfo=timezone.utc),
+        offset_date=datetime.now(timezone.utc) + timedelta(days=1),
+    )
+
+    posts = caching_datasource.fetch_data(source)
+    (covered_start, covered_end), = store.get_coverage(caching_datasource._build_key(source))
+
+    assert as_tuples(posts) == expected_posts("a", source.earliest_date, source.offset_date)
+    assert covered_start == posts[-1].created_at
+    assert covered_end < source.offset_date
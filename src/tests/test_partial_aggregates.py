@@ -0,0 +1,98 @@
+import json
+from collections import Counter
+
+from kin_txt_core.reports_building.domain.services.statistical_report.aggregation import (
+    StatisticalAggregator,
+    StatisticalPartialAggregate,
+)
+from kin_txt_core.reports_building.domain.services.word_cloud.aggregation import WordCloudPartialAggregate
+
+from fakes import CATEGORY_MAPPING, FakePredictor, make_posts
+
+CHANNELS = ["a", "b", "c"]
+CATEGORIES = list(CATEGORY_MAPPING.values())
+
+
+def statistical_partial(categorized_posts) -> StatisticalPartialAggregate:
+    aggregator = StatisticalAggregator()
+    for post, category in categorized_posts:
+        aggregator.add(post.created_at, post.source_link, category)
+
+    return aggregator.to_partial()
+
+
+def word_cloud_partial(posts_tokens) -> WordCloudPartialAggregate:
+    partial_aggregate = WordCloudPartialAggregate.initialize(CHANNELS, CATEGORIES)
+    for channel, category, words in posts_tokens:
+        partial_aggregate.add(channel, category, words)
+
+    return partial_aggregate
+
+
+def make_categorized_posts():
+    predictor = FakePredictor()
+    return [(post, predictor.predict_post(post)) for channel in CHANNELS for post in make_posts(channel, count=100)]
+
+
+def make_posts_tokens():
+    predictor = FakePredictor()
+    return [
+        (post.source_link, category, words)
+        for channel in CHANNELS
+        for post in make_posts(channel, count=100)
+        for category, words in predictor.predict_post_tokens(post).items()
+    ]
+
+
+def test_merged_statistical_partials_match_the_whole():
+    categorized_posts = make_categorized_posts()
+    whole = statistical_partial(categorized_posts)
+
+    merged = statistical_partial(categorized_posts[:70])
+    merged.merge(statistical_partial(categorized_posts[70:220])).merge(statistical_partial(categorized_posts[220:]))
+
+    assert merged.cells == whole.cells
+    assert merged.dates == whole.dates
+    assert merged.total_messages == len(categorized_posts)
+
+
+def test_statistical_merge_is_associative():
+    categorized_posts = make_categorized_posts()
+    parts = [statistical_partial(categorized_posts[start:start + 100]) for start in range(0, 300, 100)]
+    other_parts = [statistical_partial(categorized_posts[start:start + 100]) for start in range(0, 300, 100)]
+
+    left = parts[0].merge(parts[1]).merge(parts[2])
+    right = other_parts[0].merge(other_parts[1].merge(other_parts[2]))
+
+    assert left.cells == right.cells
+    assert left.dates == right.dates
+
+
+def test_merged_word_cloud_partials_match_the_whole():
+    posts_tokens = make_posts_tokens()
+    whole = word_cloud_partial(posts_tokens)
+
+    # the partials are built with their own vocabularies, as in other processes
+    merged = word_cloud_partial(posts_tokens[:100])
+    merged.merge(word_cloud_partial(posts_tokens[100:400])).merge(word_cloud_partial(posts_tokens[400:]))
+
+    assert merged.to_dict() == whole.to_dict()
+    assert merged.total_words == sum(len(words) for _, _, words in posts_tokens)
+
+
+def test_word_cloud_merge_skips_empty_channels():
+    posts_tokens = make_posts_tokens()
+    merged = WordCloudPartialAggregate.initialize(["a"], CATEGORIES)
+    merged.merge(WordCloudPartialAggregate.initialize(["d"], CATEGORIES))
+    merged.merge(word_cloud_partial([post for post in posts_tokens if post[0] == "a"]))
+
+    assert set(merged.data_by_channel) == set(merged.data_by_channel_by_category) == {"a"}
+    assert merged.vocabulary.decode(merged.total_words_frequency) == Counter(
+        word for channel, _, words in posts_tokens if channel == "a" for word in words
+    )
+
+
+def test_word_cloud_json_matches_dict():
+    partial_aggregate = word_cloud_partial(make_posts_tokens())
+
+    assert json.loads("".join(partial_aggregate.iter_json())) == json.loads(json.dumps(partial_aggregate.to_dict()))
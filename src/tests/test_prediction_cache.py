@@ -0,0 +1,62 @@
+import pytest
+
+from kin_txt_core.cache.predictions import InMemoryPredictionCache, TieredPredictionCache
+from kin_txt_core.reports_building.domain.entities import ModelEntity
+from kin_txt_core.reports_building.domain.services.predicting.predictor import CachingPredictor
+
+from fakes import FakePredictor, make_posts, model_metadata
+
+
+def predict_with_cache(cache, posts, **model_overrides) -> tuple[list[str], FakePredictor]:
+    predictor = FakePredictor()
+    caching_predictor = CachingPredictor(predictor, cache, ModelEntity(**model_metadata(**model_overrides)))
+
+    return caching_predictor.predict_posts(posts), predictor
+
+
+def test_cached_predictions_are_not_predicted_again():
+    cache = InMemoryPredictionCache(max_size=1000)
+    posts = list({post.text: post for post in make_posts("a", count=100)}.values())
+
+    first_predictions, first_predictor = predict_with_cache(cache, posts[:60])
+    predictions, predictor = predict_with_cache(cache, posts)
+
+    assert predictions == FakePredictor().predict_posts(posts)
+    assert predictions[:60] == first_predictions
+    assert first_predictor.predicted_posts == 60
+    assert predictor.predicted_posts == len(posts) - 60
+
+
+@pytest.mark.parametrize("model_overrides", [
+    {"modelVersion": "2"},
+    {"categoryMapping": {"0": "sport", "1": "war", "2": "other"}},
+    {"preprocessingConfig": {"lowercase": False}},
+])
+def test_model_changes_invalidate_the_predictions(model_overrides):
+    cache = InMemoryPredictionCache(max_size=1000)
+    posts = make_posts("a", count=20)
+
+    predict_with_cache(cache, posts, modelVersion="1")
+    _, predictor = predict_with_cache(cache, posts, **{"modelVersion": "1", **model_overrides})
+
+    assert predictor.predicted_posts == len(posts)
+
+
+def test_tiered_cache_fills_the_faster_tiers():
+    fast_tier, slow_tier = InMemoryPredictionCache(max_size=10), InMemoryPredictionCache(max_size=10)
+    slow_tier.set_many({"a": "war", "b": "sport"})
+
+    cache = TieredPredictionCache([fast_tier, slow_tier])
+
+    assert cache.get_many(["a", "b", "c"]) == ["war", "sport", None]
+    assert fast_tier.get_many(["a", "b"]) == ["war", "sport"]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_in_memory_cache_evicts_the_least_recently_used():
+    cache = InMemoryPredictionCache(max_size=2)
+    cache.set_many({"a": "1", "b": "2"})
+    cache.get_many(["a"])
+    cache.set_many({"c": "3"})
+
+    assert cache.get_many(["a", "b", "c"]) == ["1", None, "3"]
@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from kin_txt_core.reports_building.domain.entities import ModelEntity
+from kin_txt_core.reports_building.domain.services.statistical_report.statistical_strategy import StatisticalStrategy
+
+from fakes import (
+    FakeDataSource,
+    FakePredictor,
+    FakePredictorFactory,
+    build_strategy,
+    generate_report,
+    make_generate_request,
+    make_posts,
+    model_metadata,
+)
+
+
+class LoadCountingPredictor(FakePredictor):
+    """Predicts the number of predictors created in the process, so the reloads of the model are visible."""
+
+    loaded = 0
+
+    def __init__(self) -> None:
+        super().__init__()
+        LoadCountingPredictor.loaded += 1
+
+    def predict_post(self, entity) -> str:
+        return f"{os.getpid()}:{LoadCountingPredictor.loaded}"
+
+
+@pytest.fixture
+def predictor_factory():
+    predictor_factory = FakePredictorFactory()
+    yield predictor_factory
+    predictor_factory.close()
+
+
+def create_predictor(predictor_factory):
+    return predictor_factory.create_process_pool_predictor(
+        ModelEntity(**model_metadata()),
+        make_generate_request(["a"], "10/03/2024", "20/03/2024", "Statistical"),
+        workers=2,
+    )
+
+
+def test_predictions_match_the_serial_predictor(predictor_factory):
+    posts = make_posts("a", count=101)
+    serial_predictor = FakePredictor()
+    predictor = create_predictor(predictor_factory)
+
+    assert predictor.predict_posts(posts) == serial_predictor.predict_posts(posts)
+    assert predictor.predict_posts_tokens(posts) == serial_predictor.predict_posts_tokens(posts)
+    assert predictor.preprocess_and_predict_posts(posts) == serial_predictor.preprocess_and_predict_posts(posts)
+
+
+def test_workers_and_their_models_are_reused_across_reports(predictor_factory):
+    predictor_factory.predictor_class = LoadCountingPredictor
+    posts = make_posts("a", count=40)
+
+    first_report_predictions = create_predictor(predictor_factory).predict_posts(posts)
+    pool = predictor_factory._prediction_pool
+    second_report_predictions = create_predictor(predictor_factory).predict_posts(posts)
+
+    assert predictor_factory._prediction_pool is pool
+    assert {prediction.split(":")[1] for prediction in first_report_predictions + second_report_predictions} == {"1"}
+
+
+def test_closing_the_predictor_keeps_the_pool(predictor_factory):
+    predictor = create_predictor(predictor_factory)
+    predictor.predict_post(make_posts("a", count=1)[0])
+    local_predictor = predictor_factory.predictors[-1]
+
+    predictor.close()
+
+    assert local_predictor.closed
+    assert create_predictor(predictor_factory).predict_posts(make_posts("a", count=10))
+
+    predictor_factory.close()
+    assert predictor_factory._prediction_pool is None
+
+
+def test_statistical_report_is_the_same_with_prediction_workers(predictor_factory):
+    datasource = FakeDataSource({"a": make_posts("a"), "b": make_posts("b")})
+
+    def build(**kwargs):
+        strategy = build_strategy(StatisticalStrategy, datasource, predictor_factory=predictor_factory, **kwargs)
+        event = generate_report(strategy, ["a", "b"], "10/03/2024", "20/03/2024", "Statistical")
+
+        return event.model_dump(exclude={"generation_date", "event_id", "timestamp"}), strategy.uploaded
+
+    serial_event, serial_uploads = build()
+    pooled_event, pooled_uploads = build(prediction_workers=2)
+
+    assert pooled_event == serial_event
+    assert pooled_uploads == serial_uploads
+    assert serial_event["processing_status"] == "Ready"
@@ -0,0 +1,48 @@
+import threading
+
+from kin_txt_core.datasources.common.entities import DatasourceLink
+from kin_txt_core.datasources.reddit import RedditDatasource
+from kin_txt_core.datasources.reddit.rate_limit import TokenBucketRateLimiter
+from kin_txt_core.datasources.settings import RedditSettings
+
+from fakes import FakeRedditClient, make_reddit_submissions
+
+SUBREDDITS = ["python", "rust", "golang", "haskell", "ocaml"]
+
+
+class CountingRateLimiter(TokenBucketRateLimiter):
+    def __init__(self) -> None:
+        super().__init__(rate=1_000, capacity=1_000)
+        self.acquired = 0
+        self._count_lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._count_lock:
+            self.acquired += 1
+
+        super().acquire()
+
+
+def test_subreddits_are_fetched_with_per_thread_clients(monkeypatch):
+    client_class = FakeRedditClient.serving({subreddit: make_reddit_submissions(subreddit) for subreddit in SUBREDDITS})
+    monkeypatch.setattr("kin_txt_core.datasources.reddit.client.praw.Reddit", client_class)
+
+    rate_limiter = CountingRateLimiter()
+    datasource = RedditDatasource(
+        client_id="client",
+        client_secret="secret",
+        user_agent="tests",
+        settings=RedditSettings(),
+        rate_limiter=rate_limiter,
+    )
+    sources = [DatasourceLink(source_link=subreddit) for subreddit in SUBREDDITS]
+
+    sequential_results = [datasource.fetch_data(source) for source in sources]
+    concurrent_results = datasource.fetch_data_concurrently([*sources, DatasourceLink(source_link="missing")], max_concurrency=3)
+
+    assert concurrent_results[:-1] == sequential_results
+    assert isinstance(concurrent_results[-1], Exception)
+    # one client for the calling thread, at most one for every worker
+    assert 2 <= len(client_class.instances) <= 4
+    assert len({client.thread for client in client_class.instances}) == len(client_class.instances)
+    assert rate_limiter.acquired == sum(len(client.requests) for client in client_class.instances) == 2 * 3 * len(SUBREDDITS) + 1
@@ -0,0 +1,114 @@
+from datetime import timedelta, timezone
+
+import pytest
+
+from kin_txt_core.datasources.common.entities import DatasourceLink
+from kin_txt_core.datasources.reddit import RedditDatasource
+from kin_txt_core.datasources.reddit.rate_limit import TokenBucketRateLimiter
+from kin_txt_core.datasources.settings import RedditSettings
+
+from fakes import FakeRedditClient, LATEST_POST_DATE, make_reddit_submissions
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr("kin_txt_core.datasources.reddit.rate_limit.time", clock)
+    return clock
+
+
+@pytest.fixture
+def reddit_client(monkeypatch) -> type[FakeRedditClient]:
+    client_class = FakeRedditClient.serving({"python": make_reddit_submissions("python", count=250)})
+    monkeypatch.setattr("kin_txt_core.datasources.reddit.client.praw.Reddit", client_class)
+    return client_class
+
+
+def make_datasource(**settings) -> RedditDatasource:
+    return RedditDatasource(client_id="client", client_secret="secret", user_agent="tests", settings=RedditSettings(**settings))
+
+
+def test_rate_limiter_allows_bursts_and_refills(clock):
+    rate_limiter = TokenBucketRateLimiter(rate=2, capacity=3)
+
+    for _ in range(5):
+        rate_limiter.acquire()
+
+    assert clock.sleeps == [0.5, 0.5]
+
+    clock.now += 10
+    for _ in range(3):
+        rate_limiter.acquire()
+
+    assert len(clock.sleeps) == 2
+
+
+def test_rate_limiter_waits_for_the_window_reset(clock):
+    rate_limiter = TokenBucketRateLimiter(rate=2, capacity=3)
+
+    rate_limiter.update_from_limits({"remaining": 0, "reset_timestamp": clock.now + 30})
+    rate_limiter.acquire()
+
+    assert sum(clock.sleeps) == pytest.approx(30.5)
+
+    # what is left of the window is spread until it resets
+    rate_limiter.update_from_limits({"remaining": 10, "reset_timestamp": clock.now + 100})
+    for _ in range(4):
+        rate_limiter.acquire()
+
+    assert clock.sleeps[-1] == pytest.approx(10)
+
+
+@pytest.mark.parametrize(("rate", "capacity"), [(0, 1), (1, 0.5)])
+def test_rate_limiter_is_validated(rate, capacity):
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=rate, capacity=capacity)
+
+
+def test_listing_is_paged_with_the_after_cursor(clock, reddit_client):
+    posts = make_datasource().fetch_data(DatasourceLink(source_link="python"))
+
+    (client,) = reddit_client.instances
+    submissions = reddit_client.subreddits["python"]
+
+    assert [post.text for post in posts] == [f"{submission.title}\n\n" for submission in submissions]
+    assert client.requests == [("python", None), ("python", submissions[99].fullname), ("python", submissions[199].fullname)]
+
+
+def test_paging_stops_at_the_window_start(clock, reddit_client):
+    source = DatasourceLink(
+        source_link="python",
+        offset_date=LATEST_POST_DATE - timedelta(minutes=53 * 20),
+        earliest_date=LATEST_POST_DATE - timedelta(minutes=53 * 130),
+    )
+
+    posts = make_datasource().fetch_data(source)
+
+    (client,) = reddit_client.instances
+
+    assert len(posts) == 111
+    assert all(source.earliest_date <= post.created_at.astimezone(timezone.utc) <= source.offset_date for post in posts)
+    assert len(client.requests) == 2
+
+
+def test_posts_limit_caps_the_requests(clock, reddit_client):
+    posts = make_datasource(REDDIT_MAX_POSTS_PER_REQUEST=100).fetch_data(DatasourceLink(source_link="python"))
+
+    assert len(posts) == 100
+    assert len(reddit_client.instances[0].requests) == 1
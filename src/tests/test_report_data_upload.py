@@ -0,0 +1,44 @@
+import gzip
+import json
+
+import pytest
+
+from kin_txt_core.reports_building.constants import ReportDataCompressions
+from kin_txt_core.reports_building.domain.services.word_cloud.wc_strategy import WordCloudStrategy
+from kin_txt_core.reports_building.infrastructure.services.statistics import _MultipartFileBody
+
+from fakes import FakeDataSource, build_strategy, generate_report, make_posts
+
+
+def build_word_cloud_data(**kwargs):
+    datasource = FakeDataSource({"a": make_posts("a"), "b": make_posts("b")})
+    strategy = build_strategy(WordCloudStrategy, datasource, **kwargs)
+    generate_report(strategy, ["a", "b"], "10/03/2024", "20/03/2024", "WordCloud")
+
+    return strategy.uploaded["json"], strategy._statistics_service.save_report_data.call_args.kwargs
+
+
+def test_word_cloud_data_is_gzipped():
+    plain_data, plain_upload = build_word_cloud_data()
+    compressed_data, compressed_upload = build_word_cloud_data(report_data_compression=ReportDataCompressions.GZIP)
+
+    assert plain_upload["compression"] is None
+    assert compressed_upload["compression"] == "gzip"
+    assert gzip.decompress(compressed_data).decode() == plain_data
+    assert json.loads(plain_data)["total_words"] > 0
+
+
+@pytest.mark.parametrize("file_size", [0, 10, 200_000])
+def test_multipart_body_streams_the_file(tmp_path, file_size):
+    path = tmp_path / "data.json.gz"
+    path.write_bytes(bytes(range(256)) * (file_size // 256) + b"x" * (file_size % 256))
+
+    with open(path, "rb") as file:
+        body = _MultipartFileBody(fields={"report_id": 1}, file_field="report_data_file", file_name="data.json.gz", file=file)
+        content = b"".join(body)
+
+    boundary = body.content_type.split("boundary=")[1]
+
+    assert len(content) == len(body)
+    assert content.startswith(f'--{boundary}\r\nContent-Disposition: form-data; name="report_id"\r\n\r\n1\r\n'.encode())
+    assert path.read_bytes() + f"\r\n--{boundary}--\r\n".encode() == content[-(file_size + len(boundary) + 8):]
@@ -0,0 +1,72 @@
+import csv
+import gzip
+import io
+
+import pytest
+
+from kin_txt_core.reports_building.constants import ReportDataFormats, ReportDataCompressions, ReportProcessingResult
+from kin_txt_core.reports_building.domain.services.statistical_report.statistical_strategy import StatisticalStrategy
+from kin_txt_core.reports_building.domain.services.statistical_report.writers import create_report_data_writer
+
+from fakes import FakeDataSource, build_strategy, generate_report, make_posts
+
+COLUMNS = ["date", "hour", "channel", "category"]
+ROWS = [["2024-03-10", 0, "a", "war"], ["2024-03-10", 23, "b", "спорт, \"other\""]]
+
+
+def build_statistical_data(report_data_format: ReportDataFormats):
+    datasource = FakeDataSource({"a": make_posts("a"), "b": make_posts("b")})
+    strategy = build_strategy(StatisticalStrategy, datasource, report_data_format=report_data_format)
+    event = generate_report(strategy, ["a", "b"], "10/03/2024", "20/03/2024", "Statistical")
+
+    assert event.processing_status == ReportProcessingResult.READY
+
+    return strategy.uploaded, strategy._statistics_service.save_report_data.call_args.kwargs
+
+
+def write_rows(tmp_path, report_data_format: ReportDataFormats):
+    path = tmp_path / "data"
+
+    with create_report_data_writer(report_data_format, str(path), COLUMNS) as writer:
+        for row in ROWS:
+            writer.write_row(row)
+
+    return path, writer
+
+
+def test_csv_writer(tmp_path):
+    path, writer = write_rows(tmp_path, ReportDataFormats.CSV)
+
+    assert (writer.file_type, writer.compression, writer.is_binary) == ("csv", None, False)
+    assert list(csv.reader(io.StringIO(path.read_text(), newline=""))) == [COLUMNS, *[[str(value) for value in row] for row in ROWS]]
+
+
+def test_gzip_csv_writer(tmp_path):
+    path, writer = write_rows(tmp_path, ReportDataFormats.CSV_GZIP)
+
+    assert (writer.file_type, writer.compression, writer.is_binary) == ("csv", ReportDataCompressions.GZIP, True)
+    assert gzip.decompress(path.read_bytes()).decode().count("\r") == 0
+    assert list(csv.reader(io.StringIO(gzip.decompress(path.read_bytes()).decode()))) == [
+        COLUMNS, *[[str(value) for value in row] for row in ROWS],
+    ]
+
+
+def test_parquet_writer(tmp_path):
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+    path, writer = write_rows(tmp_path, ReportDataFormats.PARQUET)
+    table = pyarrow_parquet.read_table(str(path))
+
+    assert (writer.file_type, writer.is_binary) == ("parquet", True)
+    assert [list(row.values()) for row in table.to_pylist()] == ROWS
+    assert str(table.schema.field("channel").type).startswith("dictionary")
+
+
+def test_statistical_report_data_formats_have_same_rows():
+    csv_data, csv_upload = build_statistical_data(ReportDataFormats.CSV)
+    gzip_data, gzip_upload = build_statistical_data(ReportDataFormats.CSV_GZIP)
+
+    assert csv_upload["compression"] is None
+    assert gzip_upload["compression"] == "gzip"
+    assert gzip.decompress(gzip_data["csv"]).decode() == csv_data["csv"]
+    assert len(csv_data["csv"].splitlines()) > 1
@@ -0,0 +1,49 @@
+from kin_txt_core.cache.predictions import InMemoryPredictionCache
+from kin_txt_core.reports_building.domain.entities import ModelEntity
+from kin_txt_core.reports_building.domain.services.predicting.predictor import CachingPredictor
+from kin_txt_core.reports_building.domain.services.word_cloud.wc_strategy import WordCloudStrategy
+
+from fakes import FakeDataSource, FakePredictor, FakePredictorFactory, build_strategy, generate_report, make_posts, model_metadata
+
+
+class PreprocessingCountingPredictor(FakePredictor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.preprocessed_texts: list[str] = []
+        self.received_preprocessed_texts: list[str] = []
+
+    def preprocess_text(self, text: str) -> str:
+        self.preprocessed_texts.append(text)
+        return super().preprocess_text(text)
+
+    def predict_preprocessed_posts(self, entities, preprocessed_texts):
+        self.received_preprocessed_texts.extend(preprocessed_texts)
+        return [self.predict_post(entity) for entity in entities]
+
+
+def test_word_cloud_preprocesses_every_post_once():
+    posts = {"a": make_posts("a", count=60), "b": make_posts("b", count=60)}  # all within the report window
+    predictor_factory = FakePredictorFactory(PreprocessingCountingPredictor)
+    strategy = build_strategy(WordCloudStrategy, FakeDataSource(posts), predictor_factory=predictor_factory)
+
+    generate_report(strategy, ["a", "b"], "10/03/2024", "20/03/2024", "WordCloud")
+
+    predictor = predictor_factory.predictors[0]
+    expected_texts = [post.text for channel_posts in posts.values() for post in channel_posts]
+
+    assert sorted(predictor.preprocessed_texts) == sorted(expected_texts)
+    assert predictor.received_preprocessed_texts == [text.lower() for text in predictor.preprocessed_texts]
+
+
+def test_caching_predictor_forwards_preprocessed_texts_of_cache_misses():
+    posts = list({post.text: post for post in make_posts("a", count=50)}.values())
+    cache = InMemoryPredictionCache(max_size=1000)
+    model_entity = ModelEntity(**model_metadata())
+
+    CachingPredictor(FakePredictor(), cache, model_entity).predict_posts(posts[:20])
+
+    predictor = PreprocessingCountingPredictor()
+    results = CachingPredictor(predictor, cache, model_entity).preprocess_and_predict_posts(posts)
+
+    assert results == FakePredictor().preprocess_and_predict_posts(posts)
+    assert predictor.received_preprocessed_texts == [post.text.lower() for post in posts[20:]]
@@ -0,0 +1,85 @@
+from kin_txt_core.constants import DEFAULT_DATE_FORMAT
+from kin_txt_core.reports_building.domain.services.statistical_report.aggregation import StatisticalAggregator
+from kin_txt_core.types.reports import RawContentTypes
+
+from fakes import CATEGORY_MAPPING, FakePredictor, make_posts
+
+CHANNELS = ["a", "b", "c"]
+CATEGORIES = list(CATEGORY_MAPPING.values())
+
+
+def make_categorized_posts():
+    predictor = FakePredictor()
+    posts = [post for channel in CHANNELS for post in make_posts(channel, count=150)]
+
+    return [(post, predictor.predict_post(post)) for post in posts]
+
+
+def initialize_report_data() -> dict[RawContentTypes, dict]:
+    return {
+        RawContentTypes.BY_CHANNEL: dict.fromkeys(CHANNELS, 0),
+        RawContentTypes.BY_CATEGORY: dict.fromkeys(CATEGORIES, 0),
+        RawContentTypes.BY_CHANNEL_BY_CATEGORY: {channel: dict.fromkeys(CATEGORIES, 0) for channel in CHANNELS},
+        RawContentTypes.BY_DAY_HOUR: {str(hour): 0 for hour in range(24)},
+        RawContentTypes.BY_DATE: {},
+        RawContentTypes.BY_DATE_BY_CATEGORY: {},
+        RawContentTypes.BY_DATE_BY_CHANNEL: {},
+    }
+
+
+def count_post_by_post(categorized_posts) -> dict[RawContentTypes, dict]:
+    """The report data filled post by post, as the strategy did before the aggregation was coded."""
+
+    data = initialize_report_data()
+
+    for post, category in categorized_posts:
+        date = post.created_at.strftime(DEFAULT_DATE_FORMAT)
+
+        data[RawContentTypes.BY_CHANNEL][post.source_link] += 1
+        data[RawContentTypes.BY_CATEGORY][category] += 1
+        data[RawContentTypes.BY_CHANNEL_BY_CATEGORY][post.source_link][category] += 1
+        data[RawContentTypes.BY_DAY_HOUR][str(post.created_at.hour)] += 1
+        data[RawContentTypes.BY_DATE][date] = data[RawContentTypes.BY_DATE].get(date, 0) + 1
+        data[RawContentTypes.BY_DATE_BY_CATEGORY].setdefault(date, dict.fromkeys(CATEGORIES, 0))[category] += 1
+        data[RawContentTypes.BY_DATE_BY_CHANNEL].setdefault(date, dict.fromkeys(CHANNELS, 0))[post.source_link] += 1
+
+    return data
+
+
+def test_coded_aggregation_matches_counting_post_by_post():
+    categorized_posts = make_categorized_posts()
+
+    aggregator = StatisticalAggregator()
+    for post, category in categorized_posts:
+        assert aggregator.add(post.created_at, post.source_link, category) == post.created_at.strftime(DEFAULT_DATE_FORMAT)
+
+    partial_aggregate = aggregator.to_partial()
+    report_data = partial_aggregate.build_report_data(
+        list(RawContentTypes),
+        initialize_report_data(),
+        channels=CHANNELS,
+        categories=CATEGORIES,
+    )
+    expected_report_data = count_post_by_post(categorized_posts)
+
+    assert aggregator.total_messages == partial_aggregate.total_messages == len(categorized_posts)
+    assert report_data == expected_report_data
+    for content_type in (RawContentTypes.BY_DATE, RawContentTypes.BY_DATE_BY_CATEGORY, RawContentTypes.BY_DATE_BY_CHANNEL):
+        assert list(report_data[content_type]) == list(expected_report_data[content_type])
+
+
+def test_only_requested_content_types_are_filled():
+    aggregator = StatisticalAggregator()
+    for post, category in make_categorized_posts():
+        aggregator.add(post.created_at, post.source_link, category)
+
+    report_data = aggregator.to_partial().build_report_data(
+        [RawContentTypes.BY_CHANNEL],
+        initialize_report_data(),
+        channels=CHANNELS,
+        categories=CATEGORIES,
+    )
+
+    assert sum(report_data[RawContentTypes.BY_CHANNEL].values()) == aggregator.total_messages
+    assert report_data[RawContentTypes.BY_DATE] == {}
+    assert not any(report_data[RawContentTypes.BY_CATEGORY].values())
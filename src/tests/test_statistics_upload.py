@@ -0,0 +1,79 @@
+import gzip
+import math
+
+import pytest
+
+from kin_txt_core.exceptions import ServiceProxyError
+from kin_txt_core.reports_building.infrastructure.services.statistics import StatisticsService
+
+from statistics_stub import StatisticsStubServer
+
+PART_SIZE = 1000
+CSV_DATA = "date,channel,category\r\n" + "".join(f"2024-03-{day % 28 + 1:02d},канал {day},війна\r\n" for day in range(500))
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(StatisticsService, "_PART_UPLOAD_BACKOFF_SECONDS", 0)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "report_data.csv"
+    path.write_bytes(CSV_DATA.encode())
+    return path
+
+
+def build_service(stub: StatisticsStubServer, upload_part_size: int | None = PART_SIZE) -> StatisticsService:
+    return StatisticsService(url=stub.url, kin_token="token", upload_part_size=upload_part_size)
+
+
+@pytest.mark.parametrize("mode", ["r", "rb"])
+def test_parts_are_sliced_by_bytes(csv_path, mode):
+    file_size = csv_path.stat().st_size
+
+    with StatisticsStubServer() as stub, open(csv_path, mode) as data:
+        build_service(stub).save_report_data(report_id=1, file_type="csv", data=data)
+
+    assert stub.reports_data[1].data == csv_path.read_bytes()
+    assert stub.reports_data[1].file_type == "csv"
+    assert stub.part_requests_count == math.ceil(file_size / PART_SIZE)
+
+
+def test_failed_parts_are_retried(csv_path):
+    with StatisticsStubServer(failing_parts={1: 1, 3: 3}) as stub, open(csv_path, "rb") as data:
+        build_service(stub).save_report_data(report_id=1, file_type="csv", data=data)
+
+    assert stub.reports_data[1].data == csv_path.read_bytes()
+    assert stub.part_requests_count == math.ceil(csv_path.stat().st_size / PART_SIZE) + 4
+
+
+def test_upload_fails_when_part_keeps_failing(csv_path):
+    with StatisticsStubServer(failing_parts={2: StatisticsService._PART_UPLOAD_ATTEMPTS}) as stub, open(csv_path, "rb") as data:
+        with pytest.raises(ServiceProxyError):
+            build_service(stub).save_report_data(report_id=1, file_type="csv", data=data)
+
+    assert stub.reports_data == {}
+    assert stub.part_requests_count == 1 + StatisticsService._PART_UPLOAD_ATTEMPTS
+
+
+def test_part_with_mismatched_checksum_is_sent_again():
+    with StatisticsStubServer() as stub:
+        _, upload = stub.start_upload({"report_id": 1, "file_type": "csv"})
+
+        with pytest.raises(ServiceProxyError):
+            build_service(stub)._upload_part(upload["upload_id"], 1, b"part", "not-a-checksum")
+
+    assert stub.part_requests_count == StatisticsService._PART_UPLOAD_ATTEMPTS
+
+
+@pytest.mark.parametrize("upload_part_size", [None, PART_SIZE])
+def test_compressed_data_is_uploaded(tmp_path, upload_part_size):
+    path = tmp_path / "report_data.csv.gz"
+    path.write_bytes(gzip.compress(CSV_DATA.encode()))
+
+    with StatisticsStubServer() as stub, open(path, "rb") as data:
+        build_service(stub, upload_part_size).save_report_data(report_id=1, file_type="csv", data=data, compression="gzip")
+
+    assert stub.reports_data[1].compression == "gzip"
+    assert gzip.decompress(stub.reports_data[1].data).decode() == CSV_DATA
@@ -0,0 +1,55 @@
+import pytest
+
+from kin_txt_core.datasources.common.entities import DatasourceLink
+from kin_txt_core.datasources.telegram import TelegramDatasource
+
+from fakes import FakeTelegramClient, make_telegram_datasource, make_telegram_history
+
+CHANNELS = ["a", "b", "c"]
+
+
+def make_client() -> FakeTelegramClient:
+    return FakeTelegramClient({channel: make_telegram_history(channel, count=50) for channel in CHANNELS})
+
+
+@pytest.mark.parametrize(("keep_alive", "connects"), [(False, len(CHANNELS) + 1), (True, 1)])
+def test_keep_alive_session_is_connected_once(keep_alive, connects):
+    client = make_client()
+    datasource = make_telegram_datasource(client, keep_alive=keep_alive)
+
+    posts = [datasource.fetch_data(DatasourceLink(source_link=channel)) for channel in CHANNELS]
+    datasource.get_channel("a")
+
+    assert [len(channel_posts) for channel_posts in posts] == [50] * len(CHANNELS)
+    assert client.connects == connects
+    assert client.is_connected() == keep_alive
+
+
+def test_keep_alive_session_is_disconnected_on_close():
+    client = make_client()
+    datasource = make_telegram_datasource(client, keep_alive=True)
+
+    datasource.fetch_data(DatasourceLink(source_link="a"))
+    datasource.close()
+
+    assert not client.is_connected()
+    assert datasource.is_healthy()
+
+
+def test_keep_alive_session_reconnects_after_connection_loss():
+    client = make_client()
+    datasource = make_telegram_datasource(client, keep_alive=True)
+
+    datasource.fetch_data(DatasourceLink(source_link="a"))
+    client.connected = False
+
+    assert len(datasource.fetch_data(DatasourceLink(source_link="b"))) == 50
+    assert client.connects == 2
+
+
+def test_session_with_closed_loop_is_unhealthy():
+    datasource = TelegramDatasource(session_str="", api_id=1, api_hash="hash", keep_alive=True)
+    datasource._initialize_client()
+    datasource._loop.close()
+
+    assert not datasource.is_healthy()
@@ -0,0 +1,79 @@
+import asyncio
+import math
+from datetime import datetime, timezone
+
+import pytest
+
+from kin_txt_core.datasources.telegram import TelegramDatasource
+
+from fakes import FakeTelegramClient, make_telegram_datasource, make_telegram_history
+
+
+@pytest.mark.parametrize("page_size", [0, 101])
+def test_page_size_is_validated(page_size):
+    with pytest.raises(ValueError):
+        TelegramDatasource(session_str="", api_id=1, api_hash="hash", page_size=page_size)
+
+
+@pytest.mark.parametrize("page_size", [100, 30])
+def test_history_is_requested_page_by_page(page_size):
+    client = FakeTelegramClient({"channel": make_telegram_history("channel", count=1000)})
+    datasource = make_telegram_datasource(client, page_size=page_size)
+
+    posts = datasource.fetch_posts_from_channel("channel")
+    metrics = datasource.fetch_metrics["channel"]
+
+    # the last page reaches the message with id 1, the one request left gets the channel
+    pages = math.ceil(1000 / page_size)
+
+    assert len(posts) == 1000
+    assert (metrics.pages, metrics.messages) == (pages, 1000)
+    assert client.requests == pages + 1
+    assert metrics.elapsed_seconds > 0
+
+
+class FilteringTelegramClient(FakeTelegramClient):
+    """Leaves out every seventh message of a page, as Telegram leaves out the messages hidden due to local laws."""
+
+    async def get_messages(self, *args, **kwargs):
+        return [message for message in await super().get_messages(*args, **kwargs) if message.id % 7]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_short_pages_do_not_end_the_history(reverse):
+    client = FilteringTelegramClient({"channel": make_telegram_history("channel", count=1000)})
+    datasource = make_telegram_datasource(client, page_size=100)
+
+    posts = datasource.fetch_posts_from_channel("channel", reverse=reverse)
+
+    assert len(posts) == 1000 - 1000 // 7
+
+
+def test_paging_stops_at_the_window_start():
+    history = make_telegram_history("channel", count=1000)
+    client = FakeTelegramClient({"channel": history})
+    datasource = make_telegram_datasource(client, page_size=50)
+
+    posts = datasource.fetch_posts_from_channel("channel", earliest_date=history[119].date)
+
+    assert len(posts) == 120
+    assert datasource.fetch_metrics["channel"].pages == 3
+
+
+def test_pages_are_requested_at_intervals(monkeypatch):
+    sleeps = []
+    sleep = asyncio.sleep
+
+    async def record_sleep(seconds, *args, **kwargs):
+        if seconds:
+            sleeps.append(seconds)
+
+        return await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", record_sleep)
+
+    client = FakeTelegramClient({"channel": make_telegram_history("channel", count=250)})
+    datasource = make_telegram_datasource(client, page_size=100, request_interval=0.25)
+
+    assert len(datasource.fetch_posts_from_channel("channel", offset_date=datetime(2024, 3, 21, tzinfo=timezone.utc))) == 250
+    assert sleeps == [0.25, 0.25]
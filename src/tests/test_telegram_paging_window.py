@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from fakes import FakeTelegramClient, make_telegram_datasource, make_telegram_history
+
+EARLIEST_DATE = datetime(2024, 3, 19, 12, tzinfo=timezone.utc)
+OFFSET_DATE = datetime(2024, 3, 20, tzinfo=timezone.utc)
+
+
+class MinIdTelegramClient(FakeTelegramClient):
+    """As Telegram does, a `min_id` below the date offset takes over the start of the reversed history."""
+
+    async def get_messages(self, channel_link, limit, offset_date=None, offset_id=0, reverse=False, min_id=0):
+        if reverse and min_id and not offset_id:
+            offset_date, offset_id = None, min_id
+
+        return await super().get_messages(
+            channel_link,
+            limit,
+            offset_date=offset_date,
+            offset_id=offset_id,
+            reverse=reverse,
+            min_id=min_id,
+        )
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_posts_outside_the_window_are_skipped(reverse):
+    history = make_telegram_history("channel")
+    client = MinIdTelegramClient({"channel": history})
+    datasource = make_telegram_datasource(client, page_size=20)
+
+    posts = datasource.fetch_posts_from_channel(
+        "channel",
+        offset_date=OFFSET_DATE,
+        earliest_date=EARLIEST_DATE,
+        reverse=reverse,
+        min_id=history[-1].id + 100,
+    )
+
+    expected = [
+        message.date for message in history
+        if EARLIEST_DATE <= message.date <= OFFSET_DATE and message.id > history[-1].id + 100
+    ]
+
+    assert sorted(post.created_at for post in posts) == sorted(expected)
+    assert expected
@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import pytest
+
+from kin_txt_core.datasources.common.entities import DatasourceLink
+from kin_txt_core.datasources.telegram import TelegramSessionPool
+from kin_txt_core.exceptions import TelegramIsUnavailable
+
+from fakes import FakeTelegramClient, make_telegram_datasource, make_telegram_history
+
+CHANNELS = ["a", "b", "c", "d", "e", "f"]
+
+
+def make_pool(*flooded: dict[str, int]) -> tuple[TelegramSessionPool, list[FakeTelegramClient]]:
+    clients = [
+        FakeTelegramClient({channel: make_telegram_history(channel, count=80) for channel in CHANNELS}, flooded=session_flooded)
+        for session_flooded in flooded
+    ]
+    pool = TelegramSessionPool(
+        [make_telegram_datasource(client, keep_alive=True, page_size=20) for client in clients],
+        flood_wait_budget=10,
+    )
+
+    return pool, clients
+
+
+def test_sessions_are_used_from_their_own_threads():
+    pool, clients = make_pool({}, {})
+    sources = [DatasourceLink(source_link=channel) for channel in CHANNELS]
+
+    concurrent_results = pool.fetch_data_concurrently(sources, max_concurrency=4)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(pool.fetch_data, sources))
+        streamed_results = list(executor.map(lambda source: list(pool.iter_data(source)), sources))
+        channels = list(executor.map(pool.get_channel, CHANNELS))
+
+    pool.close()
+
+    assert [len(result) for result in concurrent_results] == [80] * len(CHANNELS)
+    assert results == concurrent_results == streamed_results
+    assert [channel.title for channel in channels] == CHANNELS
+    assert all(len(client.threads) == 1 for client in clients)
+    assert all(client.requests for client in clients)
+    assert not any(client.is_connected() for client in clients)
+
+
+def test_abandoned_stream_is_closed_on_its_session_thread():
+    pool, (client,) = make_pool({})
+
+    assert len(list(islice(pool.iter_data(DatasourceLink(source_link="a")), 5))) == 5
+    assert len(pool.fetch_data(DatasourceLink(source_link="b"))) == 80
+    assert len(client.threads) == 1
+
+
+def test_flooded_sources_are_fetched_by_other_sessions():
+    pool, clients = make_pool({"b": 100, "d": 100}, {})
+    sources = [DatasourceLink(source_link=channel) for channel in CHANNELS]
+
+    results = pool.fetch_data_concurrently(sources, max_concurrency=6)
+
+    assert [len(result) for result in results] == [80] * len(CHANNELS)
+    assert all(len(client.threads) == 1 for client in clients)
+
+
+def test_sources_flooded_on_every_session_fail():
+    pool, clients = make_pool({"b": 100}, {"b": 200})
+    sources = [DatasourceLink(source_link=channel) for channel in CHANNELS]
+
+    results = pool.fetch_data_concurrently(sources, max_concurrency=2)
+
+    assert isinstance(results[1], TelegramIsUnavailable)
+    assert [len(result) for index, result in enumerate(results) if index != 1] == [80] * (len(CHANNELS) - 1)
+
+    with pytest.raises(TelegramIsUnavailable):
+        pool.fetch_data(DatasourceLink(source_link="a"))
@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from fakes import FakeTelegramClient, make_telegram_datasource, make_telegram_history
+
+WINDOW = {
+    "offset_date": datetime(2024, 3, 20, tzinfo=timezone.utc),
+    "earliest_date": datetime(2024, 3, 19, 12, tzinfo=timezone.utc),
+    "skip_messages_without_text": True,
+}
+
+
+def collect(client: FakeTelegramClient, **kwargs) -> list[tuple[datetime, str]]:
+    datasource = make_telegram_datasource(client)
+    posts = datasource.iter_posts_from_channel("channel", batch_size=7, **WINDOW, **kwargs)
+
+    return [(post.created_at, post.text) for post in posts]
+
+
+def test_stream_is_fetched_within_one_connection():
+    client = FakeTelegramClient({"channel": make_telegram_history("channel")})
+    datasource = make_telegram_datasource(client)
+
+    connected_while_consuming = [client.is_connected() for _ in datasource.iter_posts_from_channel("channel", batch_size=7, **WINDOW)]
+
+    assert len(connected_while_consuming) > 7 and all(connected_while_consuming)
+    assert client.connects == 1
+    assert not client.is_connected()
+
+
+def test_abandoned_stream_disconnects():
+    client = FakeTelegramClient({"channel": make_telegram_history("channel")})
+    datasource = make_telegram_datasource(client)
+
+    posts = datasource.iter_posts_from_channel("channel", batch_size=7, **WINDOW)
+    next(posts)
+    posts.close()
+
+    assert client.connects == 1
+    assert not client.is_connected()
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_stream_is_resumed_after_a_lost_connection(reverse):
+    expected = collect(FakeTelegramClient({"channel": make_telegram_history("channel")}), reverse=reverse)
+
+    # the first request gets the channel, the connection is lost on the third page of the history,
+    # after the first batches were yielded
+    client = FakeTelegramClient({"channel": make_telegram_history("channel")}, failing_requests={4})
+    datasource = make_telegram_datasource(client, page_size=5)
+    posts = datasource.iter_posts_from_channel("channel", batch_size=7, reverse=reverse, **WINDOW)
+
+    assert [(post.created_at, post.text) for post in posts] == expected
+    assert len(expected) > 10
+    assert client.connects == 2
+
+
+def test_connection_lost_repeatedly_is_raised():
+    client = FakeTelegramClient({"channel": make_telegram_history("channel")}, failing_requests={3, 4})
+    datasource = make_telegram_datasource(client, page_size=5)
+
+    with pytest.raises(ConnectionError):
+        list(datasource.iter_posts_from_channel("channel", batch_size=7, **WINDOW))
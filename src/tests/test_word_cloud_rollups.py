@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from kin_txt_core.reports_building.domain.services.word_cloud.aggregation import WordCloudPartialAggregate
+from kin_txt_core.reports_building.domain.services.word_cloud.wc_strategy import WordCloudStrategy
+from kin_txt_core.reports_building.domain.services.word_cloud.wc_token_classification_strategy import (
+    BuildWordCloudTokenClassificationStrategy,
+)
+
+from fakes import FakeDataSource, FakePredictor, build_strategy, generate_report, make_posts
+
+CHANNELS = ["a", "b"]
+CATEGORIES = ["war", "sport", "other"]
+
+
+def build_aggregate(rollups_from_cells: bool, channel_posts=None) -> WordCloudPartialAggregate:
+    predictor = FakePredictor()
+    partial_aggregate = WordCloudPartialAggregate.initialize(CHANNELS, CATEGORIES, rollups_from_cells=rollups_from_cells)
+
+    for channel in channel_posts or CHANNELS:
+        for post in make_posts(channel, count=100):
+            for category, words in predictor.predict_post_tokens(post).items():
+                partial_aggregate.add(channel, category, words)
+
+    return partial_aggregate
+
+
+def test_rollups_derived_from_cells_match_counting_every_level():
+    partial_aggregate = build_aggregate(rollups_from_cells=True)
+
+    assert not partial_aggregate.total_words_frequency
+
+    partial_aggregate.derive_rollups()
+
+    assert partial_aggregate.to_dict() == build_aggregate(rollups_from_cells=False).to_dict()
+
+
+def test_cells_only_aggregate_is_merged_into_a_full_one():
+    merged = build_aggregate(rollups_from_cells=False, channel_posts=["a"])
+    merged.merge(build_aggregate(rollups_from_cells=True, channel_posts=["b"]))
+
+    assert merged.to_dict() == build_aggregate(rollups_from_cells=False).to_dict()
+
+
+def words_frequencies_as_dicts(data):
+    # words with equal counts may be listed in another order, as the rollups are filled cell by cell
+    if isinstance(data, dict):
+        return {key: words_frequencies_as_dicts(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return dict(data)
+
+    return data
+
+
+@pytest.mark.parametrize("strategy_class", [WordCloudStrategy, BuildWordCloudTokenClassificationStrategy])
+def test_reports_are_the_same_with_rollups_from_cells(strategy_class):
+    datasource = FakeDataSource({"a": make_posts("a"), "b": make_posts("b")})
+
+    def build(**kwargs):
+        strategy = build_strategy(strategy_class, datasource, **kwargs)
+        event = generate_report(strategy, CHANNELS, "10/03/2024", "20/03/2024", "WordCloud")
+        report_data = event.model_dump(include={
+            "total_words", "total_words_frequency", "data_by_channel", "data_by_category", "data_by_channel_by_category",
+        })
+
+        return words_frequencies_as_dicts(report_data), json.loads(strategy.uploaded["json"])
+
+    assert build(rollups_from_cells=True) == build()
@@ -0,0 +1,104 @@
+import functools
+import random
+from collections import Counter
+
+import pytest
+
+from kin_txt_core.reports_building.domain.services.word_cloud.aggregation import WordCloudPartialAggregate
+from kin_txt_core.reports_building.domain.services.word_cloud.sketches import SpaceSavingCounter
+from kin_txt_core.reports_building.domain.services.word_cloud.vocabulary import Vocabulary
+
+CHANNELS = ["a", "b"]
+CATEGORIES = ["war", "sport"]
+
+
+def make_words(count: int, seed: int = 0) -> list[str]:
+    # a few frequent words in a long tail of rare ones
+    random_generator = random.Random(seed)
+    return [
+        f"frequent{random_generator.randint(0, 9)}" if random_generator.random() < 0.5 else f"rare{random_generator.randint(0, 10 ** 6)}"
+        for _ in range(count)
+    ]
+
+
+def test_space_saving_counter_keeps_frequent_words():
+    words = make_words(20_000)
+    exact_counts = Counter(words)
+    counter = SpaceSavingCounter(capacity=100)
+    counter.update(words)
+
+    assert len(counter) == 100
+    for word, exact_count in exact_counts.most_common(10):
+        assert exact_count <= counter[word] <= exact_count + counter.errors.get(word, 0)
+        assert counter.errors.get(word, 0) <= len(words) / counter.capacity
+
+
+def test_space_saving_counter_is_exact_below_capacity():
+    words = make_words(50)
+    counter = SpaceSavingCounter(capacity=100, counts=Counter(words))
+
+    assert counter == Counter(words)
+    assert not counter.errors
+
+
+def test_vocabulary_compaction_keeps_live_tokens_order():
+    vocabulary = Vocabulary(["a", "b", "c", "d"])
+
+    ids_mapping = vocabulary.compact([3, 1])
+
+    assert ids_mapping == {1: 0, 3: 1}
+    assert vocabulary.tokens == ["b", "d"]
+    assert vocabulary.intern("d") == 1
+    assert vocabulary.intern("e") == 2
+
+
+def build_aggregate(words: list[str], rollups_from_cells: bool = False) -> WordCloudPartialAggregate:
+    partial_aggregate = WordCloudPartialAggregate.initialize(
+        CHANNELS,
+        CATEGORIES,
+        counter_factory=functools.partial(SpaceSavingCounter, 20),
+        rollups_from_cells=rollups_from_cells,
+    )
+
+    for index in range(0, len(words), 10):
+        partial_aggregate.add(CHANNELS[index % 2], CATEGORIES[index // 10 % 2], words[index:index + 10])
+
+    return partial_aggregate
+
+
+def set_vocabulary_size_to_compact(monkeypatch, size: int) -> None:
+    monkeypatch.setattr(WordCloudPartialAggregate, "_MIN_VOCABULARY_SIZE_TO_COMPACT", size)
+    monkeypatch.setattr(WordCloudPartialAggregate, "_vocabulary_size_to_compact", size)
+
+
+@pytest.mark.parametrize("rollups_from_cells", [False, True])
+def test_vocabulary_of_bounded_counters_is_compacted(monkeypatch, rollups_from_cells):
+    words = make_words(20_000)
+
+    set_vocabulary_size_to_compact(monkeypatch, 10 ** 9)
+    exact_aggregate = build_aggregate(words, rollups_from_cells)
+
+    set_vocabulary_size_to_compact(monkeypatch, 100)
+    compacted_aggregate = build_aggregate(words, rollups_from_cells)
+
+    # 9 counters of 20 words, the vocabulary is compacted once it's twice as large as the counters
+    assert len(exact_aggregate.vocabulary) > 5000
+    assert len(compacted_aggregate.vocabulary) <= 2 * 9 * 20
+
+    if rollups_from_cells:
+        exact_aggregate.derive_rollups()
+        compacted_aggregate.derive_rollups()
+
+    assert compacted_aggregate.to_dict() == exact_aggregate.to_dict()
+
+
+def test_merged_aggregates_are_compacted(monkeypatch):
+    set_vocabulary_size_to_compact(monkeypatch, 100)
+
+    merged = build_aggregate(make_words(5000, seed=1))
+    for seed in range(2, 6):
+        merged.merge(build_aggregate(make_words(5000, seed=seed)))
+
+    assert len(merged.vocabulary) <= 2 * 9 * 20
+    assert sum(merged.total_words_frequency.values()) >= merged.total_words
+    assert all(word.startswith("frequent") for word, _ in merged.most_common(merged.total_words_frequency, 10))
@@ -0,0 +1,56 @@
+import pickle
+from collections import Counter
+
+from kin_txt_core.reports_building.domain.services.word_cloud.aggregation import WordCloudPartialAggregate
+from kin_txt_core.reports_building.domain.services.word_cloud.vocabulary import Vocabulary
+
+from fakes import FakePredictor, make_posts
+
+
+def test_tokens_are_interned_in_order_of_first_appearance():
+    vocabulary = Vocabulary()
+
+    assert vocabulary.count(["b", "a", "b", "c"]) == Counter({0: 2, 1: 1, 2: 1})
+    assert vocabulary.intern("a") == 1
+    assert vocabulary.token(2) == "c"
+    assert len(vocabulary) == 3
+    assert vocabulary.decode(Counter({0: 5, 2: 1})) == Counter({"b": 5, "c": 1})
+
+
+def test_ids_are_translated_between_vocabularies():
+    vocabulary, other_vocabulary = Vocabulary(["a", "b"]), Vocabulary(["c", "a"])
+
+    assert vocabulary.translate_ids(other_vocabulary) == [2, 0]
+    assert vocabulary.tokens == ["a", "b", "c"]
+
+
+def test_vocabulary_is_pickled_as_tokens():
+    vocabulary = pickle.loads(pickle.dumps(Vocabulary(["a", "b"])))
+
+    assert vocabulary.tokens == ["a", "b"]
+    assert vocabulary.intern("b") == 1
+    assert vocabulary.intern("c") == 2
+
+
+def test_interned_counters_match_counting_strings():
+    predictor = FakePredictor()
+    channels, categories = ["a", "b"], ["war", "sport", "other"]
+    partial_aggregate = WordCloudPartialAggregate.initialize(channels, categories)
+
+    by_channel = {channel: Counter() for channel in channels}
+    by_category = {category: Counter() for category in categories}
+
+    for channel in channels:
+        for post in make_posts(channel, count=100):
+            for category, words in predictor.predict_post_tokens(post).items():
+                partial_aggregate.add(channel, category, words)
+
+                by_channel[channel].update(words)
+                by_category[category].update(words)
+
+    data = partial_aggregate.to_dict()
+
+    assert data["data_by_channel"] == by_channel
+    assert data["data_by_category"] == by_category
+    assert data["total_words_frequency"] == sum(by_channel.values(), Counter())
+    assert data["total_words"] == sum(data["total_words_frequency"].values())